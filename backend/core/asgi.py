@@ -0,0 +1,13 @@
+# ============================================================================
+# File Path: backend/core/asgi.py
+# Description: ASGI configuration for Django application
+# ============================================================================
+
+import os
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+# Serve the busiest read endpoints with async views under ASGI servers,
+# e.g. ``gunicorn core.asgi:application -k uvicorn.workers.UvicornWorker``
+os.environ.setdefault('ASYNC_READ_VIEWS', 'true')
+application = get_asgi_application()
@@ -0,0 +1,314 @@
+# ============================================================================
+# File Path: backend/core/metrics.py
+# Description: Per-view request instrumentation exposed in Prometheus format
+# ============================================================================
+
+import collections
+import contextlib
+import contextvars
+import logging
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework.serializers import BaseSerializer
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+SIZE_BUCKETS = (
+    256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216,
+)
+
+# name: (type, help, buckets); histograms are labelled by view and method
+METRICS = {
+    'http_request_duration_seconds': (
+        'histogram', 'Time to produce the response.', DURATION_BUCKETS
+    ),
+    'http_request_db_queries': (
+        'histogram', 'SQL queries run per request.', QUERY_BUCKETS
+    ),
+    'http_request_db_seconds': (
+        'histogram', 'Time spent in SQL queries per request.',
+        DURATION_BUCKETS
+    ),
+    'http_request_serializer_seconds': (
+        'histogram', 'Time spent in serializer .data per request.',
+        DURATION_BUCKETS
+    ),
+    'http_response_size_bytes': (
+        'histogram', 'Size of non-streaming response bodies.', SIZE_BUCKETS
+    ),
+    'http_requests_total': (
+        'counter', 'Requests by view, method and status.', None
+    ),
+    'http_request_n_plus_one_total': (
+        'counter', 'Requests repeating one SQL statement too often.', None
+    ),
+}
+
+# Metrics of the request being handled
+_current = contextvars.ContextVar('request_metrics', default=None)
+
+
+class Histogram:
+    """Counts of observations per bucket, with their sum."""
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+
+class Registry:
+    """In-process metric values, keyed by metric name and labels.
+
+    Each worker process keeps its own values; Prometheus scrapes and sums
+    them per instance.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values = {name: {} for name in METRICS}
+
+    def record(self, labels, observations, counters):
+        """Observe histogram values and increment counters under one lock."""
+        with self.lock:
+            for name, value in observations.items():
+                series = self.values[name]
+                histogram = series.get(labels)
+                if histogram is None:
+                    histogram = series[labels] = Histogram(METRICS[name][2])
+                histogram.observe(value)
+            for name, (counter_labels, amount) in counters.items():
+                series = self.values[name]
+                series[counter_labels] = series.get(counter_labels, 0) + amount
+
+    def render(self):
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        with self.lock:
+            for name, (kind, help_text, buckets) in METRICS.items():
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} {kind}')
+                for labels, value in sorted(self.values[name].items()):
+                    if kind == 'counter':
+                        lines.append(_sample(name, labels, value))
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(buckets, value.counts):
+                        cumulative += count
+                        lines.append(_sample(
+                            f'{name}_bucket',
+                            labels + (('le', _number(bound)),), cumulative
+                        ))
+                    lines.append(_sample(
+                        f'{name}_bucket', labels + (('le', '+Inf'),),
+                        value.count
+                    ))
+                    lines.append(_sample(f'{name}_sum', labels, value.sum))
+                    lines.append(_sample(f'{name}_count', labels, value.count))
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+
+class RequestMetrics:
+    """Duration, query and serializer timings of one request.
+
+    Called by the execute wrapper of every database connection, so each
+    query costs two clock reads and a dict increment.
+    """
+
+    def __init__(self):
+        self.duration = 0.0
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializing = False
+        self.statements = collections.Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+            # Parameters are passed separately, so repeats of one query
+            # with different values share the statement text
+            self.statements[sql] += 1
+
+
+class MetricsMiddleware:
+    """Record per-view timings, query counts and response sizes.
+
+    Removed from the middleware chain at startup unless
+    ``METRICS_ENABLED`` is set, so it costs nothing when disabled. Should
+    come first in ``MIDDLEWARE`` so the duration covers the whole chain.
+    Async-capable, so under ASGI async views are not pushed into a thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        install_query_timing()
+        install_serializer_timing()
+        self.get_response = get_response
+        self.threshold = settings.METRICS_N_PLUS_ONE_THRESHOLD
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with self.measure() as metrics:
+            response = self.get_response(request)
+        return self.process(request, response, metrics)
+
+    async def __acall__(self, request):
+        with self.measure() as metrics:
+            response = await self.get_response(request)
+        return self.process(request, response, metrics)
+
+    @contextlib.contextmanager
+    def measure(self):
+        """Collect the metrics of the request handled inside the block."""
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            yield metrics
+        finally:
+            _current.reset(token)
+        metrics.duration = time.perf_counter() - start
+
+    def process(self, request, response, metrics):
+        match = request.resolver_match
+        view = match.view_name if match else 'unmatched'
+        labels = (('view', view), ('method', request.method))
+        observations = {
+            'http_request_duration_seconds': metrics.duration,
+            'http_request_db_queries': metrics.queries,
+            'http_request_db_seconds': metrics.db_time,
+            'http_request_serializer_seconds': metrics.serializer_time,
+        }
+        if not response.streaming:
+            observations['http_response_size_bytes'] = len(response.content)
+        counters = {
+            'http_requests_total': (
+                labels + (('status', str(response.status_code)),), 1
+            ),
+        }
+        repeated = [
+            (count, sql) for sql, count in metrics.statements.items()
+            if count > self.threshold
+        ]
+        if repeated:
+            counters['http_request_n_plus_one_total'] = (labels, 1)
+            for count, sql in sorted(repeated, reverse=True):
+                logger.warning(
+                    'Possible N+1 in %s (%s %s): %d runs of %s',
+                    match._func_path if match else view, request.method,
+                    request.path, count, sql[:500]
+                )
+        REGISTRY.record(labels, observations, counters)
+        return response
+
+
+def install_query_timing():
+    """Time the queries of every connection into the current request metrics.
+
+    Under ASGI, sync views and ORM calls run in a thread with connection
+    objects of their own, so a wrapper is added to each connection as it
+    connects and finds the request through the context variable, which
+    is copied into that thread.
+    """
+    connection_created.connect(
+        _add_query_timing, dispatch_uid='core.metrics.query_timing'
+    )
+    for connection in connections.all(initialized_only=True):
+        _add_query_timing(None, connection)
+
+
+def _add_query_timing(sender, connection, **kwargs):
+    if _time_query not in connection.execute_wrappers:
+        # First, so execute_wrapper() blocks still pop their own wrapper
+        connection.execute_wrappers.insert(0, _time_query)
+
+
+def _time_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    return metrics(execute, sql, params, many, context)
+
+
+def install_serializer_timing():
+    """Time ``.data`` of DRF serializers into the current request metrics.
+
+    ``Serializer.data`` and ``ListSerializer.data`` both build on
+    ``BaseSerializer.data``, so wrapping it covers every serializer once.
+    Nested serializers render through ``to_representation`` and are timed
+    as part of their parent.
+    """
+    original = BaseSerializer.data
+    if getattr(original.fget, 'timed', False):
+        return
+
+    def data(self):
+        metrics = _current.get()
+        if metrics is None or metrics.serializing:
+            return original.fget(self)
+        metrics.serializing = True
+        start = time.perf_counter()
+        try:
+            return original.fget(self)
+        finally:
+            metrics.serializer_time += time.perf_counter() - start
+            metrics.serializing = False
+
+    data.timed = True
+    BaseSerializer.data = property(data)
+
+
+def _sample(name, labels, value):
+    return f'{name}{_labels(labels)} {_number(value)}'
+
+
+def _labels(labels):
+    return '{' + ','.join(
+        f'{name}="{_escape(value)}"' for name, value in labels
+    ) + '}'
+
+
+def _escape(value):
+    return (
+        value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    )
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
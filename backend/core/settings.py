@@ -30,6 +30,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     # Third party apps
     'rest_framework',
     'corsheaders',
@@ -38,6 +39,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First so request durations cover the whole chain; removed at startup
+    # unless METRICS_ENABLED
+    'core.metrics.MetricsMiddleware',
+    'core.streaming.AsyncStreamingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -67,12 +72,25 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'core.wsgi.application'
+ASGI_APPLICATION = 'core.asgi.application'
+
+# Answer GETs of the equipment list, detail and history and the dashboard
+# with async views. Enabled by core/asgi.py; under WSGI every async view
+# would need an event loop of its own.
+ASYNC_READ_VIEWS = env.bool('ASYNC_READ_VIEWS', default=False)
 
 # Database
 DATABASES = {
     'default': env.db('DATABASE_URL', default='postgres://postgres:postgres@db:5432/calibrify')
 }
 
+# Cache
+# Use e.g. CACHE_URL=filecache:///var/tmp/django_cache to share the cache
+# between local worker processes
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -123,13 +141,71 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 10,
 }
 
+# Upper bound for the client-selectable ``page_size`` query parameter
+API_MAX_PAGE_SIZE = env.int('API_MAX_PAGE_SIZE', default=1000)
+
+# Maximum number of nested calibration/maintenance records returned by the
+# equipment detail endpoint
+EQUIPMENT_DETAIL_HISTORY_LIMIT = env.int(
+    'EQUIPMENT_DETAIL_HISTORY_LIMIT', default=50
+)
+
+# Maximum number of rows accepted by the bulk equipment upsert endpoint
+EQUIPMENT_BULK_MAX_ROWS = env.int('EQUIPMENT_BULK_MAX_ROWS', default=5000)
+
+# Rows fetched per database round trip by streaming exports
+EXPORT_CHUNK_SIZE = env.int('EXPORT_CHUNK_SIZE', default=2000)
+
+# Maximum number of ranked matches returned by search on SQLite
+SEARCH_MAX_RESULTS = env.int('SEARCH_MAX_RESULTS', default=1000)
+
+# Seconds a dashboard snapshot may be served between data changes
+DASHBOARD_CACHE_TIMEOUT = env.int('DASHBOARD_CACHE_TIMEOUT', default=300)
+
+# Seconds a calibration workload forecast is kept; entries are also keyed by
+# data version and date, so this only bounds memory use
+FORECAST_CACHE_TIMEOUT = env.int('FORECAST_CACHE_TIMEOUT', default=86400)
+
+# Seconds cached equipment detail bodies and list validators are kept; they
+# are invalidated by version on every change regardless
+EQUIPMENT_RESPONSE_CACHE_TIMEOUT = env.int(
+    'EQUIPMENT_RESPONSE_CACHE_TIMEOUT', default=3600
+)
+
+# Sync feed: changes per page by default and at most, and days tombstones of
+# deleted objects are kept; clients offline for longer must resync fully
+SYNC_PAGE_SIZE = env.int('SYNC_PAGE_SIZE', default=500)
+SYNC_MAX_PAGE_SIZE = env.int('SYNC_MAX_PAGE_SIZE', default=5000)
+SYNC_TOMBSTONE_RETENTION_DAYS = env.int(
+    'SYNC_TOMBSTONE_RETENTION_DAYS', default=90
+)
+
+# Request instrumentation: per-view histograms of duration, SQL queries, SQL
+# and serializer time and response size, served at /metrics. Requests that
+# run one SQL statement more than METRICS_N_PLUS_ONE_THRESHOLD times are
+# logged as possible N+1 queries.
+METRICS_ENABLED = env.bool('METRICS_ENABLED', default=False)
+METRICS_N_PLUS_ONE_THRESHOLD = env.int(
+    'METRICS_N_PLUS_ONE_THRESHOLD', default=10
+)
+
 # Email settings
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+EMAIL_BACKEND = env(
+    'EMAIL_BACKEND', default='django.core.mail.backends.smtp.EmailBackend'
+)
 EMAIL_HOST = env('EMAIL_HOST', default='smtp.gmail.com')
 EMAIL_PORT = env.int('EMAIL_PORT', default=587)
 EMAIL_HOST_USER = env('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = env('EMAIL_HOST_PASSWORD', default='')
 EMAIL_USE_TLS = env.bool('EMAIL_USE_TLS', default=True)
+DEFAULT_FROM_EMAIL = env('DEFAULT_FROM_EMAIL', default='webmaster@localhost')
+
+# Calibration sweeper: recipients of digests for equipment without an owner
+# email, and seconds between sweeps when run with ``--loop``
+CALIBRATION_DIGEST_RECIPIENTS = env.list(
+    'CALIBRATION_DIGEST_RECIPIENTS', default=[]
+)
+CALIBRATION_SWEEP_INTERVAL = env.int('CALIBRATION_SWEEP_INTERVAL', default=900)
 
 # AWS S3 settings
 AWS_ACCESS_KEY_ID = env('AWS_ACCESS_KEY_ID', default='')
@@ -138,4 +214,66 @@ AWS_STORAGE_BUCKET_NAME = env('AWS_S3_BUCKET', default='')
 AWS_S3_REGION_NAME = env('AWS_S3_REGION', default='us-east-1')
 AWS_S3_FILE_OVERWRITE = False
 AWS_DEFAULT_ACL = None
-DEFAULT_FILE_STORAGE = 'storages.backends.s3boto3.S3Boto3Storage' 
\ No newline at end of file
+# S3-compatible endpoint such as a local MinIO; AWS when unset
+AWS_S3_ENDPOINT_URL = env('AWS_S3_ENDPOINT_URL', default=None)
+DEFAULT_FILE_STORAGE = env(
+    'DEFAULT_FILE_STORAGE',
+    default='storages.backends.s3boto3.S3Boto3Storage'
+)
+
+# Certificate uploads: local staging directory for partial uploads, size
+# limits in bytes, and seconds before an abandoned upload is discarded
+CERTIFICATE_UPLOAD_ROOT = env(
+    'CERTIFICATE_UPLOAD_ROOT', default=str(BASE_DIR / 'uploads')
+)
+CERTIFICATE_MAX_SIZE = env.int('CERTIFICATE_MAX_SIZE', default=50 * 1024 * 1024)
+CERTIFICATE_CHUNK_MAX_SIZE = env.int(
+    'CERTIFICATE_CHUNK_MAX_SIZE', default=8 * 1024 * 1024
+)
+CERTIFICATE_UPLOAD_EXPIRY = env.int('CERTIFICATE_UPLOAD_EXPIRY', default=86400)
+
+# Certificate processing pipeline, run in order by process_certificates.
+# The virus scan runs CERTIFICATE_SCAN_COMMAND with the file path appended
+# (e.g. "clamdscan,--no-summary"); exit status 1 rejects the certificate.
+CERTIFICATE_PROCESSORS = [
+    'equipment.processing.scan_for_viruses',
+    'equipment.processing.extract_text',
+    'equipment.processing.make_thumbnail',
+]
+CERTIFICATE_SCAN_COMMAND = env.list('CERTIFICATE_SCAN_COMMAND', default=[])
+CERTIFICATE_PROCESSING_WORKERS = env.int(
+    'CERTIFICATE_PROCESSING_WORKERS', default=4
+)
+CERTIFICATE_PROCESSING_INTERVAL = env.int(
+    'CERTIFICATE_PROCESSING_INTERVAL', default=30
+)
+# Certificate downloads: '' streams the bytes from Python, 'x-accel' and
+# 'x-sendfile' hand the transfer to nginx (internal location at
+# CERTIFICATE_ACCEL_PREFIX mapped onto the storage) or Apache/lighttpd, and
+# 'redirect' sends clients to presigned URLs of S3-compatible storage.
+CERTIFICATE_DOWNLOAD_OFFLOAD = env('CERTIFICATE_DOWNLOAD_OFFLOAD', default='')
+CERTIFICATE_ACCEL_PREFIX = env(
+    'CERTIFICATE_ACCEL_PREFIX', default='/protected-media/'
+)
+# Let nginx mod_zip build certificate archives (requires 'x-accel')
+CERTIFICATE_ZIP_OFFLOAD = env.bool('CERTIFICATE_ZIP_OFFLOAD', default=False)
+CERTIFICATE_PRESIGNED_EXPIRY = env.int(
+    'CERTIFICATE_PRESIGNED_EXPIRY', default=300
+)
+CERTIFICATE_DOWNLOAD_MAX_AGE = env.int(
+    'CERTIFICATE_DOWNLOAD_MAX_AGE', default=3600
+)
+CERTIFICATE_ARCHIVE_MAX_FILES = env.int(
+    'CERTIFICATE_ARCHIVE_MAX_FILES', default=5000
+)
+# Seconds after which a certificate stuck in processing is retried
+CERTIFICATE_PROCESSING_TIMEOUT = env.int(
+    'CERTIFICATE_PROCESSING_TIMEOUT', default=600
+)
+
+# Directory of the versioned measurement_points/results schemas, named
+# "<category slug>.v<version>.json" with "default" as the fallback
+MEASUREMENT_SCHEMA_DIR = env(
+    'MEASUREMENT_SCHEMA_DIR',
+    default=str(BASE_DIR / 'equipment' / 'measurement_schemas')
+)
@@ -0,0 +1,65 @@
+# ============================================================================
+# File Path: backend/core/streaming.py
+# Description: Chunk-by-chunk streaming of synchronous bodies under ASGI
+# ============================================================================
+
+from asgiref.sync import (
+    iscoroutinefunction, markcoroutinefunction, sync_to_async,
+)
+from django.core.handlers.asgi import ASGIRequest
+
+
+def is_asgi(request):
+    """Return whether ``request`` (Django's or DRF's) came in over ASGI."""
+    return isinstance(getattr(request, '_request', request), ASGIRequest)
+
+
+class AsyncStreamingMiddleware:
+    """Send synchronous streaming bodies over ASGI one chunk at a time.
+
+    Django's ASGI handler reads a synchronous streaming body, such as a
+    file download or a zip archive, into memory before sending any of it.
+    Such bodies are replaced by an async iterator reading one chunk per
+    trip to the sync thread, which is free for other requests in between.
+    Requests over WSGI are left alone.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process(request, await self.get_response(request))
+
+    def process(self, request, response):
+        if (response.streaming and not response.is_async
+                and is_asgi(request)):
+            # The original iterator stays registered for closing
+            response.streaming_content = iterate_async(
+                response.streaming_content
+            )
+        return response
+
+
+async def iterate_async(iterable):
+    """Yield the items of a sync iterable, each read in the sync thread.
+
+    The sync thread is the one the database connections belong to, so
+    iterables reading querysets lazily keep working.
+    """
+    iterator = iter(iterable)
+    read = sync_to_async(next)
+    while True:
+        item = await read(iterator, None)
+        if item is None:
+            return
+        yield item
@@ -0,0 +1,62 @@
+# ============================================================================
+# File Path: backend/core/tests/test_metrics.py
+# Description: Tests of the request metrics middleware
+# ============================================================================
+
+import asyncio
+import threading
+
+import pytest
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from core.metrics import REGISTRY, MetricsMiddleware
+
+pytestmark = pytest.mark.django_db
+
+LABELS = (('view', 'unmatched'), ('method', 'GET'))
+
+
+@pytest.fixture(autouse=True)
+def metrics_enabled(settings):
+    settings.METRICS_ENABLED = True
+
+
+def observed_queries():
+    histogram = REGISTRY.values['http_request_db_queries'].get(LABELS)
+    return (histogram.count, histogram.sum) if histogram else (0, 0)
+
+
+def test_sync_chain():
+    def get_response(request):
+        User.objects.count()
+        return HttpResponse('ok')
+
+    middleware = MetricsMiddleware(get_response)
+    assert not iscoroutinefunction(middleware)
+    count, total = observed_queries()
+    middleware(RequestFactory().get('/'))
+    assert observed_queries() == (count + 1, total + 1)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_chain_stays_async():
+    async def get_response(request):
+        await sync_to_async(User.objects.count)()
+        return HttpResponse('ok')
+
+    middleware = MetricsMiddleware(get_response)
+    assert iscoroutinefunction(middleware)
+    count, total = observed_queries()
+    responses = []
+    # Like an ASGI server, run the chain on an event loop of its own thread
+    server = threading.Thread(target=lambda: responses.append(
+        asyncio.run(middleware(RequestFactory().get('/')))
+    ))
+    server.start()
+    server.join()
+    assert responses[0].content == b'ok'
+    # The query ran on a connection of the sync thread and is counted
+    assert observed_queries() == (count + 1, total + 1)
@@ -3,14 +3,17 @@
 # Description: Django URLs configuration
 # ============================================================================
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
-from django.conf import settings
-from django.conf.urls.static import static
-from core.views import root
+from core.views import metrics, root
 
 urlpatterns = [
     path('', root, name='root'),
     path('admin/', admin.site.urls),
+    # Certificates are served by authenticated download views, not MEDIA_URL
     path('api/', include('equipment.urls')),
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT) 
\ No newline at end of file
+]
+
+if settings.METRICS_ENABLED:
+    urlpatterns.append(path('metrics', metrics, name='metrics'))
@@ -3,10 +3,13 @@
 # Description: Core views for the Django application
 # ============================================================================
 
+from django.http import HttpResponse
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from core.metrics import REGISTRY
+
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
@@ -21,6 +24,15 @@ def root(request):
             'equipment': '/api/equipment/',
             'calibrations': '/api/calibrations/',
             'maintenance': '/api/maintenance/',
+            'dashboard': '/api/dashboard/',
+            'export': '/api/export/',
         },
         'documentation': 'API documentation is available at /api/docs/',
-    }) 
\ No newline at end of file
+    }) 
+
+
+def metrics(request):
+    """Request metrics of this process in the Prometheus text format."""
+    return HttpResponse(
+        REGISTRY.render(), content_type='text/plain; version=0.0.4'
+    )
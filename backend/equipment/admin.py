@@ -4,14 +4,19 @@
 # ============================================================================
 
 from django.contrib import admin
-from .models import Equipment, CalibrationRecord, MaintenanceRecord
+from .models import (
+    Equipment, CalibrationRecord, MaintenanceRecord, SweeperState,
+    Certificate, CertificateUpload,
+)
+from .search import IndexedSearchAdminMixin
 
 
 @admin.register(Equipment)
-class EquipmentAdmin(admin.ModelAdmin):
+class EquipmentAdmin(IndexedSearchAdminMixin, admin.ModelAdmin):
     list_display = (
         'name', 'model_number', 'serial_number', 'manufacturer',
-        'status', 'next_calibration_date'
+        'status', 'next_calibration_date', 'latest_calibration_date',
+        'calibration_count'
     )
     list_filter = ('status', 'manufacturer', 'category')
     search_fields = ('name', 'model_number', 'serial_number')
@@ -19,7 +24,7 @@ class EquipmentAdmin(admin.ModelAdmin):
 
 
 @admin.register(CalibrationRecord)
-class CalibrationRecordAdmin(admin.ModelAdmin):
+class CalibrationRecordAdmin(IndexedSearchAdminMixin, admin.ModelAdmin):
     list_display = (
         'equipment', 'calibration_date', 'calibrated_by',
         'certificate_number'
@@ -30,11 +35,37 @@ class CalibrationRecordAdmin(admin.ModelAdmin):
 
 
 @admin.register(MaintenanceRecord)
-class MaintenanceRecordAdmin(admin.ModelAdmin):
+class MaintenanceRecordAdmin(IndexedSearchAdminMixin, admin.ModelAdmin):
     list_display = (
         'equipment', 'maintenance_date', 'maintenance_type',
         'performed_by'
     )
     list_filter = ('maintenance_type', 'maintenance_date', 'performed_by')
     search_fields = ('equipment__name', 'description')
-    date_hierarchy = 'maintenance_date' 
\ No newline at end of file
+    date_hierarchy = 'maintenance_date' 
+
+@admin.register(SweeperState)
+class SweeperStateAdmin(admin.ModelAdmin):
+    list_display = ('swept_until', 'transitions', 'digests_sent', 'updated_at')
+    readonly_fields = ('updated_at',)
+
+
+@admin.register(Certificate)
+class CertificateAdmin(admin.ModelAdmin):
+    list_display = (
+        'original_name', 'content_type', 'size', 'processing_status',
+        'created_at'
+    )
+    list_filter = ('processing_status', 'content_type')
+    search_fields = ('sha256', 'original_name')
+    readonly_fields = (
+        'sha256', 'file', 'size', 'thumbnail', 'text', 'created_at',
+        'processing_started_at', 'processed_at'
+    )
+
+
+@admin.register(CertificateUpload)
+class CertificateUploadAdmin(admin.ModelAdmin):
+    list_display = ('filename', 'size', 'offset', 'status', 'updated_at')
+    list_filter = ('status',)
+    readonly_fields = ('offset', 'certificate', 'created_at', 'updated_at')
@@ -0,0 +1,311 @@
+# ============================================================================
+# File Path: backend/equipment/analytics.py
+# Description: Measurement drift trends and out-of-tolerance predictions
+# ============================================================================
+
+import hashlib
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import (
+    Count, DateField, F, FloatField, Max, Min, OuterRef, Q, Subquery, Sum,
+    Value,
+)
+from django.db.models.functions import Abs, Cast, Coalesce, NullIf
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .cache import get_data_version
+from .measurements import EPOCH
+from .models import CalibrationRecord, MeasurementPoint
+
+# Calibrations per equipment considered by default, and the upper bounds
+# of the client-selectable limits
+DEFAULT_LAST = 50
+MAX_LAST = 1000
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+# Predictions further out than this are not reported, in days
+PREDICTION_HORIZON = 3650
+
+
+class AnalyticsError(ValueError):
+    """Invalid analytics parameters."""
+
+
+def get_drift_report(params, now=None):
+    """Return the drift report for ``params``, cached per data version."""
+    options = parse_drift_params(params)
+    digest = hashlib.md5(repr(sorted(options.items())).encode()).hexdigest()
+    key = f'equipment:drift:{get_data_version()}:{digest}'
+    report = cache.get(key)
+    if report is None:
+        report = build_drift_report(options, now)
+        cache.set(key, report, timeout=settings.DASHBOARD_CACHE_TIMEOUT)
+    return report
+
+
+def parse_drift_params(params):
+    """Validate query parameters into drift report options.
+
+    ``point`` (a point name) or ``nominal`` (with an optional ``unit``)
+    selects the measurement; ``equipment``, ``category`` and ``location``
+    take comma-separated values; ``start`` and ``end`` bound calibration
+    dates; ``last`` keeps each equipment's most recent calibrations and
+    ``limit`` caps the equipment listed.
+    """
+    options = {
+        'point': params.get('point', '').strip(),
+        'unit': params.get('unit', '').strip(),
+        'nominal': _float(params, 'nominal'),
+        'equipment': tuple(_list(params, 'equipment', int)),
+        'category': tuple(_list(params, 'category', str)),
+        'location': tuple(_list(params, 'location', str)),
+        'start': _date(params, 'start'),
+        'end': _date(params, 'end'),
+        'last': _bounded(params, 'last', DEFAULT_LAST, MAX_LAST),
+        'limit': _bounded(params, 'limit', DEFAULT_LIMIT, MAX_LIMIT),
+    }
+    if not options['point'] and options['nominal'] is None:
+        raise AnalyticsError('Either "point" or "nominal" is required.')
+    return options
+
+
+def build_drift_report(options, now=None):
+    """Compute drift trends with a fixed number of aggregate queries.
+
+    The error of each measurement is regressed on its calibration date by
+    least squares, using only ``COUNT`` and ``SUM`` aggregates per group.
+    Days are counted from today, which keeps the sums well conditioned and
+    makes the intercept today's expected error. From the fitted line each
+    equipment gets the date its error is expected to leave tolerance and
+    the error expected at its next calibration.
+    """
+    today = timezone.localdate(now)
+    today_day = (today - EPOCH).days
+    points = _points(options)
+    x = Cast(F('calibration_day') - today_day, FloatField())
+    sums = {
+        'samples': Count('pk'),
+        'sx': Sum(x),
+        'sy': Sum('error'),
+        'sxx': Sum(x * x),
+        'sxy': Sum(x * F('error')),
+        'syy': Sum(F('error') * F('error')),
+        'max_abs_error': Max(Abs('error')),
+        'tolerance': Min('tolerance'),
+        'out_of_tolerance': Count('pk', filter=Q(passed=False)),
+        'first_date': Min('calibration_date'),
+        'last_date': Max('calibration_date'),
+    }
+    slope = (
+        (F('samples') * F('sxy') - F('sx') * F('sy')) /
+        NullIf(F('samples') * F('sxx') - F('sx') * F('sx'), 0.0)
+    )
+
+    equipment_rows = (
+        points
+        .values(
+            'equipment_id', 'equipment__name', 'equipment__serial_number',
+            'equipment__category', 'equipment__next_calibration_date',
+        )
+        .annotate(**sums)
+        .annotate(slope=slope)
+        .order_by(
+            Abs('slope').desc(nulls_last=True), 'equipment_id'
+        )[:options['limit']]
+    )
+    category_rows = (
+        points
+        .values('equipment__category')
+        .annotate(**sums, equipment_count=Count('equipment', distinct=True))
+        .order_by('equipment__category')
+    )
+
+    equipment = []
+    for row in equipment_rows:
+        trend = _trend(row)
+        next_calibration = row['equipment__next_calibration_date']
+        if next_calibration is not None and trend['slope'] is not None:
+            days = (timezone.localdate(next_calibration) - today).days
+            trend['predicted_error_at_next_calibration'] = _round(
+                trend['intercept'] + trend['slope'] * days
+            )
+        else:
+            trend['predicted_error_at_next_calibration'] = None
+        trend['predicted_out_of_tolerance_on'] = _crossing(trend, today)
+        del trend['intercept'], trend['slope']
+        equipment.append({
+            'equipment_id': row['equipment_id'],
+            'name': row['equipment__name'],
+            'serial_number': row['equipment__serial_number'],
+            'category': row['equipment__category'],
+            'next_calibration_date': next_calibration,
+            **trend,
+        })
+
+    categories = []
+    for row in category_rows:
+        trend = _trend(row)
+        del trend['intercept'], trend['slope']
+        categories.append({
+            'category': row['equipment__category'],
+            'equipment_count': row['equipment_count'],
+            **trend,
+        })
+
+    return {
+        'generated_at': timezone.now().isoformat(),
+        'point': options['point'] or None,
+        'nominal': options['nominal'],
+        'unit': options['unit'] or None,
+        'last': options['last'],
+        'samples': sum(row['samples'] for row in categories),
+        'equipment': equipment,
+        'categories': categories,
+    }
+
+
+def _points(options):
+    points = MeasurementPoint.objects.filter(error__isnull=False)
+    if options['point']:
+        points = points.filter(point=options['point'])
+    if options['nominal'] is not None:
+        nominal = options['nominal']
+        margin = 1e-9 * max(1.0, abs(nominal))
+        points = points.filter(
+            nominal__gte=nominal - margin, nominal__lte=nominal + margin
+        )
+    if options['unit']:
+        points = points.filter(unit=options['unit'])
+    if options['equipment']:
+        points = points.filter(equipment__in=options['equipment'])
+    if options['category']:
+        points = points.filter(equipment__category__in=options['category'])
+    if options['location']:
+        points = points.filter(equipment__location__in=options['location'])
+    if options['start']:
+        points = points.filter(calibration_date__gte=options['start'])
+    if options['end']:
+        points = points.filter(calibration_date__lte=options['end'])
+
+    # Date of each equipment's last-th most recent calibration; one seek on
+    # the (equipment, calibration_date, id) index
+    cutoff = (
+        CalibrationRecord.objects
+        .filter(equipment=OuterRef('equipment'))
+        .order_by('-calibration_date', '-id')
+        .values('calibration_date')[options['last'] - 1:options['last']]
+    )
+    return points.filter(
+        calibration_date__gte=Coalesce(Subquery(cutoff), Value(EPOCH, DateField()))
+    )
+
+
+def _trend(row):
+    """Return the statistics of one group from its aggregate sums."""
+    n = row['samples']
+    mean = row['sy'] / n
+    variance = max(row['syy'] / n - mean * mean, 0.0)
+    slope = row.get('slope')
+    if slope is None:
+        denominator = n * row['sxx'] - row['sx'] * row['sx']
+        if n > 1 and denominator:
+            slope = (n * row['sxy'] - row['sx'] * row['sy']) / denominator
+    intercept = (
+        (row['sy'] - slope * row['sx']) / n if slope is not None else None
+    )
+    return {
+        'samples': n,
+        'first_date': row['first_date'],
+        'last_date': row['last_date'],
+        'mean_error': _round(mean),
+        'stddev_error': _round(math.sqrt(variance)),
+        'max_abs_error': _round(row['max_abs_error']),
+        'drift_per_year': (
+            _round(slope * 365.25) if slope is not None else None
+        ),
+        'current_error_estimate': _round(intercept),
+        'tolerance': row['tolerance'],
+        'out_of_tolerance': row['out_of_tolerance'],
+        'intercept': intercept,
+        'slope': slope,
+    }
+
+
+def _crossing(trend, today):
+    """Return the date the fitted error leaves tolerance, if foreseeable.
+
+    Today is returned when the fitted error is already outside it.
+    """
+    slope, intercept = trend['slope'], trend['intercept']
+    tolerance = trend['tolerance']
+    if slope is None or tolerance is None:
+        return None
+    if abs(intercept) > tolerance:
+        return today
+    if not slope:
+        return None
+    limit = tolerance if slope > 0 else -tolerance
+    days = (limit - intercept) / slope
+    if days > PREDICTION_HORIZON:
+        return None
+    return today + timezone.timedelta(days=math.ceil(days))
+
+
+def _round(value):
+    return None if value is None else round(value, 6)
+
+
+def _float(params, name):
+    raw = params.get(name, '').strip()
+    if not raw:
+        return None
+    try:
+        value = float(raw)
+    except ValueError:
+        raise AnalyticsError(f'"{name}" must be a number.')
+    if not math.isfinite(value):
+        raise AnalyticsError(f'"{name}" must be a finite number.')
+    return value
+
+
+def _list(params, name, parse):
+    values = []
+    for part in params.get(name, '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            values.append(parse(part))
+        except ValueError:
+            raise AnalyticsError(f'Invalid value "{part}" for "{name}".')
+    return values
+
+
+def _date(params, name):
+    raw = params.get(name, '').strip()
+    if not raw:
+        return None
+    try:
+        value = parse_date(raw)
+    except ValueError:
+        value = None
+    if value is None:
+        raise AnalyticsError(f'"{name}" must be a date as YYYY-MM-DD.')
+    return value
+
+
+def _bounded(params, name, default, maximum):
+    raw = params.get(name, '').strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise AnalyticsError(f'"{name}" must be an integer.')
+    if not 1 <= value <= maximum:
+        raise AnalyticsError(f'"{name}" must be between 1 and {maximum}.')
+    return value
@@ -0,0 +1,38 @@
+# ============================================================================
+# File Path: backend/equipment/apps.py
+# Description: Django app configuration for equipment management
+# ============================================================================
+
+from django.apps import AppConfig
+from django.db import connections
+from django.db.models.signals import post_migrate
+
+
+class EquipmentConfig(AppConfig):
+    """App configuration for the equipment app."""
+
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'equipment'
+
+    def ready(self):
+        # Register signal handlers
+        from . import signals  # noqa: F401
+
+        post_migrate.connect(restore_search_indexes, sender=self)
+
+
+def restore_search_indexes(using, **kwargs):
+    """Recreate SQLite search triggers dropped by table rebuilds."""
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return
+    from .search import SEARCH_FIELDS, fts_table, install_search_indexes
+
+    # Only repair indexes installed by the search migration
+    tables = connection.introspection.table_names()
+    installed = [
+        model for model in SEARCH_FIELDS if fts_table(model) in tables
+    ]
+    if installed:
+        with connection.schema_editor() as schema_editor:
+            install_search_indexes(schema_editor, installed)
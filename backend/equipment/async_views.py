@@ -0,0 +1,160 @@
+# ============================================================================
+# File Path: backend/equipment/async_views.py
+# Description: Async views answering GETs of the busiest read endpoints
+# ============================================================================
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.http import Http404, HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.response import Response
+
+from .conditional import list_validators, not_modified, set_validators
+from .dashboard import get_dashboard_data
+from .models import Equipment, CalibrationRecord, MaintenanceRecord
+from .pagination import HistoryPagination
+from .serializers import (
+    CalibrationRecordSerializer, MaintenanceRecordSerializer,
+)
+
+
+def read_view(sync_view, handler):
+    """Return a view answering GETs with ``handler``, async.
+
+    ``sync_view`` is the DRF view of the same URL. Its view class is set up
+    for the request as DRF would: authentication, permissions, throttling
+    and content negotiation run in the sync thread, since they may query
+    the database. ``handler`` then gets the view instance and returns a
+    response. Other methods, and formats other than JSON such as the
+    browsable API, are passed to ``sync_view``, so writes are unchanged.
+    """
+    @csrf_exempt
+    async def view(request, *args, **kwargs):
+        if request.method == 'GET':
+            drf_view, response = await sync_to_async(_initialize)(
+                sync_view, request, args, kwargs
+            )
+            if response is not None:
+                return response
+            if drf_view is not None:
+                return await _respond(drf_view, handler)
+        return await sync_to_async(sync_view)(request, *args, **kwargs)
+
+    view.sync_view = sync_view
+    return view
+
+
+async def equipment_list(view):
+    """``EquipmentViewSet.list``, paginated with the async ORM."""
+    request = view.request
+    etag, last_modified = await sync_to_async(list_validators)(request)
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+
+    rows = view.get_row_serializer()
+    # Search may query its index while filtering
+    queryset = await sync_to_async(view.filter_queryset)(view.get_queryset())
+    queryset = rows.project(queryset)
+    page = await view.paginator.apaginate_queryset(queryset, request, view)
+    if page is not None:
+        response = view.get_paginated_response(rows.to_representation(page))
+    else:
+        response = Response(
+            rows.to_representation([row async for row in queryset])
+        )
+    return set_validators(response, etag, last_modified)
+
+
+async def equipment_detail(view):
+    """``EquipmentViewSet.retrieve``; the cached body is read in one trip."""
+    pk = view.kwargs[view.lookup_url_kwarg or view.lookup_field]
+    version, entry = await sync_to_async(view.get_detail_entry)(pk)
+    return view.detail_response(pk, version, entry)
+
+
+async def calibration_history(view):
+    """``EquipmentViewSet.calibrations`` with the async ORM."""
+    return await _history(
+        view, CalibrationRecord, CalibrationRecordSerializer
+    )
+
+
+async def maintenance_history(view):
+    """``EquipmentViewSet.maintenance`` with the async ORM."""
+    return await _history(
+        view, MaintenanceRecord, MaintenanceRecordSerializer
+    )
+
+
+async def dashboard(view):
+    """The dashboard, built or read from the cache in one trip."""
+    return Response(await sync_to_async(get_dashboard_data)())
+
+
+async def _history(view, model, serializer_class):
+    pk = view.kwargs['pk']
+    try:
+        found = await Equipment.objects.filter(pk=pk).aexists()
+    except (TypeError, ValueError, ValidationError):
+        found = False
+    if not found:
+        raise Http404
+    paginator = HistoryPagination()
+    records = await paginator.apaginate_queryset(
+        model.objects.filter(equipment=pk), view.request, view=view
+    )
+    serializer = serializer_class(
+        records, many=True, context=view.get_serializer_context()
+    )
+    return paginator.get_paginated_response(serializer.data)
+
+
+def _initialize(sync_view, request, args, kwargs):
+    """Return ``(view, response)`` for ``request`` to ``sync_view``.
+
+    ``response`` is set when the request was refused, and ``view`` is None
+    when the negotiated format is left to the sync view.
+    """
+    view = sync_view.cls(**sync_view.initkwargs)
+    actions = getattr(sync_view, 'actions', None)
+    if actions is not None:
+        # As ViewSetMixin.as_view() binds them
+        view.action_map = {'head': actions.get('get'), **actions}
+        for method, action in view.action_map.items():
+            setattr(view, method, getattr(view, action))
+    view.args, view.kwargs = args, kwargs
+    request = view.initialize_request(request, *args, **kwargs)
+    view.request = request
+    view.headers = view.default_response_headers
+    try:
+        view.initial(request)
+    except Exception as exc:
+        response = view.handle_exception(exc)
+        return view, _rendered(view.finalize_response(request, response))
+    if request.accepted_renderer.format != 'json':
+        return None, None
+    return view, None
+
+
+async def _respond(view, handler):
+    try:
+        response = await handler(view)
+    except Exception as exc:
+        response = view.handle_exception(exc)
+    return _rendered(view.finalize_response(view.request, response))
+
+
+def _rendered(response):
+    """Return ``response`` rendered, as a plain ``HttpResponse``.
+
+    Django renders responses with a ``render()`` method in the sync thread,
+    so DRF responses are rendered here to keep that thread free.
+    """
+    if not hasattr(response, 'render'):
+        return response
+    response.render()
+    rendered = HttpResponse(response.content, status=response.status_code)
+    for header, value in response.items():
+        rendered[header] = value
+    return rendered
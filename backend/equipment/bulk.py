@@ -0,0 +1,113 @@
+# ============================================================================
+# File Path: backend/equipment/bulk.py
+# Description: Bulk create/update of equipment keyed by serial number
+# ============================================================================
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import as_serializer_error
+
+from .cache import bump_data_version
+from .models import Equipment
+from .scheduling import rescheduled_date
+from .serializers import EquipmentBulkSerializer
+from .summaries import SUMMARY_FIELDS
+
+# Columns written on conflict; created_at, created_by and the record
+# summaries keep their values
+UPSERT_FIELDS = [
+    field.name for field in Equipment._meta.concrete_fields
+    if not field.primary_key and field.name not in (
+        'serial_number', 'created_at', 'created_by', *SUMMARY_FIELDS
+    )
+]
+
+
+def upsert_equipment(rows, user=None, batch_size=1000):
+    """Validate and upsert ``rows`` of equipment data by serial number.
+
+    Existing equipment is loaded with a single query, so rows that update it
+    only need the fields being changed. Valid rows are written with
+    ``bulk_create(update_conflicts=True)`` in one transaction while invalid
+    rows are reported and skipped. Returns a per-row report.
+    """
+    now = timezone.now()
+    serials = {
+        row.get('serial_number') for row in rows
+        if isinstance(row, dict) and isinstance(row.get('serial_number'), str)
+    }
+    existing = Equipment.objects.in_bulk(serials, field_name='serial_number')
+
+    # Field construction dominates serializer cost, so build each shape once
+    # and run every row through it instead of instantiating per row
+    create_serializer = EquipmentBulkSerializer()
+    update_serializer = EquipmentBulkSerializer(partial=True)
+
+    results = []
+    instances = []
+    seen = set()
+    for index, row in enumerate(rows):
+        result = {'index': index}
+        results.append(result)
+        if not isinstance(row, dict):
+            result.update(status='error', errors={
+                'non_field_errors': ['Expected an object.']
+            })
+            continue
+
+        serial_number = row.get('serial_number')
+        result['serial_number'] = serial_number
+        if serial_number in seen:
+            result.update(status='error', errors={
+                'serial_number': ['Duplicate serial number in request.']
+            })
+            continue
+
+        instance = existing.get(serial_number)
+        serializer = update_serializer if instance else create_serializer
+        try:
+            validated_data = serializer.run_validation(row)
+        except ValidationError as exc:
+            result.update(status='error', errors=as_serializer_error(exc))
+            continue
+
+        seen.add(serial_number)
+        # Rescheduled like a single create or update of the same data
+        next_date = rescheduled_date(validated_data, instance)
+        if instance is None:
+            instance = Equipment(created_by=user)
+            result['status'] = 'created'
+        else:
+            result['status'] = 'updated'
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if next_date is not None:
+            instance.next_calibration_date = next_date
+        instance.refresh_derived_fields(now)
+        instances.append((instance, result))
+
+    if instances:
+        with transaction.atomic():
+            Equipment.objects.bulk_create(
+                [instance for instance, _ in instances],
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=['serial_number'],
+                update_fields=UPSERT_FIELDS,
+            )
+        bump_data_version(equipment_ids=[
+            instance.pk for instance, result in instances
+            if result['status'] == 'updated'
+        ])
+
+    for instance, result in instances:
+        result['id'] = instance.pk
+
+    return {
+        'created': sum(r['status'] == 'created' for r in results),
+        'updated': sum(r['status'] == 'updated' for r in results),
+        'failed': sum(r['status'] == 'error' for r in results),
+        'results': results,
+    }
+
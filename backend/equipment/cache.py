@@ -0,0 +1,74 @@
+# ============================================================================
+# File Path: backend/equipment/cache.py
+# Description: Cache versioning helpers for equipment data
+# ============================================================================
+
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+DATA_VERSION_KEY = 'equipment:data-version'
+# Bumped by writes whose affected equipment is unknown or too many to track
+GENERATION_KEY = 'equipment:generation'
+EQUIPMENT_VERSION_KEY = 'equipment:{pk}:version'
+
+# Above this many equipment a write bumps the generation instead
+MAX_TRACKED_EQUIPMENT = 100
+
+
+def get_data_version():
+    """Return the current version of the equipment data set.
+
+    Cached results embed this version in their keys, so bumping it
+    invalidates every derived entry at once without having to track them.
+    """
+    return _get_versions(DATA_VERSION_KEY)[0]
+
+
+def get_equipment_version(pk):
+    """Return the version of one equipment and its records.
+
+    Combines the per-equipment counter with the generation, so bulk writes
+    that cannot name the rows they touched still invalidate the entry.
+    """
+    generation, version = _get_versions(
+        GENERATION_KEY, EQUIPMENT_VERSION_KEY.format(pk=pk)
+    )
+    return f'{generation}.{version}'
+
+
+def bump_data_version(equipment_ids=None):
+    """Invalidate cached results derived from equipment data.
+
+    ``equipment_ids`` limits per-equipment invalidation to those rows; by
+    default every equipment entry is invalidated. The bump happens once the
+    current transaction commits, so readers cannot cache data from before
+    the write under the new version.
+    """
+    keys = [DATA_VERSION_KEY]
+    if equipment_ids is None or len(equipment_ids) > MAX_TRACKED_EQUIPMENT:
+        keys.append(GENERATION_KEY)
+    else:
+        keys.extend(
+            EQUIPMENT_VERSION_KEY.format(pk=pk) for pk in equipment_ids
+        )
+    transaction.on_commit(lambda: _bump_versions(keys))
+
+
+def _get_versions(*keys):
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Seed from the clock so an evicted counter never reuses old keys
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def _bump_versions(keys):
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), timeout=None)
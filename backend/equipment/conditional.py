@@ -0,0 +1,199 @@
+# ============================================================================
+# File Path: backend/equipment/conditional.py
+# Description: Conditional GET validators and cached equipment detail bodies
+# ============================================================================
+
+import functools
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from .cache import get_data_version, get_equipment_version
+from .models import CALIBRATION_WARNING_DAYS, MANUAL_STATUSES, Equipment
+
+STATUS_EPOCH_KEY = 'equipment:status-epoch:{version}'
+DETAIL_KEY = 'equipment:detail:{pk}:{version}:{origin}'
+
+
+def next_status_change(now):
+    """Return when the next effective status changes without a write.
+
+    Effective statuses are derived from the clock, so a list can change
+    while the data version stays the same. The next change is the earliest
+    ``next_calibration_date`` (or due warning) still ahead of ``now``. Each
+    stored status is searched separately so every lookup is a single seek
+    on the ``(status, next_calibration_date)`` index. Returns None if no
+    status will change.
+    """
+    warning = timezone.timedelta(days=CALIBRATION_WARNING_DAYS)
+    statuses = [
+        value for value, _ in Equipment._meta.get_field('status').choices
+        if value not in MANUAL_STATUSES
+    ]
+    changes = []
+    for status in statuses:
+        dates = (
+            Equipment.objects
+            .filter(status=status)
+            .order_by('next_calibration_date')
+            .values_list('next_calibration_date', flat=True)
+        )
+        overdue_at = dates.filter(next_calibration_date__gte=now).first()
+        if overdue_at is None:
+            continue
+        changes.append(overdue_at)
+        due_at = dates.filter(next_calibration_date__gte=now + warning).first()
+        if due_at is not None:
+            changes.append(due_at - warning)
+    return min(changes, default=None)
+
+
+def get_status_epoch(now=None):
+    """Return ``(version, epoch, generated_at)`` for the equipment lists.
+
+    ``epoch`` identifies the period until the next status change and
+    ``generated_at`` is when this version and epoch were first observed,
+    which is never earlier than the last change to the data.
+    """
+    now = now or timezone.now()
+    version = get_data_version()
+    key = STATUS_EPOCH_KEY.format(version=version)
+    entry = cache.get(key)
+    if entry is None or (entry['until'] and now > entry['until']):
+        until = next_status_change(now)
+        entry = {'until': until, 'generated_at': int(time.time())}
+        cache.set(
+            key, entry, timeout=settings.EQUIPMENT_RESPONSE_CACHE_TIMEOUT
+        )
+    epoch = entry['until'].isoformat() if entry['until'] else 'final'
+    return version, epoch, entry['generated_at']
+
+
+def make_etag(*parts):
+    """Return a strong ETag derived from ``parts``."""
+    digest = hashlib.md5(':'.join(map(str, parts)).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def not_modified(request, etag, last_modified):
+    """Return a 304 response if the client's copy is current, else None."""
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    # Let clients keep the body but revalidate it on every use
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def list_validators(request):
+    """Return the ``(etag, last_modified)`` validators of a list request.
+
+    They depend on the data version, the status epoch, the full query
+    string and the negotiated format.
+    """
+    version, epoch, generated_at = get_status_epoch()
+    etag = make_etag(
+        version, epoch, request.get_full_path(),
+        request.accepted_renderer.format
+    )
+    return etag, generated_at
+
+
+def conditional_list(view_method):
+    """Answer conditional GETs of a list action without querying it."""
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        etag, last_modified = list_validators(request)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+        response = view_method(self, request, *args, **kwargs)
+        if response.status_code == 200:
+            set_validators(response, etag, last_modified)
+        return response
+    return wrapper
+
+
+class CachedDetailMixin:
+    """Serve equipment detail bodies from the cache, with conditional GET.
+
+    Bodies are keyed by the equipment's own version, which is bumped when
+    the equipment or any of its calibration or maintenance records change,
+    and by the scheme and host of the request, which absolute URLs in the
+    body are built from. Each entry also expires when the equipment's
+    effective status next changes with the clock.
+    """
+
+    def retrieve(self, request, *args, **kwargs):
+        pk = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        return self.detail_response(pk, *self.get_detail_entry(pk))
+
+    def get_detail_entry(self, pk):
+        """Return the equipment's version and its cached detail entry."""
+        version = get_equipment_version(pk)
+        key = DETAIL_KEY.format(
+            pk=pk, version=version, origin=_origin(self.request)
+        )
+        now = timezone.now()
+
+        entry = cache.get(key)
+        if entry is None or (entry['stale_at'] and now > entry['stale_at']):
+            instance = self.get_object()
+            entry = {
+                'data': self.get_serializer(instance).data,
+                'status': instance.get_effective_status(),
+                'stale_at': _status_stale_at(instance, now),
+                'generated_at': int(time.time()),
+            }
+            cache.set(
+                key, entry, timeout=settings.EQUIPMENT_RESPONSE_CACHE_TIMEOUT
+            )
+        return version, entry
+
+    def detail_response(self, pk, version, entry):
+        """Return the detail response, or 304 for a current client copy."""
+        request = self.request
+        etag = make_etag(
+            pk, version, entry['status'], request.accepted_renderer.format,
+            _origin(request)
+        )
+        response = not_modified(request, etag, entry['generated_at'])
+        if response is not None:
+            return response
+        return set_validators(
+            Response(entry['data']), etag, entry['generated_at']
+        )
+
+
+def _origin(request):
+    """Return a cache key part for the request's scheme and host."""
+    origin = request.build_absolute_uri('/')
+    return hashlib.md5(origin.encode()).hexdigest()
+
+
+def _status_stale_at(instance, now):
+    """Return when the instance's effective status next changes, or None."""
+    due = instance.next_calibration_date
+    if (instance.status in MANUAL_STATUSES or due is None or
+            instance.last_calibration_date is None):
+        return None
+    warning_at = due - timezone.timedelta(days=CALIBRATION_WARNING_DAYS)
+    if now <= warning_at:
+        return warning_at
+    if now <= due:
+        return due
+    return None
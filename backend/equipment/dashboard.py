@@ -0,0 +1,127 @@
+# ============================================================================
+# File Path: backend/equipment/dashboard.py
+# Description: Aggregated dashboard statistics for equipment
+# ============================================================================
+
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from .cache import get_data_version
+from .models import Equipment, MaintenanceRecord, effective_status_q
+
+# Upcoming calibration windows reported by the dashboard, in days
+DUE_WINDOWS = (7, 30, 90)
+
+
+def get_dashboard_data():
+    """Return dashboard statistics, served from the cache when possible.
+
+    Entries are keyed by the equipment data version, so any write to
+    equipment or its records invalidates them. The timeout bounds how stale
+    the time-dependent due buckets can get between writes.
+    """
+    key = f'equipment:dashboard:{get_data_version()}'
+    data = cache.get(key)
+    if data is None:
+        data = build_dashboard_data()
+        cache.set(key, data, timeout=settings.DASHBOARD_CACHE_TIMEOUT)
+    return data
+
+
+def build_dashboard_data(now=None):
+    """Compute dashboard statistics with a fixed number of queries."""
+    now = now or timezone.now()
+    statuses = [
+        value for value, _ in Equipment._meta.get_field('status').choices
+    ]
+    # Equipment with a calibration still ahead: the due windows use the
+    # conditions of the effective status, like the overdue count
+    upcoming = (
+        effective_status_q('calibration_due', now) |
+        effective_status_q('active', now)
+    )
+
+    # Effective status totals and due buckets in a single aggregate
+    aggregates = {
+        'total': Count('pk'),
+        # Maintenance cost totals from the stored per-equipment summaries
+        'cost_total': Sum('maintenance_cost_total'),
+        'cost_year_to_date': Sum(
+            'maintenance_cost_ytd',
+            filter=Q(maintenance_cost_year=timezone.localdate(now).year)
+        ),
+        'overdue': Count(
+            'pk', filter=effective_status_q('calibration_overdue', now)
+        ),
+    }
+    for status in statuses:
+        aggregates[f'status_{status}'] = Count(
+            'pk', filter=effective_status_q(status, now)
+        )
+    for days in DUE_WINDOWS:
+        aggregates[f'due_{days}'] = Count(
+            'pk',
+            filter=upcoming & Q(
+                next_calibration_date__lt=now + timezone.timedelta(days=days)
+            )
+        )
+    equipment = Equipment.objects.order_by().aggregate(**aggregates)
+
+    # Category and location totals from one grouped query
+    by_category = Counter()
+    by_location = Counter()
+    groups = (
+        Equipment.objects
+        .order_by()
+        .values('category', 'location')
+        .annotate(count=Count('pk'))
+    )
+    for group in groups:
+        by_category[group['category']] += group['count']
+        by_location[group['location']] += group['count']
+
+    # Maintenance cost per type, which the summaries do not break down
+    maintenance_types = [
+        value for value, _
+        in MaintenanceRecord._meta.get_field('maintenance_type').choices
+    ]
+    cost_aggregates = {}
+    for maintenance_type in maintenance_types:
+        cost_aggregates[maintenance_type] = Sum(
+            'cost', filter=Q(maintenance_type=maintenance_type)
+        )
+    costs = MaintenanceRecord.objects.order_by().aggregate(**cost_aggregates)
+
+    return {
+        'generated_at': now.isoformat(),
+        'total_equipment': equipment['total'],
+        'by_status': {
+            status: equipment[f'status_{status}'] for status in statuses
+        },
+        'by_category': dict(sorted(by_category.items())),
+        'by_location': dict(sorted(by_location.items())),
+        'calibration': {
+            'overdue': equipment['overdue'],
+            **{
+                f'due_in_{days}_days': equipment[f'due_{days}']
+                for days in DUE_WINDOWS
+            },
+        },
+        'maintenance_costs': {
+            'total': _format_cost(equipment['cost_total']),
+            'year_to_date': _format_cost(equipment['cost_year_to_date']),
+            'by_type': {
+                maintenance_type: _format_cost(costs[maintenance_type])
+                for maintenance_type in maintenance_types
+            },
+        },
+    }
+
+
+def _format_cost(value):
+    # Match the string representation used by MaintenanceRecordSerializer
+    return f'{value or 0:.2f}'
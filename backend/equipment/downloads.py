@@ -0,0 +1,352 @@
+# ============================================================================
+# File Path: backend/equipment/downloads.py
+# Description: Certificate downloads with ranges, offload and zip archives
+# ============================================================================
+
+import os
+import posixpath
+import re
+import zipfile
+from collections import namedtuple
+from urllib.parse import quote
+
+from django.conf import settings
+from django.db import models
+from django.http import (
+    FileResponse, HttpResponse, HttpResponseRedirect, StreamingHttpResponse,
+)
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import (
+    content_disposition_header, http_date, parse_http_date_safe,
+)
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from .conditional import make_etag
+from .uploads import BLOCK_SIZE
+
+# Single byte range, e.g. "bytes=0-499", "bytes=500-" or "bytes=-500"
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+# A downloadable file; ``size`` is None when it must be asked of storage
+StoredFile = namedtuple(
+    'StoredFile',
+    'file filename content_type etag last_modified size'
+)
+
+
+class PassthroughRenderer(BaseRenderer):
+    """Accept any media type for views returning file responses.
+
+    Without it DRF answers ``Accept: application/pdf`` with a 406 before
+    the view runs. Error bodies are still rendered as JSON.
+    """
+
+    media_type = '*/*'
+    format = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return JSONRenderer().render(data)
+
+
+# Renderers for download actions
+DOWNLOAD_RENDERERS = [JSONRenderer, PassthroughRenderer]
+
+
+def certificate_etag(certificate):
+    # Certificates are content-addressed, so the digest is a strong ETag
+    return f'"{certificate.sha256}"'
+
+
+def stored_certificate(certificate, filename=None):
+    """Return the ``StoredFile`` of a certificate."""
+    return StoredFile(
+        certificate.file,
+        filename or certificate.original_name or
+        posixpath.basename(certificate.file.name),
+        certificate.content_type,
+        certificate_etag(certificate),
+        certificate.created_at.timestamp(),
+        certificate.size,
+    )
+
+
+def record_certificate(record):
+    """Return the ``StoredFile`` of a record's certificate, or None.
+
+    Records with an uploaded certificate serve it; older records fall back
+    to their plain ``certificate_file``.
+    """
+    certificate = record.certificate
+    if certificate is not None and certificate.file:
+        return stored_certificate(
+            certificate, _record_filename(record, certificate.file.name)
+        )
+    if record.certificate_file:
+        return StoredFile(
+            record.certificate_file,
+            _record_filename(record, record.certificate_file.name),
+            '',
+            make_etag(record.certificate_file.name),
+            record.created_at.timestamp(),
+            None,
+        )
+    return None
+
+
+def serve_file(request, stored):
+    """Answer a download request for a stored file.
+
+    Conditional headers are evaluated first. The bytes are then sent
+    according to ``CERTIFICATE_DOWNLOAD_OFFLOAD``: handed to nginx
+    (``X-Accel-Redirect``) or Apache/lighttpd (``X-Sendfile``), which honour
+    ``Range`` themselves, redirected to a presigned storage URL, or by
+    default streamed from Python with single-range support.
+    """
+    field_file, filename, content_type, etag = stored[:4]
+    last_modified = int(stored.last_modified)
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    if response is not None:
+        return _finish(response, etag, last_modified)
+
+    mode = settings.CERTIFICATE_DOWNLOAD_OFFLOAD
+    if mode == 'redirect':
+        disposition = content_disposition_header(True, filename)
+        url = field_file.storage.url(
+            field_file.name,
+            parameters={'ResponseContentDisposition': disposition},
+            expire=settings.CERTIFICATE_PRESIGNED_EXPIRY
+        )
+        return HttpResponseRedirect(url)
+
+    if mode in ('x-accel', 'x-sendfile'):
+        response = HttpResponse(content_type=content_type or None)
+        if mode == 'x-accel':
+            response['X-Accel-Redirect'] = _accel_path(field_file.name)
+        else:
+            response['X-Sendfile'] = field_file.storage.path(field_file.name)
+        # Let the proxy choose the type from the file unless one is known
+        if not content_type:
+            del response['Content-Type']
+    else:
+        response = _stream(request, stored, last_modified)
+    response['Content-Disposition'] = content_disposition_header(
+        True, filename
+    )
+    return _finish(response, etag, last_modified)
+
+
+def _stream(request, stored, last_modified):
+    field_file, content_type = stored.file, stored.content_type
+    size = stored.size if stored.size is not None else field_file.size
+    byte_range = _requested_range(request, size, stored.etag, last_modified)
+    if byte_range is None:
+        response = FileResponse(
+            field_file.open('rb'), content_type=content_type or None
+        )
+        response['Content-Length'] = size
+        return response
+    if byte_range == ():
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+
+    start, end = byte_range
+    content = field_file.open('rb')
+    content.seek(start)
+    response = StreamingHttpResponse(
+        _read_range(content, end - start + 1),
+        status=206,
+        content_type=content_type or 'application/octet-stream'
+    )
+    response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    response['Content-Length'] = end - start + 1
+    return response
+
+
+def _requested_range(request, size, etag, last_modified):
+    """Return ``(start, end)`` of a satisfiable Range, ``()`` if it is
+    unsatisfiable, or None to send the whole file.
+
+    Multiple ranges are answered with the whole file, as RFC 9110 allows.
+    """
+    header = request.headers.get('Range')
+    if not header:
+        return None
+    if_range = request.headers.get('If-Range')
+    if if_range and if_range != etag and (
+            parse_http_date_safe(if_range) != last_modified):
+        return None
+    match = RANGE_RE.match(header.replace(' ', ''))
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        # A range ending before it starts is invalid and is ignored
+        if last and int(last) < start:
+            return None
+        if start >= size:
+            return ()
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        length = int(last)
+        if not length:
+            return ()
+        start, end = max(size - length, 0), size - 1
+    return start, end
+
+
+def _read_range(content, length):
+    try:
+        while length > 0:
+            block = content.read(min(BLOCK_SIZE, length))
+            if not block:
+                break
+            length -= len(block)
+            yield block
+    finally:
+        content.close()
+
+
+def _finish(response, etag, last_modified):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Accept-Ranges'] = 'bytes'
+    patch_cache_control(
+        response, private=True, max_age=settings.CERTIFICATE_DOWNLOAD_MAX_AGE
+    )
+    return response
+
+
+def _accel_path(name):
+    return posixpath.join(settings.CERTIFICATE_ACCEL_PREFIX, quote(name))
+
+
+def safe_filename(value):
+    """Replace characters that are unsafe in file and archive names."""
+    return re.sub(r'[^\w.-]+', '_', value)
+
+
+def _record_filename(record, stored_name):
+    extension = os.path.splitext(stored_name)[1]
+    number = safe_filename(record.certificate_number) or 'cert'
+    return f'{record.calibration_date}_{number}{extension}'
+
+
+def archive_records(queryset):
+    """Return the calibration records with a certificate, for archiving."""
+    return (
+        queryset
+        .filter(
+            models.Q(certificate__isnull=False) | ~models.Q(certificate_file='')
+        )
+        .select_related('equipment', 'certificate')
+        .only(
+            'calibration_date', 'certificate_number', 'certificate_file',
+            'created_at', 'equipment__serial_number', 'certificate__file',
+            'certificate__sha256', 'certificate__size',
+            'certificate__content_type', 'certificate__original_name',
+            'certificate__created_at',
+        )
+        .order_by('equipment__serial_number', 'calibration_date', 'id')
+    )
+
+
+def archive_response(records, filename):
+    """Return a zip of the certificates of ``records`` as a download.
+
+    The archive is streamed as it is built, so memory use stays constant.
+    With ``CERTIFICATE_ZIP_OFFLOAD`` the response is instead a file list
+    for nginx's mod_zip, which assembles the archive itself and leaves
+    the worker free.
+    """
+    entries = _archive_entries(records)
+    if (settings.CERTIFICATE_ZIP_OFFLOAD and
+            settings.CERTIFICATE_DOWNLOAD_OFFLOAD == 'x-accel'):
+        response = HttpResponse(
+            ''.join(
+                f'- {field_file.size if size is None else size} '
+                f'{_accel_path(field_file.name)} {name}\n'
+                for name, field_file, size in entries
+            ),
+            content_type='text/plain'
+        )
+        response['X-Archive-Files'] = 'zip'
+    else:
+        response = StreamingHttpResponse(
+            stream_zip(entries), content_type='application/zip'
+        )
+    response['Content-Disposition'] = content_disposition_header(
+        True, filename
+    )
+    return response
+
+
+def stream_zip(entries):
+    """Yield a zip archive of ``(name, field_file, size)`` piece by piece.
+
+    Certificates are mostly compressed PDFs, so entries are stored rather
+    than deflated, keeping the CPU cost of large audits down.
+    """
+    output = _ZipOutput()
+    with zipfile.ZipFile(output, 'w', zipfile.ZIP_STORED) as archive:
+        for name, field_file, _ in entries:
+            with field_file.open('rb') as content, archive.open(
+                    name, 'w', force_zip64=True) as member:
+                for block in iter(lambda: content.read(BLOCK_SIZE), b''):
+                    member.write(block)
+                    yield from output.drain()
+            yield from output.drain()
+    yield from output.drain()
+
+
+def _archive_entries(records):
+    """Return ``(name, file, size)`` with unique names per equipment.
+
+    ``size`` is None for files whose size is unknown without asking
+    storage, which only the mod_zip file list needs.
+    """
+    entries = []
+    names = set()
+    for record in records:
+        found = record_certificate(record)
+        if found is None:
+            continue
+        folder = safe_filename(record.equipment.serial_number)
+        name = f'{folder}/{found.filename}'
+        base, extension = os.path.splitext(name)
+        suffix = 1
+        while name in names:
+            suffix += 1
+            name = f'{base}_{suffix}{extension}'
+        names.add(name)
+        entries.append((name, found.file, found.size))
+    return entries
+
+
+class _ZipOutput:
+    """Write-only, unseekable buffer that ``zipfile`` can stream into."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        """Yield what was written since the last drain, if anything."""
+        if self._chunks:
+            data = b''.join(self._chunks)
+            self._chunks.clear()
+            yield data
@@ -0,0 +1,221 @@
+# ============================================================================
+# File Path: backend/equipment/export.py
+# Description: Streaming CSV/NDJSON export of equipment data
+# ============================================================================
+
+import csv
+import datetime
+import decimal
+import itertools
+import json
+import zlib
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.dateparse import parse_date
+
+from .models import Equipment, CalibrationRecord, MaintenanceRecord
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+# Export type -> (model, columns, date field, lookup prefix for equipment)
+EXPORT_TYPES = {
+    'equipment': (
+        Equipment,
+        (
+            'id', 'name', 'model_number', 'serial_number', 'manufacturer',
+            'category', 'location', 'purchase_date', 'last_calibration_date',
+            'next_calibration_date', 'calibration_interval_type',
+            'calibration_interval_value', 'status', 'effective_status',
+            'notes', 'created_at', 'updated_at',
+        ),
+        'next_calibration_date',
+        '',
+    ),
+    'calibrations': (
+        CalibrationRecord,
+        (
+            'id', 'equipment_id', 'equipment__serial_number',
+            'equipment__name', 'calibration_date', 'calibrated_by',
+            'certificate_number', 'certificate_file', 'calibration_standard',
+            'measurement_points', 'results', 'notes', 'created_at',
+        ),
+        'calibration_date',
+        'equipment__',
+    ),
+    'maintenance': (
+        MaintenanceRecord,
+        (
+            'id', 'equipment_id', 'equipment__serial_number',
+            'equipment__name', 'maintenance_date', 'maintenance_type',
+            'performed_by', 'description', 'parts_replaced', 'cost', 'notes',
+            'created_at',
+        ),
+        'maintenance_date',
+        'equipment__',
+    ),
+}
+
+# Rows rendered per yielded chunk; keeps per-row generator overhead low
+ROWS_PER_CHUNK = 500
+
+
+class ExportError(ValueError):
+    """Raised for invalid export parameters."""
+
+
+def get_export_queryset(export_type, params):
+    """Return the projected queryset and header for an export request.
+
+    ``params`` may contain ``start``/``end`` dates (inclusive) applied to the
+    type's date field, and ``location``/``category`` equipment filters.
+    """
+    try:
+        model, columns, date_field, prefix = EXPORT_TYPES[export_type]
+    except KeyError:
+        raise ExportError(
+            f'Unknown export type "{export_type}"; expected one of '
+            f'{", ".join(EXPORT_TYPES)}.'
+        )
+
+    queryset = model.objects.all()
+    if model is Equipment:
+        queryset = queryset.with_effective_status()
+
+    filters = {}
+    for param, lookup in (('start', 'gte'), ('end', 'lte')):
+        value = params.get(param)
+        if value:
+            try:
+                date = parse_date(value)
+            except ValueError:
+                # Well formatted but impossible, like February 30th
+                date = None
+            if date is None:
+                raise ExportError(f'Invalid {param} date "{value}".')
+            suffix = '__date' if model is Equipment else ''
+            filters[f'{date_field}{suffix}__{lookup}'] = date
+    for param in ('location', 'category'):
+        value = params.get(param)
+        if value:
+            filters[f'{prefix}{param}'] = value
+
+    queryset = queryset.filter(**filters).order_by('pk').values_list(*columns)
+    header = [column.replace('__', '_') for column in columns]
+    return queryset, header
+
+
+def stream_export(queryset, header, export_format, compress=False):
+    """Yield the encoded export body chunk by chunk.
+
+    Rows are read with ``iterator()`` (a server-side cursor on PostgreSQL)
+    so memory use does not depend on the size of the export.
+    """
+    encoder = _Encoder(header, export_format, compress)
+    yield from encoder.start()
+    batch = []
+    for row in queryset.iterator(chunk_size=settings.EXPORT_CHUNK_SIZE):
+        batch.append(row)
+        if len(batch) >= ROWS_PER_CHUNK:
+            yield from encoder.encode(batch)
+            batch = []
+    yield from encoder.finish(batch)
+
+
+async def astream_export(queryset, header, export_format, compress=False):
+    """Async ``stream_export()``, for ASGI servers.
+
+    Each chunk of rows is read in one trip to the sync thread, which is
+    free for other requests while the chunk is encoded and sent.
+    """
+    encoder = _Encoder(header, export_format, compress)
+    for chunk in encoder.start():
+        yield chunk
+    # Not aiterator(), which runs the query of values_list() querysets
+    # with reordered annotations in the event loop on Django 5.0
+    rows = queryset.iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+    read = sync_to_async(_take)
+    while True:
+        batch = await read(rows, ROWS_PER_CHUNK)
+        if len(batch) < ROWS_PER_CHUNK:
+            break
+        for chunk in encoder.encode(batch):
+            yield chunk
+    for chunk in encoder.finish(batch):
+        yield chunk
+
+
+def _take(iterator, count):
+    return list(itertools.islice(iterator, count))
+
+
+class _Echo:
+    """Pseudo file whose write() returns the value instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+class _Encoder:
+    """Encode export rows to bytes, a batch at a time.
+
+    Every method returns the chunks to send next; none while the gzip
+    compressor is still buffering its input.
+    """
+
+    def __init__(self, header, export_format, compress):
+        self.header = header
+        self.csv = export_format == 'csv'
+        self.writer = csv.writer(_Echo())
+        self.json = DjangoJSONEncoder(separators=(',', ':'))
+        self.compressor = (
+            zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if compress else None
+        )
+
+    def start(self):
+        return self._bytes(
+            self.writer.writerow(self.header) if self.csv else ''
+        )
+
+    def encode(self, rows):
+        if self.csv:
+            writerow = self.writer.writerow
+            text = ''.join(
+                writerow([_csv_value(value) for value in row])
+                for row in rows
+            )
+        else:
+            header, encode = self.header, self.json.encode
+            text = ''.join(
+                encode(dict(zip(header, row))) + '\n' for row in rows
+            )
+        return self._bytes(text)
+
+    def finish(self, rows):
+        """Encode the last ``rows`` and end the body."""
+        chunks = self.encode(rows) if rows else []
+        if self.compressor is not None:
+            chunks.append(self.compressor.flush())
+        return chunks
+
+    def _bytes(self, text):
+        data = text.encode()
+        if self.compressor is not None:
+            data = self.compressor.compress(data)
+        return [data] if data else []
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(',', ':'))
+    return value
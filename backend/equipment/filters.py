@@ -0,0 +1,116 @@
+# ============================================================================
+# File Path: backend/equipment/filters.py
+# Description: Declarative field filters and index-backed ordering for the API
+# ============================================================================
+
+import datetime
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+# Lookups accepted in ``filter_fields``; ``in`` takes comma-separated values
+LOOKUPS = ('exact', 'in', 'gt', 'gte', 'lt', 'lte')
+
+
+class FieldFilterBackend(BaseFilterBackend):
+    """Filter on the fields and lookups declared in ``view.filter_fields``.
+
+    ``filter_fields`` maps model fields to allowed lookups, e.g.
+    ``{'category': ['exact', 'in'], 'calibration_date': ['gte', 'lte']}``.
+    The exact lookup uses the bare field name as query parameter and the
+    others ``<field>__<lookup>``. Values are parsed by the model field and
+    invalid ones are rejected with a 400. A view method
+    ``filter_<field>(queryset, lookup, value)`` replaces the default lookup.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        errors = {}
+        for name, lookups in getattr(view, 'filter_fields', {}).items():
+            field = queryset.model._meta.get_field(name)
+            for lookup in lookups:
+                param = name if lookup == 'exact' else f'{name}__{lookup}'
+                raw = request.query_params.get(param)
+                if raw is None or raw == '':
+                    continue
+                try:
+                    lookup, value = parse_value(field, lookup, raw)
+                except DjangoValidationError as exc:
+                    errors[param] = exc.messages
+                    continue
+                method = getattr(view, f'filter_{name}', None)
+                if method is not None:
+                    queryset = method(queryset, lookup, value)
+                else:
+                    queryset = queryset.filter(**{f'{name}__{lookup}': value})
+        if errors:
+            raise ValidationError(errors)
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        parameters = []
+        for name, lookups in getattr(view, 'filter_fields', {}).items():
+            for lookup in lookups:
+                parameters.append({
+                    'name': name if lookup == 'exact' else f'{name}__{lookup}',
+                    'required': False,
+                    'in': 'query',
+                    'schema': {'type': 'string'},
+                })
+        return parameters
+
+
+def parse_value(field, lookup, raw):
+    """Return ``(lookup, value)`` for a raw query parameter value.
+
+    Date-only values for datetime fields cover whole days in the current
+    time zone, so ``lte=2024-01-31`` includes the 31st.
+    """
+    if lookup == 'in':
+        return lookup, [
+            _parse_one(field, part.strip())
+            for part in raw.split(',') if part.strip()
+        ]
+    value = _parse_one(field, raw)
+    if (isinstance(field, models.DateTimeField) and len(raw) == 10 and
+            lookup in ('gt', 'lte')):
+        # Move past the end of the given day
+        value += datetime.timedelta(days=1)
+        lookup = {'gt': 'gte', 'lte': 'lt'}[lookup]
+    return lookup, value
+
+
+def _parse_one(field, raw):
+    value = field.to_python(raw)
+    if isinstance(value, datetime.datetime) and timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    if field.choices:
+        field.validate(value, None)
+    return value
+
+
+class IndexedOrderingFilter(OrderingFilter):
+    """Ordering restricted to ``view.ordering_fields`` backed by indexes.
+
+    ``ordering_fields`` maps each public ordering name to the columns of the
+    index that serves it, which are applied together in the requested
+    direction. Only one ordering term is accepted, since combining them
+    would need a sort no index can serve.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        param = request.query_params.get(self.ordering_param, '').strip()
+        if not param:
+            return self.get_default_ordering(view)
+
+        allowed = getattr(view, 'ordering_fields', {})
+        descending = param.startswith('-')
+        columns = allowed.get(param[1:] if descending else param)
+        if columns is None:
+            raise ValidationError({self.ordering_param: [
+                f'Ordering must be one of: '
+                f'{", ".join(sorted(allowed))}, optionally prefixed with "-".'
+            ]})
+        return [f"{'-' if descending else ''}{column}" for column in columns]
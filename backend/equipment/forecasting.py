@@ -0,0 +1,309 @@
+# ============================================================================
+# File Path: backend/equipment/forecasting.py
+# Description: Calibration workload forecasts and capacity levelling
+# ============================================================================
+
+import datetime
+import functools
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .cache import get_data_version
+from .scheduling import INTERVAL_TYPES, add_months
+
+# Forecast horizon in months, by default and at most
+DEFAULT_MONTHS = 12
+MAX_MONTHS = 36
+
+BUCKETS = ('day', 'week', 'month')
+GROUP_FIELDS = ('location', 'category')
+
+
+class ForecastError(ValueError):
+    """Invalid forecast parameters."""
+
+
+class DueDate(TruncDate):
+    """Local date of a datetime, native on SQLite when the zone is UTC.
+
+    Django evaluates ``TruncDate`` on SQLite with a Python function per
+    row, which dominates forecasts of large fleets in development.
+    """
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        if self.get_tzname() != 'UTC':
+            return self.as_sql(compiler, connection, **extra_context)
+        sql, params = compiler.compile(self.lhs)
+        return f'date({sql})', params
+
+
+def get_forecast(queryset, params, now=None):
+    """Return the forecast for ``queryset``, cached per data version.
+
+    ``params`` must determine the queryset, e.g. be the query parameters
+    it was filtered with. Entries are keyed by the equipment data version
+    and the current date, so they are reused until the schedule changes or
+    the day turns.
+    """
+    options = parse_forecast_params(params)
+    today = timezone.localdate(now)
+    digest = hashlib.md5(repr(sorted(params.lists())).encode()).hexdigest()
+    key = f'equipment:forecast:{get_data_version()}:{today}:{digest}'
+    forecast = cache.get(key)
+    if forecast is None:
+        forecast = build_forecast(queryset, options, today)
+        cache.set(key, forecast, timeout=settings.FORECAST_CACHE_TIMEOUT)
+    return forecast
+
+
+def parse_forecast_params(params):
+    """Validate forecast query parameters.
+
+    ``months`` sets the horizon, ``bucket`` the period of the returned
+    series (day, week or month), ``group_by`` splits it by location or
+    category and ``capacity`` levels the load to that many calibrations
+    per day.
+    """
+    options = {
+        'months': _integer(params, 'months', DEFAULT_MONTHS, MAX_MONTHS),
+        'bucket': params.get('bucket', 'day'),
+        'group_by': params.get('group_by') or None,
+        'capacity': _integer(params, 'capacity', None, None),
+    }
+    if options['bucket'] not in BUCKETS:
+        raise ForecastError(f'"bucket" must be one of {", ".join(BUCKETS)}.')
+    if options['group_by'] not in (None, *GROUP_FIELDS):
+        raise ForecastError(
+            f'"group_by" must be one of {", ".join(GROUP_FIELDS)}.'
+        )
+    return options
+
+
+def build_forecast(queryset, options, today):
+    """Project every calibration falling due within the horizon.
+
+    Equipment is collapsed in SQL into counts per due date, interval and
+    group. The counts for each interval form one array of first
+    occurrences per day, which is then repeated along the horizon in a
+    single pass, so the cost depends on the number of distinct intervals
+    and groups rather than on the fleet size. Overdue equipment is counted
+    as due on the first day. Hourly intervals are projected from the start
+    of their due day.
+    """
+    end = add_months(today, options['months'])
+    days = (end - today).days
+    group_by = options['group_by']
+    fields = ['calibration_interval_type', 'calibration_interval_value']
+    if group_by:
+        fields.append(group_by)
+    rows = (
+        queryset
+        .exclude(status='retired')
+        .filter(
+            next_calibration_date__isnull=False,
+            next_calibration_date__lt=_start_of(end),
+        )
+        .order_by()
+        .values(*fields, due=DueDate('next_calibration_date'))
+        .annotate(count=Count('pk'))
+        .values_list('due', 'count', *fields)
+    )
+
+    # First occurrences per day, per group and interval
+    starts = {}
+    overdue = 0
+    for due, count, interval_type, interval_value, *group in rows:
+        offset = (due - today).days
+        if offset < 0:
+            overdue += count
+        key = (*group, *_interval(interval_type, interval_value))
+        first = starts.get(key)
+        if first is None:
+            first = starts[key] = [0] * days
+        first[max(offset, 0)] += count
+
+    load = [0] * days
+    groups = {}
+    for (*group, unit, step), first in starts.items():
+        occurrences = _repeat(first, unit, step, today)
+        load = [a + b for a, b in zip(load, occurrences)]
+        if group:
+            group = group[0]
+            previous = groups.get(group)
+            groups[group] = occurrences if previous is None else [
+                a + b for a, b in zip(previous, occurrences)
+            ]
+
+    forecast = {
+        'start': today,
+        'end': end - datetime.timedelta(days=1),
+        'bucket': options['bucket'],
+        'group_by': group_by,
+        'capacity': options['capacity'],
+        'total': sum(load),
+        'overdue': overdue,
+    }
+    periods = _periods(today, days, options['bucket'])
+    series = _series(periods, load, 'due')
+    for name, group_load in sorted(groups.items()):
+        for entry, value in zip(series, _sums(periods, group_load)):
+            entry.setdefault('groups', {})[name] = value
+
+    if options['capacity'] is not None:
+        scheduled, moves, unplaced = level(load, options['capacity'])
+        for entry, value in zip(series, _sums(periods, scheduled)):
+            entry['scheduled'] = value
+        forecast['moves'] = [
+            {
+                'from': today + datetime.timedelta(days=origin),
+                'to': today + datetime.timedelta(days=target),
+                'count': count,
+            }
+            for origin, target, count in moves
+        ]
+        forecast['unplaced'] = unplaced
+    forecast['series'] = series
+    return forecast
+
+
+def level(load, capacity):
+    """Level a daily load so no day exceeds ``capacity``.
+
+    Excess calibrations are brought forward to the nearest earlier day
+    with spare capacity, never pushed past their due date. Returns the
+    levelled load, the moves as ``(from, to, count)`` day offsets and the
+    number that fit nowhere, which stay on the first day.
+    """
+    scheduled = [0] * len(load)
+    moves = []
+    # Excess waiting to be placed, nearest origin last
+    pending = []
+    for day in range(len(load) - 1, -1, -1):
+        scheduled[day] = min(load[day], capacity)
+        if load[day] > capacity:
+            pending.append([day, load[day] - capacity])
+        spare = capacity - scheduled[day]
+        while spare and pending and pending[-1][0] != day:
+            origin, count = pending[-1]
+            placed = min(count, spare)
+            scheduled[day] += placed
+            spare -= placed
+            moves.append((origin, day, placed))
+            if placed == count:
+                pending.pop()
+            else:
+                pending[-1][1] -= placed
+    unplaced = sum(count for _, count in pending)
+    if load:
+        scheduled[0] += unplaced
+    moves.reverse()
+    return scheduled, moves, unplaced
+
+
+def _interval(interval_type, interval_value):
+    """Return a schedule's interval as ``(unit, step)``.
+
+    Units are days, calendar months or hours; schedules without a complete
+    interval fall due once.
+    """
+    if interval_type not in INTERVAL_TYPES or not interval_value or (
+            interval_value < 1):
+        return 'once', 0
+    if interval_type == 'hourly':
+        if interval_value % 24:
+            return 'hours', interval_value
+        return 'days', interval_value // 24
+    if interval_type in ('daily', 'weekly'):
+        return 'days', interval_value * (7 if interval_type == 'weekly' else 1)
+    return 'months', interval_value * (12 if interval_type == 'yearly' else 1)
+
+
+def _repeat(first, unit, step, today):
+    """Return the daily occurrences of schedules starting on ``first``.
+
+    Each occurrence is followed by the next one an interval later, as when
+    ``add_interval`` is applied to the date of every calibration, so
+    calendar months clamp once and then keep the clamped day.
+    """
+    days = len(first)
+    load = list(first)
+    if unit == 'days':
+        for offset in range(step, days):
+            load[offset] += load[offset - step]
+    elif unit == 'months':
+        for offset in range(days):
+            if load[offset]:
+                target = _month_offset(today, offset, step)
+                if target < days:
+                    load[target] += load[offset]
+    elif unit == 'hours':
+        # Occurrences on each day after a start at midnight
+        per_day = [
+            (24 * offset + 23) // step - (24 * offset - 1) // step
+            for offset in range(days)
+        ]
+        load = [0] * days
+        for start, count in enumerate(first):
+            if count:
+                for offset in range(start, days):
+                    load[offset] += count * per_day[offset - start]
+    return load
+
+
+@functools.lru_cache(maxsize=65536)
+def _month_offset(today, offset, months):
+    day = add_months(today + datetime.timedelta(days=offset), months)
+    return (day - today).days
+
+
+def _periods(today, days, bucket):
+    """Return the start date of the period of every day offset."""
+    periods = []
+    for offset in range(days):
+        day = today + datetime.timedelta(days=offset)
+        if bucket == 'week':
+            day -= datetime.timedelta(days=day.weekday())
+        elif bucket == 'month':
+            day = day.replace(day=1)
+        periods.append(day)
+    return periods
+
+
+def _sums(periods, load):
+    sums = {}
+    for period, value in zip(periods, load):
+        sums[period] = sums.get(period, 0) + value
+    return list(sums.values())
+
+
+def _series(periods, load, name):
+    starts = list(dict.fromkeys(periods))
+    return [
+        {'period': start, name: value}
+        for start, value in zip(starts, _sums(periods, load))
+    ]
+
+
+def _start_of(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time()))
+
+
+def _integer(params, name, default, maximum):
+    raw = params.get(name, '').strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ForecastError(f'"{name}" must be an integer.')
+    if value < 1 or (maximum is not None and value > maximum):
+        raise ForecastError(
+            f'"{name}" must be between 1 and {maximum}.' if maximum
+            else f'"{name}" must be positive.'
+        )
+    return value
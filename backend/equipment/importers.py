@@ -0,0 +1,237 @@
+# ============================================================================
+# File Path: backend/equipment/importers.py
+# Description: Chunked bulk import of calibration records from CSV
+# ============================================================================
+
+import csv
+import datetime
+import json
+from itertools import islice
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .cache import bump_data_version
+from .measurements import build_points
+from .models import Equipment, CalibrationRecord, MeasurementPoint
+from .schemas import MEASUREMENT_COLUMNS, validate_measurements
+from .summaries import calibration_summary
+
+# Required text columns and their model max lengths
+TEXT_COLUMNS = {
+    name: CalibrationRecord._meta.get_field(name).max_length
+    for name in ('calibrated_by', 'certificate_number', 'calibration_standard')
+}
+# Serial number column names, including the one written by the export
+SERIAL_COLUMNS = ('serial_number', 'equipment_serial_number')
+# Row errors kept in the report; the count is always complete
+MAX_REPORTED_ERRORS = 1000
+# Equipment columns read and written when imports advance schedules
+SCHEDULE_COLUMNS = (
+    'last_calibration_date', 'next_calibration_date',
+    'calibration_interval_type', 'calibration_interval_value', 'status',
+)
+
+
+class CalibrationImporter:
+    """Import calibration records from a CSV stream in chunks.
+
+    Equipment is resolved through a serial number -> id map loaded once,
+    rows are validated with plain Python checks and the compiled
+    measurement schemas instead of a serializer,
+    and each chunk is inserted with ``bulk_create`` in its own transaction,
+    together with the summaries and schedules of the chunk's equipment.
+    Chunks before ``start_chunk`` are skipped, so an interrupted import can
+    resume after the last committed chunk.
+    """
+
+    def __init__(self, chunk_size=1000, dry_run=False, user=None):
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        self.user = user
+        self.equipment_ids = None
+        self.categories = None
+
+    def run(self, stream, start_chunk=0, on_chunk=None):
+        """Import ``stream`` and return a report of the outcome.
+
+        ``on_chunk(index, report)`` is called after every processed chunk,
+        e.g. to persist a resume checkpoint.
+        """
+        report = {
+            'dry_run': self.dry_run,
+            'chunks': 0,
+            'rows': 0,
+            'created': 0,
+            'failed': 0,
+            'last_committed_chunk': start_chunk - 1,
+            'errors': [],
+        }
+        reader = csv.DictReader(stream)
+        missing = self._missing_columns(reader.fieldnames or [])
+        if missing:
+            report['failed'] = 1
+            report['errors'].append({
+                'row': 1,
+                'errors': {column: ['Missing column.'] for column in missing},
+            })
+            return report
+
+        if self.equipment_ids is None:
+            equipment = list(Equipment.objects.values_list(
+                'serial_number', 'pk', 'category'
+            ))
+            self.equipment_ids = {serial: pk for serial, pk, _ in equipment}
+            self.categories = {pk: category for _, pk, category in equipment}
+
+        touched = set()
+        index = 0
+        while True:
+            # Row numbers count the header as row 1
+            first_row = index * self.chunk_size + 2
+            rows = list(islice(reader, self.chunk_size))
+            if not rows:
+                break
+            if index >= start_chunk:
+                self._import_chunk(rows, first_row, report, touched)
+                report['chunks'] += 1
+                if not self.dry_run:
+                    report['last_committed_chunk'] = index
+                if on_chunk:
+                    on_chunk(index, report)
+            index += 1
+
+        if report['created']:
+            bump_data_version(equipment_ids=touched)
+        return report
+
+    def _import_chunk(self, rows, first_row, report, touched):
+        records = []
+        for number, row in enumerate(rows, start=first_row):
+            report['rows'] += 1
+            record, errors = self.build_record(row)
+            if errors:
+                report['failed'] += 1
+                if len(report['errors']) < MAX_REPORTED_ERRORS:
+                    report['errors'].append({'row': number, 'errors': errors})
+            else:
+                records.append(record)
+
+        if self.dry_run or not records:
+            return
+        newest = {}
+        for record in records:
+            current = newest.get(record.equipment_id)
+            if current is None or record.calibration_date > current:
+                newest[record.equipment_id] = record.calibration_date
+        equipment_ids = set(newest)
+        with transaction.atomic():
+            CalibrationRecord.objects.bulk_create(records)
+            # bulk_create skips signals, so recount the chunk's equipment
+            # and write the measurement points here
+            Equipment.objects.filter(pk__in=equipment_ids).update(
+                **calibration_summary(Equipment)
+            )
+            MeasurementPoint.objects.bulk_create(
+                [
+                    point for record in records
+                    for point in build_points(record)
+                ],
+                batch_size=1000
+            )
+            self._advance_schedules(newest)
+        report['created'] += len(records)
+        touched.update(equipment_ids)
+
+    @staticmethod
+    def _advance_schedules(newest):
+        """Move schedules forward to each equipment's newest calibration.
+
+        Matches ``record_calibration`` as run for records created through
+        the API, with one ``bulk_update`` for the chunk.
+        """
+        now = timezone.now()
+        advanced = []
+        equipment = Equipment.objects.filter(pk__in=newest).only(
+            *SCHEDULE_COLUMNS
+        )
+        for instance in equipment:
+            calibrated_at = timezone.make_aware(datetime.datetime.combine(
+                newest[instance.pk], datetime.time.min
+            ))
+            if instance.advance_calibration(calibrated_at, now):
+                instance.updated_at = now
+                advanced.append(instance)
+        Equipment.objects.bulk_update(
+            advanced,
+            ['last_calibration_date', 'next_calibration_date', 'status',
+             'updated_at'],
+            batch_size=1000
+        )
+
+    def build_record(self, row):
+        """Return ``(record, errors)`` for a CSV row."""
+        errors = {}
+        serial_number = next(
+            (row[column] for column in SERIAL_COLUMNS if row.get(column)), ''
+        ).strip()
+        equipment_id = self.equipment_ids.get(serial_number)
+        if equipment_id is None:
+            errors['serial_number'] = [
+                f'Unknown equipment serial number "{serial_number}".'
+            ]
+
+        try:
+            calibration_date = parse_date(
+                (row.get('calibration_date') or '').strip()
+            )
+        except ValueError:
+            calibration_date = None
+        if calibration_date is None:
+            errors['calibration_date'] = ['Expected a YYYY-MM-DD date.']
+
+        values = {}
+        for column, max_length in TEXT_COLUMNS.items():
+            value = (row.get(column) or '').strip()
+            if not value:
+                errors[column] = ['This field is required.']
+            elif len(value) > max_length:
+                errors[column] = [
+                    f'Ensure this field has no more than {max_length} '
+                    'characters.'
+                ]
+            values[column] = value
+
+        for column in MEASUREMENT_COLUMNS:
+            try:
+                values[column] = json.loads(row.get(column) or '')
+            except ValueError:
+                errors[column] = ['Expected valid JSON.']
+
+        parsed = all(column in values for column in MEASUREMENT_COLUMNS)
+        if equipment_id is not None and parsed:
+            version, measurements, schema_errors = validate_measurements(
+                self.categories[equipment_id],
+                *(values[column] for column in MEASUREMENT_COLUMNS)
+            )
+            errors.update(schema_errors)
+            values.update(measurements, schema_version=version)
+
+        if errors:
+            return None, errors
+        return CalibrationRecord(
+            equipment_id=equipment_id,
+            calibration_date=calibration_date,
+            notes=row.get('notes') or '',
+            created_by=self.user,
+            **values
+        ), None
+
+    @staticmethod
+    def _missing_columns(fieldnames):
+        required = ['calibration_date', *TEXT_COLUMNS, *MEASUREMENT_COLUMNS]
+        missing = [column for column in required if column not in fieldnames]
+        if not any(column in fieldnames for column in SERIAL_COLUMNS):
+            missing.insert(0, 'serial_number')
+        return missing
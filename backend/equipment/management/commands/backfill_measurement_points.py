@@ -0,0 +1,52 @@
+# ============================================================================
+# File Path: backend/equipment/management/commands/backfill_measurement_points.py
+# Description: Derive typed measurement points from existing record JSON
+# ============================================================================
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from equipment.cache import bump_data_version
+from equipment.measurements import sync_points
+from equipment.models import CalibrationRecord
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild the MeasurementPoint rows of every calibration record from '
+        'its measurement_points and results JSON, in keyset batches.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Calibration records rewritten per transaction.'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be positive.')
+
+        records = CalibrationRecord.objects.only(
+            'id', 'equipment_id', 'calibration_date', 'measurement_points',
+            'results'
+        ).order_by('pk')
+        last_pk = 0
+        record_count = point_count = 0
+        while True:
+            batch = list(records.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            with transaction.atomic():
+                point_count += sync_points(batch)
+            record_count += len(batch)
+            last_pk = batch[-1].pk
+        if point_count:
+            bump_data_version()
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote {point_count} measurement points for '
+            f'{record_count} calibration records.'
+        ))
@@ -0,0 +1,269 @@
+# ============================================================================
+# File Path: backend/equipment/management/commands/benchmark_api.py
+# Description: Reproducible latency, query and size benchmark of the API
+# ============================================================================
+
+import datetime
+import json
+import platform
+import statistics
+import time
+from urllib.parse import quote
+
+import django
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import AsyncClient, Client
+
+from core.metrics import RequestMetrics
+from equipment.models import (
+    Equipment, CalibrationRecord, MaintenanceRecord, MeasurementPoint,
+)
+
+# Endpoints measured by default; placeholders are filled from the data
+DEFAULT_ENDPOINTS = (
+    '/api/equipment/',
+    '/api/equipment/?page_size=100',
+    '/api/equipment/?category={category}',
+    '/api/equipment/{equipment_id}/',
+    '/api/equipment/due_for_calibration/',
+    '/api/equipment/overdue_calibration/',
+    '/api/equipment/forecast/',
+    '/api/calibration-records/',
+    '/api/calibration-records/?equipment={equipment_id}',
+    '/api/maintenance-records/',
+    '/api/dashboard/',
+    '/api/analytics/drift/?point={point}',
+    '/api/sync/',
+)
+
+RUNNERS = ('wsgi', 'asgi')
+
+
+class Command(BaseCommand):
+    help = (
+        'Request API endpoints in process and report p50/p95/p99 latency, '
+        'SQL queries and bytes per response. Results can be written to a '
+        'JSON file and compared against a stored baseline. Run against a '
+        'database filled by seed_fleet.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--endpoint',
+            action='append',
+            dest='endpoints',
+            help='Endpoint to measure, repeatable (default: a standard set).'
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=50,
+            help='Measured requests per endpoint (default: 50).'
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=3,
+            help='Unmeasured requests per endpoint first (default: 3).'
+        )
+        parser.add_argument(
+            '--runner',
+            choices=RUNNERS,
+            default='wsgi',
+            help='Request through the WSGI or the ASGI handler.'
+        )
+        parser.add_argument(
+            '--cold',
+            action='store_true',
+            help='Clear the cache before every request.'
+        )
+        parser.add_argument('--output', help='Write the results to this file.')
+        parser.add_argument(
+            '--baseline',
+            help='Fail if results regress against this results file.'
+        )
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.25,
+            help='Allowed relative p95 increase over the baseline '
+                 '(default: 0.25).'
+        )
+        parser.add_argument(
+            '--slack-ms',
+            type=float,
+            default=2.0,
+            help='Allowed absolute p95 increase, absorbing noise on fast '
+                 'endpoints (default: 2).'
+        )
+
+    def handle(self, *args, **options):
+        if options['requests'] < 2 or options['warmup'] < 0:
+            raise CommandError(
+                '--requests must be at least 2 and --warmup not negative.'
+            )
+        baseline = None
+        if options['baseline']:
+            try:
+                with open(options['baseline'], encoding='utf-8') as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as exc:
+                raise CommandError(f'Cannot read the baseline: {exc}')
+
+        placeholders = self.placeholders()
+        paths = [
+            template.format(**placeholders)
+            for template in options['endpoints'] or DEFAULT_ENDPOINTS
+        ]
+        results = {}
+        self.stdout.write(
+            f"{'endpoint':<52} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+            f"{'queries':>8} {'bytes':>9}"
+        )
+        for path in paths:
+            result = self.measure(path, options)
+            results[path] = result
+            self.stdout.write(
+                f"{path[:52]:<52} {result['p50_ms']:>8.2f} "
+                f"{result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f} "
+                f"{result['queries']:>8.1f} {result['bytes']:>9.0f}"
+            )
+
+        report = {'meta': self.meta(options), 'results': results}
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+                f.write('\n')
+            self.stdout.write(f"Results written to {options['output']}")
+        if baseline is not None:
+            if baseline.get('meta', {}).get('runner') != options['runner']:
+                self.stderr.write(
+                    'The baseline was measured with another runner.'
+                )
+            self.compare(results, baseline.get('results', {}), options)
+
+    def placeholders(self):
+        """Return the values of endpoint placeholders, from existing data."""
+        equipment = (
+            Equipment.objects.order_by('pk')
+            .values('pk', 'category').first()
+        )
+        if equipment is None:
+            raise CommandError('No equipment to benchmark; run seed_fleet.')
+        point = (
+            MeasurementPoint.objects.filter(equipment=equipment['pk'])
+            .order_by('record_id', 'position')
+            .values_list('point', flat=True).first()
+        )
+        return {
+            'equipment_id': equipment['pk'],
+            'category': quote(equipment['category']),
+            'point': quote(point or ''),
+        }
+
+    def measure(self, path, options):
+        """Request ``path`` repeatedly and summarize the measurements."""
+        request = (
+            self.asgi_request if options['runner'] == 'asgi'
+            else self.wsgi_request
+        )
+        client = AsyncClient() if options['runner'] == 'asgi' else Client()
+        timings, queries, sizes = [], [], []
+        for index in range(options['warmup'] + options['requests']):
+            if options['cold']:
+                cache.clear()
+            metrics = RequestMetrics()
+            with connection.execute_wrapper(metrics):
+                start = time.perf_counter()
+                status, size = request(client, path)
+                elapsed = time.perf_counter() - start
+            if status != 200:
+                raise CommandError(f'{path} returned {status}')
+            if index >= options['warmup']:
+                timings.append(elapsed * 1000)
+                queries.append(metrics.queries)
+                sizes.append(size)
+
+        cuts = statistics.quantiles(timings, n=100, method='inclusive')
+        return {
+            'requests': len(timings),
+            'mean_ms': round(statistics.fmean(timings), 3),
+            'p50_ms': round(cuts[49], 3),
+            'p95_ms': round(cuts[94], 3),
+            'p99_ms': round(cuts[98], 3),
+            'queries': statistics.fmean(queries),
+            'bytes': statistics.fmean(sizes),
+        }
+
+    @staticmethod
+    def wsgi_request(client, path):
+        response = client.get(path)
+        if response.streaming:
+            return response.status_code, sum(
+                len(chunk) for chunk in response.streaming_content
+            )
+        return response.status_code, len(response.content)
+
+    @staticmethod
+    @async_to_sync
+    async def asgi_request(client, path):
+        # Driven through async_to_sync so sync views run on this thread,
+        # where the query counting wrapper is installed
+        response = await client.get(path)
+        if response.streaming:
+            size = 0
+            async for chunk in response.streaming_content:
+                size += len(chunk)
+            return response.status_code, size
+        return response.status_code, len(response.content)
+
+    def meta(self, options):
+        return {
+            'created_at': datetime.datetime.now(
+                datetime.timezone.utc
+            ).isoformat(),
+            'runner': options['runner'],
+            'requests': options['requests'],
+            'warmup': options['warmup'],
+            'cold': options['cold'],
+            'database': connection.vendor,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'rows': {
+                'equipment': Equipment.objects.count(),
+                'calibration_records': CalibrationRecord.objects.count(),
+                'maintenance_records': MaintenanceRecord.objects.count(),
+            },
+        }
+
+    def compare(self, results, baseline, options):
+        """Fail on p95 or query count regressions against ``baseline``."""
+        regressions = []
+        for path, result in results.items():
+            base = baseline.get(path)
+            if base is None:
+                continue
+            allowed = (
+                base['p95_ms'] * (1 + options['tolerance'])
+                + options['slack_ms']
+            )
+            if result['p95_ms'] > allowed:
+                regressions.append(
+                    f"{path}: p95 {result['p95_ms']:.2f} ms, baseline "
+                    f"{base['p95_ms']:.2f} ms"
+                )
+            if result['queries'] > base['queries']:
+                regressions.append(
+                    f"{path}: {result['queries']:.1f} queries, baseline "
+                    f"{base['queries']:.1f}"
+                )
+        if regressions:
+            for regression in regressions:
+                self.stderr.write(regression)
+            raise CommandError(
+                f'{len(regressions)} regression(s) against the baseline.'
+            )
+        self.stdout.write(self.style.SUCCESS('No regressions.'))
@@ -0,0 +1,201 @@
+# ============================================================================
+# File Path: backend/equipment/management/commands/benchmark_concurrency.py
+# Description: Throughput and memory of concurrent requests, WSGI and ASGI
+# ============================================================================
+
+import asyncio
+import statistics
+import threading
+import time
+import tracemalloc
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import quote
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient, Client
+
+from equipment.models import CalibrationRecord, Equipment
+
+# Endpoints measured by default; placeholders are filled from the data
+DEFAULT_ENDPOINTS = (
+    '/api/equipment/?page_size=100',
+    '/api/equipment/{equipment_id}/',
+    '/api/equipment/{equipment_id}/calibrations/',
+    '/api/dashboard/',
+    '/api/export/?type=equipment&location={location}',
+)
+
+RUNNERS = ('wsgi', 'asgi')
+
+
+class Command(BaseCommand):
+    help = (
+        'Send concurrent requests in process and report throughput, '
+        'latency and peak memory. The WSGI runner serves them with a fixed '
+        'number of worker threads, like sync workers; the ASGI runner keeps '
+        'every request in flight on one event loop. Start the command with '
+        'ASYNC_READ_VIEWS=true to measure the async views, and use '
+        '--chunk-delay to simulate slow clients of streamed responses.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--endpoint',
+            action='append',
+            dest='endpoints',
+            help='Endpoint to measure, repeatable (default: a standard set).'
+        )
+        parser.add_argument(
+            '--runner',
+            action='append',
+            dest='runners',
+            choices=RUNNERS,
+            help='Runner to measure, repeatable (default: both).'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=32,
+            help='Requests in flight at once (default: 32).'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='WSGI worker threads (default: 4).'
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=200,
+            help='Requests per endpoint and runner (default: 200).'
+        )
+        parser.add_argument(
+            '--chunk-delay',
+            type=float,
+            default=0.0,
+            help='Milliseconds a client takes to read each chunk of a '
+                 'streamed response (default: 0).'
+        )
+        parser.add_argument(
+            '--no-memory',
+            action='store_true',
+            help='Skip the second, memory-traced pass.'
+        )
+
+    def handle(self, *args, **options):
+        if min(options['concurrency'], options['workers']) < 1:
+            raise CommandError('--concurrency and --workers must be positive.')
+        if options['chunk_delay'] < 0:
+            raise CommandError('--chunk-delay must not be negative.')
+        if options['requests'] < options['concurrency']:
+            raise CommandError('--requests must be at least --concurrency.')
+        placeholders = self.placeholders()
+        paths = [
+            template.format(**placeholders)
+            for template in options['endpoints'] or DEFAULT_ENDPOINTS
+        ]
+        if settings.ASYNC_READ_VIEWS:
+            self.stdout.write('Async read views are enabled.')
+
+        self.stdout.write(
+            f"{'endpoint':<46} {'runner':<6} {'req/s':>8} {'p50 ms':>8} "
+            f"{'p95 ms':>8} {'peak MB':>8}"
+        )
+        for path in paths:
+            for runner in options['runners'] or RUNNERS:
+                run = self.run_asgi if runner == 'asgi' else self.run_wsgi
+                # Warm up caches and connections
+                run(path, options['concurrency'], options)
+                elapsed, timings = run(path, options['requests'], options)
+                peak = None
+                if not options['no_memory']:
+                    tracemalloc.start()
+                    run(path, options['requests'], options)
+                    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+                    tracemalloc.stop()
+                cuts = statistics.quantiles(timings, n=100, method='inclusive')
+                self.stdout.write(
+                    f'{path[:46]:<46} {runner:<6} '
+                    f'{len(timings) / elapsed:>8.1f} {cuts[49]:>8.2f} '
+                    f'{cuts[94]:>8.2f} '
+                    f"{'-' if peak is None else f'{peak:.1f}':>8}"
+                )
+
+    def placeholders(self):
+        """Return the values of endpoint placeholders, from existing data."""
+        equipment = (
+            CalibrationRecord.objects.order_by('-equipment_id')
+            .values_list('equipment_id', flat=True).first()
+        )
+        if equipment is None:
+            raise CommandError('No records to benchmark; run seed_fleet.')
+        location = (
+            Equipment.objects.filter(pk=equipment)
+            .values_list('location', flat=True).get()
+        )
+        return {'equipment_id': equipment, 'location': quote(location)}
+
+    def run_wsgi(self, path, count, options):
+        """Serve ``count`` requests with ``--workers`` threads.
+
+        ``--concurrency`` requests are submitted at once, so those beyond
+        the worker count wait for a free worker, and their latency includes
+        the wait.
+        """
+        local = threading.local()
+        delay = options['chunk_delay'] / 1000
+
+        def request(submitted):
+            if not hasattr(local, 'client'):
+                local.client = Client()
+            response = local.client.get(path)
+            _check(path, response)
+            if response.streaming:
+                # A sync worker is held while the client reads
+                for _ in response.streaming_content:
+                    time.sleep(delay)
+            return (time.perf_counter() - submitted) * 1000
+
+        timings = []
+        with ThreadPoolExecutor(options['workers']) as pool:
+            start = time.perf_counter()
+            pending = set()
+            for _ in range(count):
+                if len(pending) >= options['concurrency']:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    timings.extend(future.result() for future in done)
+                pending.add(pool.submit(request, time.perf_counter()))
+            timings.extend(future.result() for future in pending)
+            return time.perf_counter() - start, timings
+
+    @async_to_sync
+    async def run_asgi(self, path, count, options):
+        """Serve ``count`` requests, ``--concurrency`` of them in flight."""
+        client = AsyncClient()
+        delay = options['chunk_delay'] / 1000
+        timings = []
+        remaining = iter(range(count))
+
+        async def worker():
+            for _ in remaining:
+                start = time.perf_counter()
+                response = await client.get(path)
+                _check(path, response)
+                if response.streaming:
+                    async for _ in response.streaming_content:
+                        await asyncio.sleep(delay)
+                timings.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            worker() for _ in range(options['concurrency'])
+        ))
+        return time.perf_counter() - start, timings
+
+
+def _check(path, response):
+    if response.status_code != 200:
+        raise CommandError(f'{path} returned {response.status_code}')
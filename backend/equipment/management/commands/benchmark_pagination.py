@@ -0,0 +1,106 @@
+# ============================================================================
+# File Path: backend/equipment/management/commands/benchmark_pagination.py
+# Description: Compare page-number and keyset pagination latency by depth
+# ============================================================================
+
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client
+
+from equipment.models import CalibrationRecord
+from equipment.pagination import KeysetPagination
+from equipment.seeding import seed_equipment
+
+ENDPOINT = '/api/calibration-records/'
+
+
+class Rollback(Exception):
+    """Raised to discard the seeded data once the benchmark is done."""
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure calibration record list latency at increasing page depths '
+        'with page-number and keyset pagination.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--equipment',
+            type=int,
+            default=20000,
+            help='Equipment rows to seed; each gets --records records.'
+        )
+        parser.add_argument('--records', type=int, default=5)
+        parser.add_argument('--page-size', type=int, default=10)
+        parser.add_argument(
+            '--pages',
+            type=int,
+            nargs='+',
+            default=[1, 10, 100, 1000, 10000],
+            help='Page numbers to measure.'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Requests per measurement; the median is reported.'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                seed_equipment(
+                    options['equipment'],
+                    options['records'],
+                    prefix='PAGINATION-BENCH'
+                )
+                self.run(options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, options):
+        client = Client()
+        page_size = options['page_size']
+        total = CalibrationRecord.objects.count()
+        self.stdout.write(f'{total} calibration records, page size {page_size}')
+        self.stdout.write(f"{'page':>8} {'page-number ms':>16} {'keyset ms':>12}")
+
+        for page in options['pages']:
+            offset = (page - 1) * page_size
+            if offset >= total:
+                raise CommandError(f'Page {page} is past the end of the data.')
+
+            page_url = f'{ENDPOINT}?page={page}&page_size={page_size}'
+            cursor = self.cursor_before(offset)
+            keyset_url = f'{ENDPOINT}?cursor={cursor}&page_size={page_size}'
+
+            page_ms = self.measure(client, page_url, options['repeat'])
+            keyset_ms = self.measure(client, keyset_url, options['repeat'])
+            self.stdout.write(f'{page:>8} {page_ms:>16.2f} {keyset_ms:>12.2f}')
+
+    @staticmethod
+    def cursor_before(offset):
+        """Return the keyset cursor that starts a page at ``offset``."""
+        if offset == 0:
+            return ''
+        paginator = KeysetPagination()
+        queryset = CalibrationRecord.objects.all()
+        paginator.ordering = paginator.get_ordering(queryset)
+        row = queryset.order_by(*paginator.get_order_by())[offset - 1]
+        return paginator.encode_cursor(row)
+
+    @staticmethod
+    def measure(client, url, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            response = client.get(url)
+            timings.append((time.perf_counter() - start) * 1000)
+            if response.status_code != 200:
+                raise CommandError(f'{url} returned {response.status_code}')
+        return statistics.median(timings)
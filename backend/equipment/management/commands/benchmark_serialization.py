@@ -0,0 +1,98 @@
+# ============================================================================
+# File Path: backend/equipment/management/commands/benchmark_serialization.py
+# Description: Compare the model and row serialization paths of the list
+# ============================================================================
+
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from equipment.models import Equipment
+from equipment.renderers import ORJSONRenderer
+from equipment.serializers import (
+    EquipmentListSerializer, equipment_list_rows,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Serialize and render the equipment list through model instances '
+        'and through values() rows, check both produce the same bytes and '
+        'report rows per second. Run against a database filled by '
+        'seed_fleet.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=1000,
+            help='Equipment rows per run (default: 1000).'
+        )
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=5,
+            help='Measured runs per path; the median is reported '
+                 '(default: 5).'
+        )
+
+    def handle(self, *args, **options):
+        if options['rows'] < 1 or options['runs'] < 1:
+            raise CommandError('--rows and --runs must be positive.')
+        queryset = (
+            Equipment.objects.with_effective_status()
+            .order_by('pk')[:options['rows']]
+        )
+
+        def model_path():
+            # Fetching and serializing, timed separately
+            instances = list(queryset.all())
+            yield
+            data = EquipmentListSerializer(instances, many=True).data
+            yield JSONRenderer().render(data)
+
+        def row_path():
+            rows = equipment_list_rows()
+            values = list(rows.project(queryset.all()))
+            yield
+            yield ORJSONRenderer().render(rows.to_representation(values))
+
+        expected = list(model_path())[-1]
+        if list(row_path())[-1] != expected:
+            raise CommandError('The two paths rendered different output.')
+        count = queryset.count()
+        self.stdout.write(
+            f'{count} rows, {len(expected)} bytes, identical output'
+        )
+        self.stdout.write(
+            f"{'path':<6} {'fetch ms':>9} {'render ms':>10} "
+            f"{'render rows/s':>14} {'total rows/s':>13}"
+        )
+
+        timings = {}
+        for name, path in (('model', model_path), ('rows', row_path)):
+            fetches, renders = [], []
+            for _ in range(options['runs']):
+                steps = path()
+                start = time.perf_counter()
+                next(steps)
+                fetched = time.perf_counter()
+                next(steps)
+                fetches.append(fetched - start)
+                renders.append(time.perf_counter() - fetched)
+            fetch = statistics.median(fetches)
+            render = statistics.median(renders)
+            timings[name] = (render, fetch + render)
+            self.stdout.write(
+                f'{name:<6} {fetch * 1000:>9.2f} {render * 1000:>10.2f} '
+                f'{count / render:>14.0f} {count / (fetch + render):>13.0f}'
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"Speedup: {timings['model'][0] / timings['rows'][0]:.1f}x "
+            f"serializing and rendering, "
+            f"{timings['model'][1] / timings['rows'][1]:.1f}x including "
+            f"the query"
+        ))
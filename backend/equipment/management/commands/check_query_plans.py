@@ -0,0 +1,68 @@
+# ============================================================================
+# File Path: backend/equipment/management/commands/check_query_plans.py
+# Description: Query plan regression check for the equipment API
+# ============================================================================
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from equipment.query_plans import QueryPlanError, check_requests
+from equipment.seeding import seed_equipment
+
+
+class Rollback(Exception):
+    """Raised to discard the seeded data once the check is done."""
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed a large temporary dataset, EXPLAIN every query issued by the '
+        'equipment API endpoints and fail if a sequential scan or a sort '
+        'step shows up in any plan.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--equipment',
+            type=int,
+            default=20000,
+            help='Number of equipment rows to seed (default: 20000).'
+        )
+        parser.add_argument(
+            '--records',
+            type=int,
+            default=5,
+            help='Calibration and maintenance records per equipment.'
+        )
+        parser.add_argument(
+            '--no-seed',
+            action='store_true',
+            help='Check against the existing data instead of seeding.'
+        )
+
+    def handle(self, *args, **options):
+        failures = []
+        try:
+            with transaction.atomic():
+                if not options['no_seed']:
+                    seed_equipment(
+                        options['equipment'],
+                        options['records'],
+                        prefix='PLAN-CHECK'
+                    )
+                failures = check_requests(progress=self.progress)
+                # Seeded rows are never committed
+                raise Rollback
+        except Rollback:
+            pass
+        except QueryPlanError as exc:
+            raise CommandError(str(exc))
+
+        if failures:
+            for path, sql, problems in failures:
+                self.stderr.write(f'{path}: {", ".join(problems)}\n  {sql}')
+            raise CommandError(f'{len(failures)} query plan(s) regressed.')
+        self.stdout.write(self.style.SUCCESS('All query plans use indexes.'))
+
+    def progress(self, path, queries):
+        self.stdout.write(f'{path}: {queries} queries checked')
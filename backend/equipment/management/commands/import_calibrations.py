@@ -0,0 +1,93 @@
+# ============================================================================
+# File Path: backend/equipment/management/commands/import_calibrations.py
+# Description: Bulk import calibration records from a CSV file
+# ============================================================================
+
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from equipment.importers import CalibrationImporter
+
+
+class Command(BaseCommand):
+    help = (
+        'Import calibration records from a CSV file in chunks. Equipment is '
+        'matched by serial number; each chunk is committed separately and '
+        'progress can be checkpointed to resume an interrupted import.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV file to import.')
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Rows per transaction (default: 1000).'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate every row and report errors without writing.'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            help='File recording the last committed chunk.'
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Skip chunks already committed according to --checkpoint.'
+        )
+
+    def handle(self, *args, **options):
+        checkpoint = options['checkpoint']
+        if options['resume'] and not checkpoint:
+            raise CommandError('--resume requires --checkpoint.')
+
+        start_chunk = 0
+        if options['resume'] and os.path.exists(checkpoint):
+            with open(checkpoint) as handle:
+                state = json.load(handle)
+            if state.get('path') != os.path.abspath(options['path']):
+                raise CommandError(
+                    f'Checkpoint {checkpoint} belongs to {state.get("path")}.'
+                )
+            if state.get('chunk_size') != options['chunk_size']:
+                raise CommandError(
+                    f"Checkpoint was written with --chunk-size "
+                    f"{state.get('chunk_size')}."
+                )
+            start_chunk = state['last_committed_chunk'] + 1
+            self.stdout.write(f'Resuming at chunk {start_chunk}.')
+
+        def on_chunk(index, report):
+            self.stdout.write(
+                f"Chunk {index}: {report['rows']} rows, "
+                f"{report['created']} created, {report['failed']} failed"
+            )
+            if checkpoint and not options['dry_run']:
+                with open(checkpoint, 'w') as handle:
+                    json.dump({
+                        'path': os.path.abspath(options['path']),
+                        'last_committed_chunk': index,
+                        'chunk_size': options['chunk_size'],
+                    }, handle)
+
+        importer = CalibrationImporter(
+            chunk_size=options['chunk_size'], dry_run=options['dry_run']
+        )
+        try:
+            with open(options['path'], newline='', encoding='utf-8-sig') as f:
+                report = importer.run(f, start_chunk, on_chunk)
+        except OSError as exc:
+            raise CommandError(str(exc))
+
+        for error in report['errors']:
+            self.stderr.write(f"Row {error['row']}: {error['errors']}")
+        verb = 'would be created' if options['dry_run'] else 'created'
+        self.stdout.write(self.style.SUCCESS(
+            f"{report['rows']} rows processed, {report['created']} records "
+            f"{verb}, {report['failed']} rows failed."
+        ))
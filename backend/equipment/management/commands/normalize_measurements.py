@@ -0,0 +1,82 @@
+# ============================================================================
+# File Path: backend/equipment/management/commands/normalize_measurements.py
+# Description: Validate stored measurement JSON against the current schemas
+# ============================================================================
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from equipment.models import CalibrationRecord
+from equipment.schemas import MEASUREMENT_COLUMNS, validate_measurements
+
+# Invalid records listed in the output; the count is always complete
+MAX_REPORTED = 100
+
+
+class Command(BaseCommand):
+    help = (
+        'Validate the measurement_points and results of every calibration '
+        'record against its category schema and rewrite valid records in '
+        'canonical form. Invalid records are listed and left unchanged.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Calibration records checked per transaction.'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report invalid records.'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be positive.')
+
+        records = CalibrationRecord.objects.select_related(
+            'equipment'
+        ).only(
+            'id', 'schema_version', 'equipment__category',
+            *MEASUREMENT_COLUMNS
+        ).order_by('pk')
+        last_pk = 0
+        checked = normalized = invalid = 0
+        while True:
+            batch = list(records.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            valid = []
+            for record in batch:
+                version, values, errors = validate_measurements(
+                    record.equipment.category,
+                    *(getattr(record, field) for field in MEASUREMENT_COLUMNS)
+                )
+                if errors:
+                    invalid += 1
+                    if invalid <= MAX_REPORTED:
+                        self.stderr.write(f'Record {record.pk}: {errors}')
+                    continue
+                for field, value in values.items():
+                    setattr(record, field, value)
+                record.schema_version = version
+                valid.append(record)
+            if valid and not options['dry_run']:
+                # Normalizing keeps the values, so the derived measurement
+                # points stay valid and no signals are needed
+                with transaction.atomic():
+                    CalibrationRecord.objects.bulk_update(
+                        valid, [*MEASUREMENT_COLUMNS, 'schema_version']
+                    )
+                normalized += len(valid)
+            checked += len(batch)
+            last_pk = batch[-1].pk
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Checked {checked} calibration records: {normalized} '
+            f'normalized, {invalid} invalid.'
+        ))
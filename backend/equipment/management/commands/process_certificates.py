@@ -0,0 +1,55 @@
+# ============================================================================
+# File Path: backend/equipment/management/commands/process_certificates.py
+# Description: Run the certificate processing pipeline over queued uploads
+# ============================================================================
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from equipment.processing import describe, process_pending, run_forever
+from equipment.uploads import expire_uploads
+
+
+class Command(BaseCommand):
+    help = (
+        'Scan, extract text from and thumbnail newly uploaded certificates '
+        'in a pool of worker threads, and discard abandoned uploads.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=settings.CERTIFICATE_PROCESSING_WORKERS,
+            help='Worker threads processing certificates concurrently.'
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running and poll the queue every --interval seconds.'
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=settings.CERTIFICATE_PROCESSING_INTERVAL,
+            help='Seconds between polls with --loop.'
+        )
+
+    def handle(self, *args, **options):
+        if options['loop']:
+            self.stdout.write(
+                f"Processing certificates every {options['interval']} "
+                f"seconds with {options['workers']} workers."
+            )
+            run_forever(
+                options['interval'], workers=options['workers'],
+                stdout=self.stdout
+            )
+            return
+
+        outcomes = process_pending(workers=options['workers'])
+        expired = expire_uploads()
+        self.stdout.write(self.style.SUCCESS(
+            f'Certificates: {describe(outcomes)}; '
+            f'{expired} abandoned uploads removed.'
+        ))
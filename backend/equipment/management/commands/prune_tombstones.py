@@ -0,0 +1,36 @@
+# ============================================================================
+# File Path: backend/equipment/management/commands/prune_tombstones.py
+# Description: Delete sync feed tombstones past their retention period
+# ============================================================================
+
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from equipment.sync import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete tombstones of deleted objects older than the retention '
+        'period. Sync tokens from before the pruned tombstones expire.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.SYNC_TOMBSTONE_RETENTION_DAYS,
+            help='Keep tombstones of the last this many days.'
+        )
+
+    def handle(self, *args, **options):
+        if options['days'] < 1:
+            raise CommandError('--days must be at least 1.')
+        before = timezone.now() - datetime.timedelta(days=options['days'])
+        deleted = prune_tombstones(before)
+        self.stdout.write(
+            self.style.SUCCESS(f'Deleted {deleted} tombstones.')
+        )
@@ -0,0 +1,52 @@
+# ============================================================================
+# File Path: backend/equipment/management/commands/rebuild_equipment_summaries.py
+# Description: Recompute the denormalized equipment record summaries
+# ============================================================================
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from equipment.cache import bump_data_version
+from equipment.models import Equipment
+from equipment.summaries import refresh_summaries
+
+
+class Command(BaseCommand):
+    help = (
+        'Recompute the calibration and maintenance summaries stored on '
+        'Equipment from their records, one set-based UPDATE per batch.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=10000,
+            help='Equipment ids covered by each UPDATE and transaction.'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be positive.')
+
+        now = timezone.now()
+        bounds = Equipment.objects.aggregate(low=Min('pk'), high=Max('pk'))
+        updated = 0
+        if bounds['low'] is not None:
+            # Ranges of the primary key keep each batch a short transaction
+            for start in range(bounds['low'], bounds['high'] + 1, batch_size):
+                with transaction.atomic():
+                    updated += refresh_summaries(
+                        Equipment.objects.filter(
+                            pk__gte=start, pk__lt=start + batch_size
+                        ),
+                        now
+                    )
+        if updated:
+            bump_data_version()
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebuilt summaries of {updated} equipment.')
+        )
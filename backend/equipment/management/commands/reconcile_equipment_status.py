@@ -0,0 +1,56 @@
+# ============================================================================
+# File Path: backend/equipment/management/commands/reconcile_equipment_status.py
+# Description: Backfill the stored equipment status from calibration dates
+# ============================================================================
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F
+from django.utils import timezone
+
+from equipment.cache import bump_data_version
+from equipment.models import MANUAL_STATUSES, Equipment
+
+
+class Command(BaseCommand):
+    help = (
+        'Reconcile the stored Equipment.status column with the status '
+        'derived from calibration dates, in a single UPDATE.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report stale rows without updating them.'
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        queryset = Equipment.objects.all()
+
+        if options['dry_run']:
+            transitions = (
+                queryset
+                .exclude(status__in=MANUAL_STATUSES)
+                .with_effective_status(now)
+                .exclude(status=F('effective_status'))
+                .order_by()
+                .values('status', 'effective_status')
+                .annotate(count=Count('pk'))
+            )
+            total = 0
+            for row in transitions:
+                total += row['count']
+                self.stdout.write(
+                    f"{row['status']} -> {row['effective_status']}: "
+                    f"{row['count']}"
+                )
+            self.stdout.write(f'{total} equipment would be updated.')
+            return
+
+        updated = queryset.reconcile_status(now)
+        if updated:
+            bump_data_version()
+        self.stdout.write(
+            self.style.SUCCESS(f'Updated status of {updated} equipment.')
+        )
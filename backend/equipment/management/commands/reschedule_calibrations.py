@@ -0,0 +1,51 @@
+# ============================================================================
+# File Path: backend/equipment/management/commands/reschedule_calibrations.py
+# Description: Recompute next calibration dates for a set of equipment
+# ============================================================================
+
+from django.core.management.base import BaseCommand, CommandError
+
+from equipment.models import Equipment
+from equipment.scheduling import INTERVAL_TYPES, reschedule
+
+
+class Command(BaseCommand):
+    help = (
+        'Recompute next_calibration_date from last_calibration_date and the '
+        'calibration interval, optionally changing the interval policy of '
+        'the selected equipment first. Runs as set-based updates.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--category', help='Only this category.')
+        parser.add_argument('--location', help='Only this location.')
+        parser.add_argument(
+            '--interval-type',
+            choices=INTERVAL_TYPES,
+            help='New calibration interval type for the selection.'
+        )
+        parser.add_argument(
+            '--interval-value',
+            type=int,
+            help='New calibration interval value for the selection.'
+        )
+
+    def handle(self, *args, **options):
+        if options['interval_value'] is not None:
+            if options['interval_value'] < 1:
+                raise CommandError('--interval-value must be at least 1.')
+
+        queryset = Equipment.objects.all()
+        if options['category']:
+            queryset = queryset.filter(category=options['category'])
+        if options['location']:
+            queryset = queryset.filter(location=options['location'])
+
+        count = reschedule(
+            queryset,
+            interval_type=options['interval_type'],
+            interval_value=options['interval_value']
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f'Rescheduled {count} equipment.')
+        )
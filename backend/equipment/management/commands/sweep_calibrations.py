@@ -0,0 +1,49 @@
+# ============================================================================
+# File Path: backend/equipment/management/commands/sweep_calibrations.py
+# Description: Reconcile due/overdue equipment and email calibration digests
+# ============================================================================
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from equipment.sweeper import run_forever, sweep
+
+
+class Command(BaseCommand):
+    help = (
+        'Update the status of equipment whose calibration became due or '
+        'overdue since the last sweep and email one digest per owner.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--no-email',
+            action='store_true',
+            help='Update statuses without sending digests.'
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running and sweep every --interval seconds.'
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=settings.CALIBRATION_SWEEP_INTERVAL,
+            help='Seconds between sweeps with --loop.'
+        )
+
+    def handle(self, *args, **options):
+        notify = not options['no_email']
+        if options['loop']:
+            self.stdout.write(
+                f"Sweeping every {options['interval']} seconds."
+            )
+            run_forever(options['interval'], notify=notify, stdout=self.stdout)
+            return
+
+        transitions, sent = sweep(notify=notify)
+        self.stdout.write(self.style.SUCCESS(
+            f'Updated status of {transitions} equipment, '
+            f'sent {sent} digests.'
+        ))
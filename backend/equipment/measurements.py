@@ -0,0 +1,157 @@
+# ============================================================================
+# File Path: backend/equipment/measurements.py
+# Description: Typed measurement points derived from calibration record JSON
+# ============================================================================
+
+import datetime
+import math
+
+from .models import MeasurementPoint
+
+EPOCH = datetime.date(1970, 1, 1)
+
+# Accepted keys for each column, in order of preference. Calibration
+# software names these differently, so the common spellings are accepted.
+POINT_KEYS = ('point', 'name', 'label', 'id')
+NOMINAL_KEYS = ('nominal', 'setpoint', 'reference', 'expected', 'target')
+MEASURED_KEYS = ('measured', 'reading', 'actual', 'as_left', 'value')
+ERROR_KEYS = ('error', 'deviation')
+TOLERANCE_KEYS = ('tolerance', 'tol', 'limit')
+UNCERTAINTY_KEYS = ('uncertainty', 'expanded_uncertainty', 'u')
+UNIT_KEYS = ('unit', 'units')
+PASSED_KEYS = ('passed', 'pass', 'result', 'status')
+
+PASS_VALUES = {'pass', 'passed', 'ok', 'in tolerance', 'true', 'yes'}
+FAIL_VALUES = {'fail', 'failed', 'out of tolerance', 'false', 'no'}
+
+
+def build_points(record):
+    """Return unsaved ``MeasurementPoint`` rows for ``record``.
+
+    ``measurement_points`` entries define the points and ``results``
+    entries, matched by point name or else by position, add the readings.
+    Either list may also carry every column on its own; ``results`` may be
+    a mapping of point name to reading. The error defaults to measured
+    minus nominal and the verdict to whether it is within tolerance.
+    """
+    entries = _merge(record.measurement_points, record.results)
+    day = (record.calibration_date - EPOCH).days
+    points = []
+    for position, entry in enumerate(entries):
+        nominal = _number(entry, NOMINAL_KEYS)
+        measured = _number(entry, MEASURED_KEYS)
+        if nominal is None and measured is None:
+            continue
+        error = _number(entry, ERROR_KEYS)
+        if error is None and None not in (nominal, measured):
+            error = measured - nominal
+        tolerance = _number(entry, TOLERANCE_KEYS)
+        if tolerance is not None:
+            tolerance = abs(tolerance)
+        passed = _verdict(entry)
+        if passed is None and None not in (error, tolerance):
+            passed = abs(error) <= tolerance
+        points.append(MeasurementPoint(
+            record_id=record.pk,
+            equipment_id=record.equipment_id,
+            calibration_date=record.calibration_date,
+            calibration_day=day,
+            position=position,
+            point=str(_value(entry, POINT_KEYS) or '')[:100],
+            nominal=nominal,
+            measured=measured,
+            error=error,
+            tolerance=tolerance,
+            uncertainty=_number(entry, UNCERTAINTY_KEYS),
+            unit=str(_value(entry, UNIT_KEYS) or '')[:20],
+            passed=passed,
+        ))
+    return points
+
+
+def sync_points(records):
+    """Replace the measurement points of saved ``records``.
+
+    Returns the number of points written.
+    """
+    records = list(records)
+    MeasurementPoint.objects.filter(
+        record__in=[record.pk for record in records]
+    ).delete()
+    points = [point for record in records for point in build_points(record)]
+    MeasurementPoint.objects.bulk_create(points, batch_size=1000)
+    return len(points)
+
+
+def _merge(measurement_points, results):
+    points = [_entry(item) for item in _items(measurement_points)]
+    readings = [_entry(item) for item in _items(results)]
+    by_name = {}
+    for entry in points:
+        name = _value(entry, POINT_KEYS)
+        if name is not None:
+            by_name.setdefault(str(name), entry)
+    for position, reading in enumerate(readings):
+        name = _value(reading, POINT_KEYS)
+        if name is not None and str(name) in by_name:
+            by_name[str(name)].update(reading)
+        elif name is None and position < len(points):
+            points[position].update(reading)
+        else:
+            points.append(reading)
+    return points
+
+
+def _items(value):
+    if isinstance(value, dict):
+        # Mapping of point name to a reading or to its columns
+        return [
+            {'point': name, **item} if isinstance(item, dict)
+            else {'point': name, 'measured': item}
+            for name, item in value.items()
+        ]
+    if isinstance(value, list):
+        return value
+    return []
+
+
+def _entry(item):
+    if isinstance(item, dict):
+        return {str(key).lower(): value for key, value in item.items()}
+    # Bare numbers are readings
+    return {'measured': item}
+
+
+def _value(entry, keys):
+    for key in keys:
+        value = entry.get(key)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def _number(entry, keys):
+    for key in keys:
+        value = entry.get(key)
+        if isinstance(value, bool) or value in (None, ''):
+            continue
+        try:
+            number = float(str(value).strip().lstrip('±+'))
+        except ValueError:
+            continue
+        if math.isfinite(number):
+            return number
+    return None
+
+
+def _verdict(entry):
+    value = _value(entry, PASSED_KEYS)
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        value = value.strip().lower()
+        if value in PASS_VALUES:
+            return True
+        if value in FAIL_VALUES:
+            return False
+    return None
@@ -0,0 +1,94 @@
+# Generated by Django 5.0.2 on 2026-10-18 09:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0004_alter_equipment_last_calibration_date_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="calibrationrecord",
+            options={
+                "ordering": ["-calibration_date", "-id"],
+                "verbose_name_plural": "Calibration Records",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="equipment",
+            options={"ordering": ["name", "id"], "verbose_name_plural": "Equipment"},
+        ),
+        migrations.AlterModelOptions(
+            name="maintenancerecord",
+            options={
+                "ordering": ["-maintenance_date", "-id"],
+                "verbose_name_plural": "Maintenance Records",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="calibrationrecord",
+            index=models.Index(
+                fields=["equipment", "-calibration_date", "-id"],
+                name="calrec_equipment_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="calibrationrecord",
+            index=models.Index(
+                fields=["-calibration_date", "-id"], name="calrec_date_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="equipment",
+            index=models.Index(fields=["name", "id"], name="equipment_name_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="equipment",
+            index=models.Index(
+                fields=["status", "next_calibration_date"],
+                name="equipment_status_next_cal_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="equipment",
+            index=models.Index(
+                condition=models.Q(
+                    ("status__in", ("retired", "maintenance")), _negated=True
+                ),
+                fields=["next_calibration_date"],
+                name="equipment_next_cal_dated_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="equipment",
+            index=models.Index(
+                condition=models.Q(("last_calibration_date__isnull", True)),
+                fields=["name"],
+                name="equipment_uncalibrated_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="equipment",
+            index=models.Index(
+                fields=["category", "location"], name="equipment_category_loc_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="maintenancerecord",
+            index=models.Index(
+                fields=["equipment", "-maintenance_date", "-id"],
+                name="mntrec_equipment_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="maintenancerecord",
+            index=models.Index(
+                fields=["-maintenance_date", "-id"], name="mntrec_date_id_idx"
+            ),
+        ),
+    ]
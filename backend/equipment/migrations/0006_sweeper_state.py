@@ -0,0 +1,35 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0005_equipment_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SweeperState",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("swept_until", models.DateTimeField(blank=True, null=True)),
+                ("transitions", models.IntegerField(default=0)),
+                ("digests_sent", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Sweeper State",
+                "verbose_name_plural": "Sweeper State",
+            },
+        ),
+    ]
@@ -0,0 +1,149 @@
+# Search indexes: GIN tsvector and trigram expression indexes on PostgreSQL,
+# trigger-maintained FTS5 tables on SQLite. The DDL is frozen at this
+# migration's schema; equipment.search builds the indexes of the current one.
+
+from django.db import migrations
+
+POSTGRESQL_INDEXES = {
+    "equipment_search_idx": (
+        'CREATE INDEX IF NOT EXISTS "equipment_search_idx" '
+        'ON "equipment_equipment" USING gin (('
+        "(setweight(to_tsvector('simple'::regconfig, "
+        """COALESCE("name", '') || ' ' || COALESCE("serial_number", '')), """
+        "'A') || setweight(to_tsvector('simple'::regconfig, "
+        """COALESCE("model_number", '') || ' ' || """
+        """COALESCE("manufacturer", '') || ' ' || """
+        """COALESCE("location", '') || ' ' || COALESCE("notes", '')), """
+        "'B'))))"
+    ),
+    "equipment_trgm_idx": (
+        'CREATE INDEX IF NOT EXISTS "equipment_trgm_idx" '
+        'ON "equipment_equipment" USING gin (('
+        """(COALESCE("name", '') || ' ' || COALESCE("serial_number", '') """
+        """|| ' ' || COALESCE("model_number", '') || ' ' || """
+        """COALESCE("manufacturer", '') || ' ' || COALESCE("location", ''))"""
+        ") gin_trgm_ops)"
+    ),
+    "calrec_search_idx": (
+        'CREATE INDEX IF NOT EXISTS "calrec_search_idx" '
+        'ON "equipment_calibrationrecord" USING gin (('
+        "(setweight(to_tsvector('simple'::regconfig, "
+        """COALESCE("certificate_number", '')), 'A') || """
+        "setweight(to_tsvector('simple'::regconfig, "
+        """COALESCE("calibrated_by", '') || ' ' || """
+        """COALESCE("calibration_standard", '') || ' ' || """
+        """COALESCE("notes", '')), 'B'))))"""
+    ),
+    "calrec_trgm_idx": (
+        'CREATE INDEX IF NOT EXISTS "calrec_trgm_idx" '
+        'ON "equipment_calibrationrecord" USING gin (('
+        """(COALESCE("certificate_number", '') || ' ' || """
+        """COALESCE("calibrated_by", ''))) gin_trgm_ops)"""
+    ),
+    "mntrec_search_idx": (
+        'CREATE INDEX IF NOT EXISTS "mntrec_search_idx" '
+        'ON "equipment_maintenancerecord" USING gin (('
+        "(setweight(to_tsvector('simple'::regconfig, "
+        """COALESCE("description", '')), 'A') || """
+        "setweight(to_tsvector('simple'::regconfig, "
+        """COALESCE("performed_by", '') || ' ' || """
+        """COALESCE("parts_replaced", '') || ' ' || """
+        """COALESCE("notes", '')), 'B'))))"""
+    ),
+    "mntrec_trgm_idx": (
+        'CREATE INDEX IF NOT EXISTS "mntrec_trgm_idx" '
+        'ON "equipment_maintenancerecord" USING gin (('
+        """(COALESCE("description", '') || ' ' || """
+        """COALESCE("performed_by", ''))) gin_trgm_ops)"""
+    ),
+}
+
+# Indexed table -> columns of its FTS5 table
+SQLITE_COLUMNS = {
+    "equipment_equipment": (
+        "name",
+        "serial_number",
+        "model_number",
+        "manufacturer",
+        "location",
+        "notes",
+    ),
+    "equipment_calibrationrecord": (
+        "certificate_number",
+        "calibrated_by",
+        "calibration_standard",
+        "notes",
+    ),
+    "equipment_maintenancerecord": (
+        "description",
+        "performed_by",
+        "parts_replaced",
+        "notes",
+    ),
+}
+
+
+def fts_statements(content, columns):
+    """Return the DDL of the FTS5 table and triggers indexing ``content``."""
+    table = f"{content}_search"
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{column}" for column in columns)
+    old = ", ".join(f"old.{column}" for column in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5({names}, "
+        f"content='{content}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON {content} "
+        f"BEGIN INSERT INTO {table}(rowid, {names}) VALUES (new.id, {new}); "
+        f"END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON {content} "
+        f"BEGIN INSERT INTO {table}({table}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE ON {content} "
+        f"BEGIN INSERT INTO {table}({table}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {table}(rowid, {names}) VALUES (new.id, {new}); END",
+        f"INSERT INTO {table}({table}) VALUES ('rebuild')",
+    ]
+
+
+def fts_drop_statements(content):
+    table = f"{content}_search"
+    triggers = [f"{table}_{suffix}" for suffix in ("ai", "ad", "au")]
+    return [
+        *(f"DROP TRIGGER IF EXISTS {trigger}" for trigger in triggers),
+        f"DROP TABLE IF EXISTS {table}",
+    ]
+
+
+def install(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for sql in POSTGRESQL_INDEXES.values():
+            schema_editor.execute(sql)
+    elif vendor == "sqlite":
+        for content, columns in SQLITE_COLUMNS.items():
+            for sql in fts_statements(content, columns):
+                schema_editor.execute(sql)
+
+
+def uninstall(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        for name in POSTGRESQL_INDEXES:
+            schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+    elif vendor == "sqlite":
+        for content in SQLITE_COLUMNS:
+            for sql in fts_drop_statements(content):
+                schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0006_sweeper_state"),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
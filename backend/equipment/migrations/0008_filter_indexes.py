@@ -0,0 +1,46 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0007_search_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="equipment",
+            index=models.Index(
+                fields=["category", "name", "id"], name="equipment_category_name_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="equipment",
+            index=models.Index(
+                fields=["location", "name", "id"], name="equipment_location_name_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="equipment",
+            index=models.Index(
+                fields=["manufacturer", "name", "id"], name="equipment_manufacturer_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="equipment",
+            index=models.Index(
+                fields=["next_calibration_date", "id"], name="equipment_next_cal_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="maintenancerecord",
+            index=models.Index(
+                fields=["maintenance_type", "-maintenance_date", "-id"],
+                name="mntrec_type_date_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill(apps, schema_editor):
+    from equipment.summaries import refresh_summaries
+
+    refresh_summaries(apps.get_model("equipment", "Equipment").objects.all())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0008_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="equipment",
+            name="calibration_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="equipment",
+            name="latest_calibration",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="equipment.calibrationrecord",
+            ),
+        ),
+        migrations.AddField(
+            model_name="equipment",
+            name="latest_calibration_date",
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="equipment",
+            name="latest_certificate_number",
+            field=models.CharField(blank=True, editable=False, max_length=100),
+        ),
+        migrations.AddField(
+            model_name="equipment",
+            name="latest_maintenance_date",
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="equipment",
+            name="maintenance_cost_total",
+            field=models.DecimalField(
+                decimal_places=2, default=0, editable=False, max_digits=12
+            ),
+        ),
+        migrations.AddField(
+            model_name="equipment",
+            name="maintenance_cost_year",
+            field=models.IntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="equipment",
+            name="maintenance_cost_ytd",
+            field=models.DecimalField(
+                decimal_places=2, default=0, editable=False, max_digits=12
+            ),
+        ),
+        migrations.AddField(
+            model_name="equipment",
+            name="maintenance_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,264 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:33
+
+import django.core.validators
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+# certificate_text joins the calibration record search document. The DDL
+# is frozen at this migration's schema, like 0007's.
+TABLE = "equipment_calibrationrecord"
+
+POSTGRESQL_SEARCH_INDEX = (
+    'CREATE INDEX IF NOT EXISTS "calrec_search_idx" '
+    'ON "equipment_calibrationrecord" USING gin (('
+    "(setweight(to_tsvector('simple'::regconfig, "
+    """COALESCE("certificate_number", '')), 'A') || """
+    "setweight(to_tsvector('simple'::regconfig, "
+    """COALESCE("calibrated_by", '') || ' ' || """
+    """COALESCE("calibration_standard", '') || ' ' || """
+    """COALESCE("notes", '') || ' ' || """
+    """COALESCE("certificate_text", '')), 'B'))))"""
+)
+
+# The 0007 index, restored when migrating backwards
+PREVIOUS_POSTGRESQL_SEARCH_INDEX = (
+    'CREATE INDEX IF NOT EXISTS "calrec_search_idx" '
+    'ON "equipment_calibrationrecord" USING gin (('
+    "(setweight(to_tsvector('simple'::regconfig, "
+    """COALESCE("certificate_number", '')), 'A') || """
+    "setweight(to_tsvector('simple'::regconfig, "
+    """COALESCE("calibrated_by", '') || ' ' || """
+    """COALESCE("calibration_standard", '') || ' ' || """
+    """COALESCE("notes", '')), 'B'))))"""
+)
+
+SQLITE_COLUMNS = (
+    "certificate_number",
+    "calibrated_by",
+    "calibration_standard",
+    "notes",
+    "certificate_text",
+)
+PREVIOUS_SQLITE_COLUMNS = SQLITE_COLUMNS[:-1]
+
+
+def fts_statements(content, columns):
+    """Return the DDL of the FTS5 table and triggers indexing ``content``."""
+    table = f"{content}_search"
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{column}" for column in columns)
+    old = ", ".join(f"old.{column}" for column in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5({names}, "
+        f"content='{content}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON {content} "
+        f"BEGIN INSERT INTO {table}(rowid, {names}) VALUES (new.id, {new}); "
+        f"END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON {content} "
+        f"BEGIN INSERT INTO {table}({table}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE ON {content} "
+        f"BEGIN INSERT INTO {table}({table}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {table}(rowid, {names}) VALUES (new.id, {new}); END",
+        f"INSERT INTO {table}({table}) VALUES ('rebuild')",
+    ]
+
+
+def fts_drop_statements(content):
+    table = f"{content}_search"
+    triggers = [f"{table}_{suffix}" for suffix in ("ai", "ad", "au")]
+    return [
+        *(f"DROP TRIGGER IF EXISTS {trigger}" for trigger in triggers),
+        f"DROP TABLE IF EXISTS {table}",
+    ]
+
+
+def reindex(schema_editor, postgresql_index, sqlite_columns):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute('DROP INDEX IF EXISTS "calrec_search_idx"')
+        schema_editor.execute(postgresql_index)
+    elif vendor == "sqlite":
+        for sql in fts_drop_statements(TABLE):
+            schema_editor.execute(sql)
+        for sql in fts_statements(TABLE, sqlite_columns):
+            schema_editor.execute(sql)
+
+
+def reindex_calibration_records(apps, schema_editor):
+    reindex(schema_editor, POSTGRESQL_SEARCH_INDEX, SQLITE_COLUMNS)
+
+
+def restore_calibration_record_index(apps, schema_editor):
+    reindex(
+        schema_editor,
+        PREVIOUS_POSTGRESQL_SEARCH_INDEX,
+        PREVIOUS_SQLITE_COLUMNS,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0009_equipment_summaries"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="calibrationrecord",
+            name="certificate_text",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.CreateModel(
+            name="Certificate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sha256", models.CharField(max_length=64, unique=True)),
+                ("file", models.FileField(max_length=255, upload_to="certificates/")),
+                ("size", models.BigIntegerField()),
+                ("content_type", models.CharField(blank=True, max_length=100)),
+                ("original_name", models.CharField(blank=True, max_length=255)),
+                (
+                    "thumbnail",
+                    models.FileField(
+                        blank=True, max_length=255, upload_to="certificates/thumbnails/"
+                    ),
+                ),
+                ("text", models.TextField(blank=True)),
+                (
+                    "processing_status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("processing", "Processing"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                            ("rejected", "Rejected"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("processing_error", models.TextField(blank=True)),
+                ("processing_started_at", models.DateTimeField(blank=True, null=True)),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(
+                            ("processing_status__in", ["pending", "processing"])
+                        ),
+                        fields=["created_at"],
+                        name="certificate_queue_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddField(
+            model_name="calibrationrecord",
+            name="certificate",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="calibration_records",
+                to="equipment.certificate",
+            ),
+        ),
+        migrations.CreateModel(
+            name="CertificateUpload",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("filename", models.CharField(max_length=255)),
+                ("content_type", models.CharField(blank=True, max_length=100)),
+                (
+                    "size",
+                    models.BigIntegerField(
+                        validators=[django.core.validators.MinValueValidator(1)]
+                    ),
+                ),
+                ("sha256", models.CharField(blank=True, max_length=64)),
+                ("offset", models.BigIntegerField(default=0)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("uploading", "Uploading"),
+                            ("complete", "Complete"),
+                            ("failed", "Failed"),
+                        ],
+                        default="uploading",
+                        max_length=20,
+                    ),
+                ),
+                ("error", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "calibration_record",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="certificate_uploads",
+                        to="equipment.calibrationrecord",
+                    ),
+                ),
+                (
+                    "certificate",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="uploads",
+                        to="equipment.certificate",
+                    ),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="certificate_uploads",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("status", "uploading")),
+                        fields=["updated_at"],
+                        name="certupload_stale_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            reindex_calibration_records, restore_calibration_record_index
+        ),
+    ]
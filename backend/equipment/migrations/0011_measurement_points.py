@@ -0,0 +1,68 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0010_certificates"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MeasurementPoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("calibration_date", models.DateField()),
+                ("calibration_day", models.IntegerField()),
+                ("position", models.PositiveSmallIntegerField()),
+                ("point", models.CharField(blank=True, max_length=100)),
+                ("nominal", models.FloatField(blank=True, null=True)),
+                ("measured", models.FloatField(blank=True, null=True)),
+                ("error", models.FloatField(blank=True, null=True)),
+                ("tolerance", models.FloatField(blank=True, null=True)),
+                ("uncertainty", models.FloatField(blank=True, null=True)),
+                ("unit", models.CharField(blank=True, max_length=20)),
+                ("passed", models.BooleanField(blank=True, null=True)),
+                (
+                    "equipment",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="measurement_points",
+                        to="equipment.equipment",
+                    ),
+                ),
+                (
+                    "record",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="points",
+                        to="equipment.calibrationrecord",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["record_id", "position"],
+                "indexes": [
+                    models.Index(
+                        fields=["point", "equipment", "calibration_day"],
+                        name="mpoint_point_idx",
+                    ),
+                    models.Index(
+                        fields=["nominal", "equipment", "calibration_day"],
+                        name="mpoint_nominal_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:45
+
+import equipment.schemas
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0011_measurement_points"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="calibrationrecord",
+            name="schema_version",
+            field=models.CharField(blank=True, editable=False, max_length=50),
+        ),
+        migrations.AlterField(
+            model_name="calibrationrecord",
+            name="measurement_points",
+            field=models.JSONField(encoder=equipment.schemas.CompactJSONEncoder),
+        ),
+        migrations.AlterField(
+            model_name="calibrationrecord",
+            name="results",
+            field=models.JSONField(encoder=equipment.schemas.CompactJSONEncoder),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.2 on 2026-10-18 10:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0012_measurement_schemas"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="equipment",
+            index=models.Index(
+                fields=[
+                    "next_calibration_date",
+                    "calibration_interval_type",
+                    "calibration_interval_value",
+                    "status",
+                    "location",
+                    "category",
+                ],
+                name="equipment_forecast_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,102 @@
+# Generated by Django 5.0.2 on 2026-10-18 11:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_sync_state(apps, schema_editor):
+    # Existing rows keep sequence number 0, which full syncs include
+    SyncState = apps.get_model("equipment", "SyncState")
+    SyncState.objects.using(schema_editor.connection.alias).get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0013_forecast_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncState",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sequence", models.BigIntegerField(default=0)),
+                ("pruned_through", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Sync State",
+                "verbose_name_plural": "Sync State",
+            },
+        ),
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "model",
+                    models.CharField(
+                        choices=[
+                            ("equipment", "Equipment"),
+                            ("calibration_record", "Calibration Record"),
+                            ("maintenance_record", "Maintenance Record"),
+                        ],
+                        max_length=30,
+                    ),
+                ),
+                ("object_id", models.BigIntegerField()),
+                ("equipment_id", models.BigIntegerField(blank=True, null=True)),
+                ("sync_seq", models.BigIntegerField()),
+                ("deleted_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="calibrationrecord",
+            name="sync_seq",
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="equipment",
+            name="sync_seq",
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="maintenancerecord",
+            name="sync_seq",
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="calibrationrecord",
+            index=models.Index(fields=["sync_seq", "id"], name="calrec_sync_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="equipment",
+            index=models.Index(fields=["sync_seq", "id"], name="equipment_sync_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="maintenancerecord",
+            index=models.Index(fields=["sync_seq", "id"], name="mntrec_sync_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="tombstone",
+            index=models.Index(fields=["sync_seq", "id"], name="tombstone_sync_idx"),
+        ),
+        migrations.RunPython(create_sync_state, migrations.RunPython.noop),
+    ]
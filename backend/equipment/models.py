@@ -3,11 +3,212 @@
 # Description: Django models for equipment management
 # ============================================================================
 
-from django.db import models
+import decimal
+import uuid
+
+from django.db import connections, models, router, transaction
+from django.db.models import F
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator
 from django.utils import timezone
 
+from .scheduling import next_calibration_date
+from .schemas import CompactJSONEncoder
+from .summaries import SUMMARY_FIELDS
+
+# Days before next_calibration_date at which equipment becomes due
+CALIBRATION_WARNING_DAYS = 7
+
+# Statuses set by hand that are never derived from calibration dates
+MANUAL_STATUSES = ('retired', 'maintenance')
+
+
+def effective_status_q(status, now=None):
+    """Return a ``Q`` matching equipment whose effective status is ``status``.
+
+    The conditions are plain ranges on ``next_calibration_date`` so they can
+    be served by an index, unlike filtering on the ``Case`` annotation.
+    """
+    now = now or timezone.now()
+    warning = now + timezone.timedelta(days=CALIBRATION_WARNING_DAYS)
+    if status in MANUAL_STATUSES:
+        return models.Q(status=status)
+
+    derived = ~models.Q(status__in=MANUAL_STATUSES)
+    if status == 'calibration_overdue':
+        return derived & (
+            models.Q(last_calibration_date__isnull=True) |
+            models.Q(next_calibration_date__isnull=True) |
+            models.Q(next_calibration_date__lt=now)
+        )
+    dated = derived & models.Q(
+        last_calibration_date__isnull=False,
+        next_calibration_date__isnull=False
+    )
+    if status == 'calibration_due':
+        return dated & models.Q(
+            next_calibration_date__gte=now,
+            next_calibration_date__lt=warning
+        )
+    if status == 'active':
+        return dated & models.Q(next_calibration_date__gte=warning)
+    raise ValueError(f'Unknown equipment status: {status}')
+
+
+def effective_status_expression(now=None):
+    """Return a ``Case`` expression computing the effective status.
+
+    Mirrors ``Equipment.calculate_status`` so the status is derived from the
+    calibration dates at query time rather than at the last ``save()``.
+    """
+    now = now or timezone.now()
+    warning = now + timezone.timedelta(days=CALIBRATION_WARNING_DAYS)
+    return models.Case(
+        models.When(status__in=MANUAL_STATUSES, then=models.F('status')),
+        models.When(
+            models.Q(last_calibration_date__isnull=True) |
+            models.Q(next_calibration_date__isnull=True) |
+            models.Q(next_calibration_date__lt=now),
+            then=models.Value('calibration_overdue')
+        ),
+        models.When(
+            next_calibration_date__lt=warning,
+            then=models.Value('calibration_due')
+        ),
+        default=models.Value('active'),
+        output_field=models.CharField()
+    )
+
+
+def allocate_sync_seq(using=None):
+    """Return the change sequence number of the current transaction.
+
+    On PostgreSQL this is the transaction id plus the offset kept in
+    ``SyncState``, read without taking any lock, so writers never wait on
+    each other and every change of a transaction shares its number. The
+    feed only serves numbers below ``sync_horizon()``, which transactions
+    still running can no longer be given. Elsewhere, where writers are
+    serialized by the database anyway, the counter row is incremented and
+    stays locked until the transaction ends. Must be called inside the
+    transaction writing the change.
+    """
+    using = using or router.db_for_write(SyncState)
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        return _postgres_sync_seq(connection, 'pg_current_xact_id()')
+    states = SyncState.objects.using(using)
+    if not states.filter(pk=1).update(sequence=F('sequence') + 1):
+        states.get_or_create(pk=1)
+        states.filter(pk=1).update(sequence=F('sequence') + 1)
+    return states.values_list('sequence', flat=True).get(pk=1)
+
+
+def sync_horizon(using=None):
+    """Return the lowest sequence number that may still be committing.
+
+    Every change numbered below it is visible. None when all allocated
+    numbers are, because allocating holds the counter until commit.
+    """
+    using = using or router.db_for_read(SyncState)
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        # Transactions older than the snapshot's xmin have all ended
+        return _postgres_sync_seq(
+            connection, 'pg_snapshot_xmin(pg_current_snapshot())'
+        )
+    return None
+
+
+def _postgres_sync_seq(connection, xid):
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT {xid}::text::bigint + COALESCE(('
+            f'SELECT {quote("sequence")} '
+            f'FROM {quote(SyncState._meta.db_table)} '
+            f'WHERE {quote("id")} = 1), 0)'
+        )
+        return cursor.fetchone()[0]
+
+
+def _stamp_sync_seq(instance, kwargs):
+    """Give ``instance`` a new sequence number within its ``save()``."""
+    instance.sync_seq = allocate_sync_seq(using=kwargs.get('using'))
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and 'sync_seq' not in update_fields:
+        kwargs['update_fields'] = [*update_fields, 'sync_seq']
+
+
+class SyncQuerySet(models.QuerySet):
+    """Queryset stamping bulk writes with a change sequence number.
+
+    Rows written by one ``update()``, ``bulk_create()`` or
+    ``bulk_update()`` call share a sequence number, so bulk writes show up
+    in the sync feed like individual saves.
+    """
+
+    def update(self, **kwargs):
+        with transaction.atomic(using=self.db):
+            kwargs['sync_seq'] = allocate_sync_seq(using=self.db)
+            return super().update(**kwargs)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        if not objs:
+            return objs
+        with transaction.atomic(using=self.db):
+            sync_seq = allocate_sync_seq(using=self.db)
+            for obj in objs:
+                obj.sync_seq = sync_seq
+            update_fields = kwargs.get('update_fields')
+            if update_fields and 'sync_seq' not in update_fields:
+                kwargs['update_fields'] = [*update_fields, 'sync_seq']
+            return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        if not objs:
+            return 0
+        with transaction.atomic(using=self.db):
+            sync_seq = allocate_sync_seq(using=self.db)
+            for obj in objs:
+                obj.sync_seq = sync_seq
+            if 'sync_seq' not in fields:
+                fields = [*fields, 'sync_seq']
+            return super().bulk_update(objs, fields, *args, **kwargs)
+
+
+class EquipmentQuerySet(SyncQuerySet):
+    """Custom queryset with shapes tuned for the equipment API."""
+
+    def with_effective_status(self, now=None):
+        """Annotate ``effective_status`` computed in the database."""
+        return self.annotate(
+            effective_status=effective_status_expression(now)
+        )
+
+    def with_status(self, *statuses, now=None):
+        """Filter by effective status using index-friendly date ranges."""
+        condition = models.Q(pk__in=[])
+        for status in statuses:
+            condition |= effective_status_q(status, now)
+        return self.filter(condition)
+
+    def reconcile_status(self, now=None):
+        """Write the effective status into the stored ``status`` column.
+
+        Only rows whose stored value is stale are touched, in a single
+        ``UPDATE``. Returns the number of rows updated.
+        """
+        expression = effective_status_expression(now)
+        return (
+            self.exclude(status__in=MANUAL_STATUSES)
+            .alias(computed_status=expression)
+            .exclude(status=models.F('computed_status'))
+            .update(status=expression)
+        )
+
+
 class Equipment(models.Model):
     """Equipment model for tracking calibration and maintenance."""
     
@@ -58,16 +259,113 @@ class Equipment(models.Model):
         related_name='created_equipment'
     )
 
+    # Summaries of the equipment's records, kept up to date by
+    # equipment.summaries in the same transaction as each record write
+    latest_calibration = models.ForeignKey(
+        'CalibrationRecord',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='+'
+    )
+    latest_calibration_date = models.DateField(
+        null=True, blank=True, editable=False
+    )
+    latest_certificate_number = models.CharField(
+        max_length=100, blank=True, editable=False
+    )
+    calibration_count = models.IntegerField(default=0, editable=False)
+    latest_maintenance_date = models.DateField(
+        null=True, blank=True, editable=False
+    )
+    maintenance_count = models.IntegerField(default=0, editable=False)
+    maintenance_cost_total = models.DecimalField(
+        max_digits=12, decimal_places=2, default=0, editable=False
+    )
+    # Cost of maintenance dated in maintenance_cost_year
+    maintenance_cost_ytd = models.DecimalField(
+        max_digits=12, decimal_places=2, default=0, editable=False
+    )
+    maintenance_cost_year = models.IntegerField(
+        null=True, blank=True, editable=False
+    )
+
+    # Change sequence number of the last write, for the sync feed
+    sync_seq = models.BigIntegerField(default=0, editable=False)
+
+    objects = EquipmentQuerySet.as_manager()
+
     class Meta:
-        ordering = ['name']
+        ordering = ['name', 'id']
         verbose_name_plural = 'Equipment'
+        indexes = [
+            # Default list ordering
+            models.Index(fields=['name', 'id'], name='equipment_name_id_idx'),
+            # Status filters combined with calibration date ranges
+            models.Index(
+                fields=['status', 'next_calibration_date'],
+                name='equipment_status_next_cal_idx'
+            ),
+            # Effective status ranges only ever consider date-driven rows
+            models.Index(
+                fields=['next_calibration_date'],
+                condition=~models.Q(status__in=MANUAL_STATUSES),
+                name='equipment_next_cal_dated_idx'
+            ),
+            # Equipment that has never been calibrated is always overdue
+            models.Index(
+                fields=['name'],
+                condition=models.Q(last_calibration_date__isnull=True),
+                name='equipment_uncalibrated_idx'
+            ),
+            # Dashboard category/location grouping
+            models.Index(
+                fields=['category', 'location'],
+                name='equipment_category_loc_idx'
+            ),
+            # API filters combined with the default ordering
+            models.Index(
+                fields=['category', 'name', 'id'],
+                name='equipment_category_name_idx'
+            ),
+            models.Index(
+                fields=['location', 'name', 'id'],
+                name='equipment_location_name_idx'
+            ),
+            models.Index(
+                fields=['manufacturer', 'name', 'id'],
+                name='equipment_manufacturer_idx'
+            ),
+            # API ordering and ranges on the calibration due date
+            models.Index(
+                fields=['next_calibration_date', 'id'],
+                name='equipment_next_cal_id_idx'
+            ),
+            # Covers every column read by workload forecasts
+            models.Index(
+                fields=[
+                    'next_calibration_date', 'calibration_interval_type',
+                    'calibration_interval_value', 'status', 'location',
+                    'category',
+                ],
+                name='equipment_forecast_idx'
+            ),
+            # Sync feed keyset
+            models.Index(
+                fields=['sync_seq', 'id'], name='equipment_sync_idx'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.serial_number})"
 
-    def calculate_status(self):
-        """Calculate the equipment status based on calibration dates."""
-        now = timezone.now()
+    def calculate_status(self, now=None):
+        """Calculate the equipment status based on calibration dates.
+
+        Keep in sync with ``effective_status_expression``.
+        """
+        now = now or timezone.now()
         
         # If equipment is retired, keep it retired
         if self.status == 'retired':
@@ -86,7 +384,8 @@ class Equipment(models.Model):
             
         # Calculate warning threshold (7 days before due date)
         warning_threshold = (
-            self.next_calibration_date - timezone.timedelta(days=7)
+            self.next_calibration_date -
+            timezone.timedelta(days=CALIBRATION_WARNING_DAYS)
         )
         
         if now > self.next_calibration_date:
@@ -96,30 +395,82 @@ class Equipment(models.Model):
         else:
             return 'active'
 
-    def save(self, *args, **kwargs):
+    def get_effective_status(self):
+        """Return the effective status, preferring the query annotation."""
+        annotated = getattr(self, 'effective_status', None)
+        return annotated or self.calculate_status()
+
+    def get_maintenance_cost_year_to_date(self, now=None):
+        """Return this year's maintenance cost from the stored summary.
+
+        The summary is only current for the year it was computed in; an
+        earlier year means no maintenance has been recorded since.
+        """
+        year = timezone.localdate(now).year
+        if self.maintenance_cost_year != year:
+            return decimal.Decimal('0.00')
+        return self.maintenance_cost_ytd
+
+    def get_effective_status_display(self):
+        choices = dict(self._meta.get_field('status').flatchoices)
+        return choices[self.get_effective_status()]
+
+    def refresh_derived_fields(self, now=None):
+        """Derive next_calibration_date and status from the other fields.
+
+        Called by ``save()``, and directly by bulk paths that bypass it.
+        """
         # Calculate next calibration date if last_calibration_date is provided
-        if not self.next_calibration_date and self.last_calibration_date:
-            interval_days = 0
-            if self.calibration_interval_type == 'hourly':
-                interval_days = self.calibration_interval_value / 24
-            elif self.calibration_interval_type == 'daily':
-                interval_days = self.calibration_interval_value
-            elif self.calibration_interval_type == 'weekly':
-                interval_days = self.calibration_interval_value * 7
-            elif self.calibration_interval_type == 'monthly':
-                interval_days = self.calibration_interval_value * 30
-            elif self.calibration_interval_type == 'yearly':
-                interval_days = self.calibration_interval_value * 365
-
-            self.next_calibration_date = (
-                self.last_calibration_date + 
-                timezone.timedelta(days=interval_days)
+        if not self.next_calibration_date:
+            self.next_calibration_date = next_calibration_date(
+                self.last_calibration_date,
+                self.calibration_interval_type,
+                self.calibration_interval_value
             )
         
         # Calculate status based on current state
-        self.status = self.calculate_status()
-        
-        super().save(*args, **kwargs)
+        self.status = self.calculate_status(now)
+
+    def advance_calibration(self, calibrated_at, now=None):
+        """Move the schedule forward in memory; see ``record_calibration``.
+
+        Used directly by bulk paths that write the fields themselves.
+        """
+        if (self.last_calibration_date and
+                self.last_calibration_date >= calibrated_at):
+            return False
+        self.last_calibration_date = calibrated_at
+        self.next_calibration_date = next_calibration_date(
+            calibrated_at,
+            self.calibration_interval_type,
+            self.calibration_interval_value
+        )
+        self.refresh_derived_fields(now)
+        return True
+
+    def record_calibration(self, calibrated_at):
+        """Move the schedule forward after a calibration at ``calibrated_at``.
+
+        Back-dated calibrations older than the current one are ignored.
+        Returns whether the equipment was updated.
+        """
+        if not self.advance_calibration(calibrated_at):
+            return False
+        self.save()
+        return True
+
+    def save(self, *args, **kwargs):
+        self.refresh_derived_fields()
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            # The record summaries are maintained by SQL updates, so an
+            # instance loaded earlier must not write back its stale copy
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in SUMMARY_FIELDS
+            ]
+        with transaction.atomic(using=kwargs.get('using')):
+            _stamp_sync_seq(self, kwargs)
+            super().save(*args, **kwargs)
 
 class CalibrationRecord(models.Model):
     """Model for tracking calibration records."""
@@ -137,9 +488,26 @@ class CalibrationRecord(models.Model):
         null=True,
         blank=True
     )
+    # Content-addressed certificate attached through a certificate upload;
+    # certificate_file then points at the same stored file
+    certificate = models.ForeignKey(
+        'Certificate',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='calibration_records'
+    )
+    # Text extracted from the certificate, copied here for search
+    certificate_text = models.TextField(blank=True, editable=False)
     calibration_standard = models.CharField(max_length=200)
-    measurement_points = models.JSONField()
-    results = models.JSONField()
+    # Validated against the equipment category's measurement schema,
+    # recorded in schema_version, and stored in canonical compact form
+    measurement_points = models.JSONField(encoder=CompactJSONEncoder)
+    results = models.JSONField(encoder=CompactJSONEncoder)
+    schema_version = models.CharField(
+        max_length=50, blank=True, editable=False
+    )
     notes = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     created_by = models.ForeignKey(
@@ -148,14 +516,47 @@ class CalibrationRecord(models.Model):
         null=True,
         related_name='created_calibrations'
     )
+    sync_seq = models.BigIntegerField(default=0, editable=False)
+
+    objects = SyncQuerySet.as_manager()
 
     class Meta:
-        ordering = ['-calibration_date']
+        ordering = ['-calibration_date', '-id']
         verbose_name_plural = 'Calibration Records'
+        indexes = [
+            # Per-equipment history, newest first
+            models.Index(
+                fields=['equipment', '-calibration_date', '-id'],
+                name='calrec_equipment_date_idx'
+            ),
+            # Global list ordering
+            models.Index(
+                fields=['-calibration_date', '-id'],
+                name='calrec_date_id_idx'
+            ),
+            # Sync feed keyset
+            models.Index(fields=['sync_seq', 'id'], name='calrec_sync_idx'),
+        ]
 
     def __str__(self):
         return f"Calibration {self.certificate_number} - {self.equipment.name}"
 
+    def attach_certificate(self, certificate):
+        """Point this record at ``certificate`` and save it."""
+        self.certificate = certificate
+        self.certificate_file.name = certificate.file.name
+        self.certificate_text = certificate.text
+        self.save(update_fields=[
+            'certificate', 'certificate_file', 'certificate_text'
+        ])
+
+    def save(self, *args, **kwargs):
+        # The post_save handler updates the equipment summary, which must
+        # commit or roll back together with the record
+        with transaction.atomic(using=kwargs.get('using')):
+            _stamp_sync_seq(self, kwargs)
+            super().save(*args, **kwargs)
+
 class MaintenanceRecord(models.Model):
     """Model for tracking maintenance records."""
     
@@ -190,10 +591,273 @@ class MaintenanceRecord(models.Model):
         null=True,
         related_name='created_maintenance'
     )
+    sync_seq = models.BigIntegerField(default=0, editable=False)
+
+    objects = SyncQuerySet.as_manager()
 
     class Meta:
-        ordering = ['-maintenance_date']
+        ordering = ['-maintenance_date', '-id']
         verbose_name_plural = 'Maintenance Records'
+        indexes = [
+            # Per-equipment history, newest first
+            models.Index(
+                fields=['equipment', '-maintenance_date', '-id'],
+                name='mntrec_equipment_date_idx'
+            ),
+            # Global list ordering
+            models.Index(
+                fields=['-maintenance_date', '-id'],
+                name='mntrec_date_id_idx'
+            ),
+            # Maintenance type filter with the default ordering
+            models.Index(
+                fields=['maintenance_type', '-maintenance_date', '-id'],
+                name='mntrec_type_date_idx'
+            ),
+            # Sync feed keyset
+            models.Index(fields=['sync_seq', 'id'], name='mntrec_sync_idx'),
+        ]
+
+    def __str__(self):
+        return f"Maintenance {self.maintenance_date} - {self.equipment.name}"
+
+    def save(self, *args, **kwargs):
+        # The post_save handler updates the equipment summary, which must
+        # commit or roll back together with the record
+        with transaction.atomic(using=kwargs.get('using')):
+            _stamp_sync_seq(self, kwargs)
+            super().save(*args, **kwargs)
+
+
+class SweeperState(models.Model):
+    """Watermark of the calibration status sweeper.
+
+    A single row records how far the sweeper has advanced, so each run only
+    scans equipment whose calibration window was crossed since the last one.
+    """
+
+    swept_until = models.DateTimeField(null=True, blank=True)
+    transitions = models.IntegerField(default=0)
+    digests_sent = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Sweeper State'
+        verbose_name_plural = 'Sweeper State'
+
+    def __str__(self):
+        return f"Swept until {self.swept_until}"
+
+
+class SyncState(models.Model):
+    """Counter of the change sequence numbers of the sync feed.
+
+    A single row holds the last number allocated, or on PostgreSQL the
+    offset added to transaction ids, and the number through which
+    tombstones have been pruned; sync tokens older than that can no longer
+    be resumed.
+    """
+
+    sequence = models.BigIntegerField(default=0)
+    pruned_through = models.BigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Sync State'
+        verbose_name_plural = 'Sync State'
+
+    def __str__(self):
+        return f"Sequence {self.sequence}"
+
+
+class Tombstone(models.Model):
+    """Record of a deleted object, kept for the sync feed.
+
+    Deleting equipment only leaves a tombstone for the equipment; clients
+    drop its records along with it.
+    """
+
+    model = models.CharField(
+        max_length=30,
+        choices=[
+            ('equipment', 'Equipment'),
+            ('calibration_record', 'Calibration Record'),
+            ('maintenance_record', 'Maintenance Record'),
+        ]
+    )
+    object_id = models.BigIntegerField()
+    equipment_id = models.BigIntegerField(null=True, blank=True)
+    sync_seq = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Sync feed keyset
+            models.Index(fields=['sync_seq', 'id'], name='tombstone_sync_idx'),
+        ]
+
+    def __str__(self):
+        return f"Deleted {self.model} {self.object_id}"
+
+
+class MeasurementPoint(models.Model):
+    """One measurement point of a calibration, in typed columns.
+
+    Rows are derived from the record's ``measurement_points`` and
+    ``results`` JSON whenever it is saved. The equipment and calibration
+    date are copied from the record so drift queries need no join to it;
+    ``calibration_day`` (days since 1970-01-01) allows trend regressions
+    with plain SQL aggregates on every database.
+    """
+
+    record = models.ForeignKey(
+        CalibrationRecord,
+        on_delete=models.CASCADE,
+        related_name='points'
+    )
+    equipment = models.ForeignKey(
+        Equipment,
+        on_delete=models.CASCADE,
+        related_name='measurement_points'
+    )
+    calibration_date = models.DateField()
+    calibration_day = models.IntegerField()
+    position = models.PositiveSmallIntegerField()
+    point = models.CharField(max_length=100, blank=True)
+    nominal = models.FloatField(null=True, blank=True)
+    measured = models.FloatField(null=True, blank=True)
+    error = models.FloatField(null=True, blank=True)
+    tolerance = models.FloatField(null=True, blank=True)
+    uncertainty = models.FloatField(null=True, blank=True)
+    unit = models.CharField(max_length=20, blank=True)
+    passed = models.BooleanField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['record_id', 'position']
+        indexes = [
+            # Drift of a named point or a nominal value, grouped by equipment
+            models.Index(
+                fields=['point', 'equipment', 'calibration_day'],
+                name='mpoint_point_idx'
+            ),
+            models.Index(
+                fields=['nominal', 'equipment', 'calibration_day'],
+                name='mpoint_nominal_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.point or self.position}: {self.measured} {self.unit}"
+
+
+class Certificate(models.Model):
+    """A calibration certificate file, stored once per distinct content.
+
+    Files are named after the SHA-256 of their content, so identical
+    uploads share one stored object. Thumbnails and extracted text are
+    filled in by the background processing pipeline.
+    """
+
+    PROCESSING_STATUSES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+        ('rejected', 'Rejected'),
+    ]
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to='certificates/', max_length=255)
+    size = models.BigIntegerField()
+    content_type = models.CharField(max_length=100, blank=True)
+    original_name = models.CharField(max_length=255, blank=True)
+    thumbnail = models.FileField(
+        upload_to='certificates/thumbnails/',
+        max_length=255,
+        blank=True
+    )
+    text = models.TextField(blank=True)
+    processing_status = models.CharField(
+        max_length=20,
+        choices=PROCESSING_STATUSES,
+        default='pending'
+    )
+    processing_error = models.TextField(blank=True)
+    processing_started_at = models.DateTimeField(null=True, blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Processing queue, oldest first
+            models.Index(
+                fields=['created_at'],
+                condition=models.Q(
+                    processing_status__in=['pending', 'processing']
+                ),
+                name='certificate_queue_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.original_name or self.sha256} ({self.size} bytes)"
+
+
+class CertificateUpload(models.Model):
+    """A resumable, chunked certificate upload in progress.
+
+    Chunks are appended to a staging file until ``offset`` reaches
+    ``size``, when the file is hashed and stored as a ``Certificate``.
+    """
+
+    STATUSES = [
+        ('uploading', 'Uploading'),
+        ('complete', 'Complete'),
+        ('failed', 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    filename = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100, blank=True)
+    size = models.BigIntegerField(validators=[MinValueValidator(1)])
+    # SHA-256 declared by the client; verified once the upload completes
+    sha256 = models.CharField(max_length=64, blank=True)
+    offset = models.BigIntegerField(default=0)
+    status = models.CharField(
+        max_length=20, choices=STATUSES, default='uploading'
+    )
+    error = models.TextField(blank=True)
+    calibration_record = models.ForeignKey(
+        CalibrationRecord,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='certificate_uploads'
+    )
+    certificate = models.ForeignKey(
+        Certificate,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='uploads'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='certificate_uploads'
+    )
+
+    class Meta:
+        indexes = [
+            # Expiry of abandoned uploads
+            models.Index(
+                fields=['updated_at'],
+                condition=models.Q(status='uploading'),
+                name='certupload_stale_idx'
+            ),
+        ]
 
     def __str__(self):
-        return f"Maintenance {self.maintenance_date} - {self.equipment.name}" 
\ No newline at end of file
+        return f"{self.filename} ({self.offset}/{self.size} bytes)"
@@ -0,0 +1,359 @@
+# ============================================================================
+# File Path: backend/equipment/pagination.py
+# Description: Keyset pagination for the equipment API
+# ============================================================================
+
+import base64
+import copy
+import datetime
+import decimal
+import json
+import operator
+import uuid
+from collections import OrderedDict
+from functools import reduce
+
+from django.conf import settings
+from django.core.exceptions import (
+    FieldDoesNotExist, ImproperlyConfigured, ValidationError
+)
+from django.core.paginator import InvalidPage
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(PageNumberPagination):
+    """Opt-in keyset (seek) pagination with a page-number fallback.
+
+    Requests carrying a ``cursor`` query parameter (empty for the first page)
+    are paginated by seeking past the last row of the previous page on the
+    queryset ordering, with the primary key as a tie-break. Cost is then
+    independent of page depth, no ``COUNT(*)`` is issued, and rows are never
+    skipped or repeated when data changes between requests. Requests without
+    a cursor keep the classic page-number behaviour.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = settings.API_MAX_PAGE_SIZE
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.cursor_query_param in request.query_params
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+        values = self.start_window(queryset, request)
+        return self.fetch_window(queryset, values)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Async ``paginate_queryset()``, reading rows with the async ORM."""
+        self.keyset = self.cursor_query_param in request.query_params
+        if not self.keyset:
+            return await self.apaginate_pages(queryset, request)
+        values = self.start_window(queryset, request)
+        return await self.afetch_window(queryset, values)
+
+    async def apaginate_pages(self, queryset, request):
+        """Async page-number pagination, as ``PageNumberPagination`` does."""
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        # Paginator would count synchronously on first use
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            ))
+        self.page.object_list = [row async for row in self.page.object_list]
+
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        self.request = request
+        return list(self.page)
+
+    def start_window(self, queryset, request):
+        """Set up a keyset window and return the values it starts after."""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        token = request.query_params[self.cursor_query_param]
+        return self.decode_cursor(token) if token else None
+
+    def fetch_window(self, queryset, values=None):
+        """Return the page of rows after ``values`` in ``self.ordering``."""
+        return self.end_window(list(self.get_window(queryset, values)))
+
+    async def afetch_window(self, queryset, values=None):
+        """Async ``fetch_window()``."""
+        window = self.get_window(queryset, values)
+        return self.end_window([row async for row in window])
+
+    def get_window(self, queryset, values):
+        queryset = queryset.order_by(*self.get_order_by())
+        if values is not None:
+            queryset = queryset.filter(self.seek_condition(values))
+        # Fetch one extra row to find out whether a next page exists
+        return queryset[:self.page_size + 1]
+
+    def end_window(self, rows):
+        self.has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.last_row = rows[-1] if rows else None
+        return rows
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties'].pop('count')
+        response_schema['properties'].pop('previous')
+        return response_schema
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.last_row)
+        )
+
+    def get_ordering(self, queryset):
+        """Return ``(field, descending)`` pairs ending with the primary key.
+
+        Orderings may name model fields or annotations on the queryset.
+        """
+        model = queryset.model
+        ordering = list(queryset.query.order_by or model._meta.ordering)
+        pairs = []
+        for item in ordering:
+            if not isinstance(item, str):
+                raise ImproperlyConfigured(
+                    'Keyset pagination only supports ordering by field names.'
+                )
+            descending = item.startswith('-')
+            name = item.lstrip('-')
+            if name == 'pk':
+                name = model._meta.pk.name
+            pairs.append((self._get_field(queryset, name), descending))
+
+        pk = model._meta.pk
+        if not any(field == pk for field, _ in pairs):
+            pairs.append((pk, pairs[0][1] if pairs else False))
+        else:
+            # Nothing after the primary key can affect the order
+            end = [field for field, _ in pairs].index(pk) + 1
+            pairs = pairs[:end]
+        return pairs
+
+    def get_order_by(self):
+        """Return the ``order_by`` arguments sorting NULLs above every value.
+
+        NULLs come last ascending and first descending, as in PostgreSQL's
+        default, so a descending page is an ascending index scanned
+        backwards.
+        """
+        order_by = []
+        for field, descending in self.ordering:
+            if field.null:
+                expression = F(field.name)
+                order_by.append(
+                    expression.desc(nulls_first=True) if descending
+                    else expression.asc(nulls_last=True)
+                )
+            else:
+                order_by.append(f"{'-' if descending else ''}{field.name}")
+        return order_by
+
+    def seek_condition(self, values):
+        """Return a ``Q`` selecting rows ordered after ``values``.
+
+        Expands the row comparison ``(f1, f2, ...) > (v1, v2, ...)`` into
+        ``f1 > v1 OR (f1 = v1 AND f2 > v2) OR ...`` honouring each field's
+        direction, with NULLs sorting above every value.
+        """
+        terms = []
+        equal = Q()
+        for (field, descending), value in zip(self.ordering, values):
+            if value is None:
+                # Descending, every value follows the NULLs; ascending,
+                # only other NULLs can follow
+                if descending:
+                    terms.append(
+                        equal & Q(**{f'{field.name}__isnull': False})
+                    )
+                equal &= Q(**{f'{field.name}__isnull': True})
+                continue
+            lookup = 'lt' if descending else 'gt'
+            after = Q(**{f'{field.name}__{lookup}': value})
+            if field.null and not descending:
+                after |= Q(**{f'{field.name}__isnull': True})
+            terms.append(equal & after)
+            equal &= Q(**{field.name: value})
+        if not terms:
+            # Every ordering value was NULL, so the primary key was too
+            return Q(pk__in=[])
+        condition = reduce(operator.or_, terms)
+
+        # Give the planner a range start on the leading column
+        field, descending = self.ordering[0]
+        if values[0] is not None and not field.null:
+            lookup = 'lte' if descending else 'gte'
+            condition &= Q(**{f'{field.name}__{lookup}': values[0]})
+        return condition
+
+    def encode_cursor(self, row):
+        values = [
+            _encode_value(self._get_value(row, field))
+            for field, _ in self.ordering
+        ]
+        payload = json.dumps(
+            [self._get_signature(), values], separators=(',', ':')
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, token):
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            signature, values = json.loads(base64.urlsafe_b64decode(padded))
+            if signature != self._get_signature():
+                raise ValueError('Cursor belongs to a different ordering')
+            if len(values) != len(self.ordering):
+                raise ValueError('Cursor has the wrong number of values')
+            return [
+                None if value is None else field.to_python(value)
+                for (field, _), value in zip(self.ordering, values)
+            ]
+        except (TypeError, ValueError, ValidationError) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+    def _get_signature(self):
+        return [
+            f"{'-' if descending else ''}{field.name}"
+            for field, descending in self.ordering
+        ]
+
+    @staticmethod
+    def _get_field(queryset, name):
+        annotation = queryset.query.annotations.get(name)
+        if annotation is not None:
+            # Order by annotations such as a search rank using their
+            # output field, bound to the annotation's name
+            field = copy.copy(annotation.output_field)
+            field.set_attributes_from_name(name)
+            return field
+        try:
+            field = queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            field = None
+        if field is None or not field.concrete:
+            raise ImproperlyConfigured(
+                f'Keyset pagination cannot order by "{name}".'
+            )
+        return field
+
+    @staticmethod
+    def _get_value(row, field):
+        if isinstance(row, dict):
+            return row.get(field.attname, row.get(field.name))
+        return getattr(row, field.attname)
+
+
+def _encode_value(value):
+    """Return a JSON-safe value that ``Field.to_python`` can restore exactly."""
+    if isinstance(value, (datetime.date, datetime.time)):
+        # Full precision, unlike DjangoJSONEncoder which truncates microseconds
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    return value
+
+
+class HistoryPagination(KeysetPagination):
+    """Keyset windows over the record history of a single equipment.
+
+    Without parameters the latest ``page_size`` records are returned newest
+    first, with a ``next`` link to the window before them. ``since`` takes
+    a ``latest`` token from an earlier response and returns only the
+    records added after it, oldest first, with ``next`` continuing the
+    delta. Each window is one range read on the ``(equipment, date, id)``
+    index.
+    """
+
+    page_size = settings.EQUIPMENT_DETAIL_HISTORY_LIMIT
+    since_query_param = 'since'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        values = self.start_window(queryset, request)
+        return self.fetch_window(queryset, values)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        values = self.start_window(queryset, request)
+        return await self.afetch_window(queryset, values)
+
+    def start_window(self, queryset, request):
+        self.keyset = True
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        self.since = request.query_params.get(self.since_query_param)
+        if self.since:
+            values = self.decode_cursor(self.since)
+            # Walk forward in time from the given record
+            self.newest_first = self.ordering
+            self.ordering = [
+                (field, not descending)
+                for field, descending in self.newest_first
+            ]
+            return values
+
+        self.token = request.query_params.get(self.cursor_query_param)
+        return self.decode_cursor(self.token) if self.token else None
+
+    def end_window(self, rows):
+        rows = super().end_window(rows)
+        if self.since:
+            self.ordering = self.newest_first
+            self.latest = self.encode_cursor(rows[-1]) if rows else self.since
+        else:
+            # Older windows do not contain the newest record
+            self.latest = (
+                self.encode_cursor(rows[0])
+                if rows and not self.token else None
+            )
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('latest', self.latest),
+            ('results', data),
+        ]))
+
+    def get_next_link(self):
+        if not self.since:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.since_query_param,
+            self.encode_cursor(self.last_row)
+        )
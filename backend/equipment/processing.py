@@ -0,0 +1,316 @@
+# ============================================================================
+# File Path: backend/equipment/processing.py
+# Description: Background certificate processing pipeline and worker pool
+# ============================================================================
+
+import contextlib
+import functools
+import io
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connections, models
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .cache import bump_data_version
+from .models import CalibrationRecord, Certificate
+from .uploads import BLOCK_SIZE, expire_uploads
+
+logger = logging.getLogger(__name__)
+
+# Longest extracted text kept per certificate, in characters
+MAX_TEXT_LENGTH = 100000
+
+# Longest side of generated thumbnails, in pixels
+THUMBNAIL_SIZE = 256
+
+# Certificates claimed per worker pass
+BATCH_SIZE = 100
+
+
+class CertificateRejected(Exception):
+    """Raised by a processor to reject a certificate, e.g. when infected."""
+
+
+@functools.lru_cache(maxsize=None)
+def get_processors():
+    return [import_string(path) for path in settings.CERTIFICATE_PROCESSORS]
+
+
+def process_pending(workers=None, limit=BATCH_SIZE, now=None):
+    """Process queued certificates in a pool of worker threads.
+
+    Certificates are claimed one at a time with a conditional ``UPDATE``,
+    so several workers or processes can share the queue. Those left in
+    processing by a crashed worker are retried after
+    ``CERTIFICATE_PROCESSING_TIMEOUT``. Returns a count per outcome.
+    """
+    now = now or timezone.now()
+    ids = list(
+        _claimable(now)
+        .order_by('created_at')
+        .values_list('pk', flat=True)[:limit]
+    )
+    outcomes = {}
+    if not ids:
+        return outcomes
+    workers = workers or settings.CERTIFICATE_PROCESSING_WORKERS
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for outcome in pool.map(_process_in_thread, ids):
+            if outcome:
+                outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    return outcomes
+
+
+def process_certificate(pk, now=None):
+    """Run the processors over one certificate if it can be claimed.
+
+    Returns the resulting processing status, or None if another worker
+    holds the certificate.
+    """
+    now = now or timezone.now()
+    claimed = _claimable(now).filter(pk=pk).update(
+        processing_status='processing', processing_started_at=now
+    )
+    if not claimed:
+        return None
+
+    certificate = Certificate.objects.get(pk=pk)
+    updates = {}
+    try:
+        with local_copy(certificate.file) as path:
+            for processor in get_processors():
+                changes = processor(certificate, path) or {}
+                for field, value in changes.items():
+                    setattr(certificate, field, value)
+                updates.update(changes)
+    except CertificateRejected as exc:
+        reject_certificate(certificate, str(exc))
+        return 'rejected'
+    except Exception as exc:
+        logger.exception('Processing certificate %s failed', pk)
+        Certificate.objects.filter(pk=pk).update(
+            processing_status='failed',
+            processing_error=f'{type(exc).__name__}: {exc}',
+            processed_at=timezone.now()
+        )
+        return 'failed'
+
+    Certificate.objects.filter(pk=pk).update(
+        **updates,
+        processing_status='done',
+        processing_error='',
+        processed_at=timezone.now()
+    )
+    if updates.get('text'):
+        CalibrationRecord.objects.filter(certificate=certificate).update(
+            certificate_text=updates['text']
+        )
+    return 'done'
+
+
+def reject_certificate(certificate, reason):
+    """Delete a rejected certificate's file and detach it from records.
+
+    The row is kept, so later uploads of the same content are refused
+    without being scanned again.
+    """
+    records = CalibrationRecord.objects.filter(certificate=certificate)
+    equipment_ids = set(records.values_list('equipment_id', flat=True))
+    records.update(certificate=None, certificate_file='', certificate_text='')
+    certificate.file.delete(save=False)
+    if certificate.thumbnail:
+        certificate.thumbnail.delete(save=False)
+    Certificate.objects.filter(pk=certificate.pk).update(
+        file='',
+        thumbnail='',
+        text='',
+        processing_status='rejected',
+        processing_error=reason,
+        processed_at=timezone.now()
+    )
+    if equipment_ids:
+        bump_data_version(equipment_ids=equipment_ids)
+
+
+def run_forever(interval, workers=None, stdout=None):
+    """Process the queue every ``interval`` seconds until interrupted."""
+    while True:
+        started = time.monotonic()
+        outcomes = {}
+        try:
+            outcomes = process_pending(workers=workers)
+            expired = expire_uploads()
+            if stdout and (outcomes or expired):
+                stdout.write(
+                    f'{timezone.now():%Y-%m-%d %H:%M:%S} '
+                    f'{describe(outcomes)}, {expired} uploads expired'
+                )
+        except Exception:
+            logger.exception('Certificate processing failed')
+        # Keep draining while a full batch was processed
+        if sum(outcomes.values()) < BATCH_SIZE:
+            time.sleep(max(0, interval - (time.monotonic() - started)))
+
+
+@contextlib.contextmanager
+def local_copy(field_file):
+    """Yield a local path for a stored file, downloading it if needed."""
+    try:
+        path = field_file.storage.path(field_file.name)
+    except NotImplementedError:
+        path = None
+    if path is not None:
+        yield path
+        return
+    suffix = os.path.splitext(field_file.name)[1]
+    with tempfile.NamedTemporaryFile(suffix=suffix) as copy:
+        with field_file.storage.open(field_file.name, 'rb') as content:
+            shutil.copyfileobj(content, copy, BLOCK_SIZE)
+        copy.flush()
+        yield copy.name
+
+
+def scan_for_viruses(certificate, path):
+    """Run ``CERTIFICATE_SCAN_COMMAND``; exit status 1 means infected."""
+    command = settings.CERTIFICATE_SCAN_COMMAND
+    if not command:
+        return {}
+    result = subprocess.run(
+        [*command, path], capture_output=True, text=True, timeout=300
+    )
+    if result.returncode == 1:
+        raise CertificateRejected(result.stdout.strip() or 'Infected file.')
+    if result.returncode != 0:
+        raise RuntimeError(
+            f'Scanner exited with {result.returncode}: '
+            f'{result.stderr.strip()}'
+        )
+    return {}
+
+
+def extract_text(certificate, path):
+    """Extract PDF text for search.
+
+    Uses ``pdftotext`` from poppler when installed, otherwise a built-in
+    reader for the plain text operators of (optionally deflated) content
+    streams, which covers most generated certificates.
+    """
+    if certificate.content_type != 'application/pdf':
+        return {}
+    if shutil.which('pdftotext'):
+        result = subprocess.run(
+            ['pdftotext', '-q', '-enc', 'UTF-8', path, '-'],
+            capture_output=True, timeout=300
+        )
+        text = result.stdout.decode('utf-8', 'replace')
+    else:
+        with open(path, 'rb') as content:
+            text = pdf_text(content.read())
+    return {'text': ' '.join(text.split())[:MAX_TEXT_LENGTH]}
+
+
+def make_thumbnail(certificate, path):
+    """Render a PNG thumbnail of an image or the first page of a PDF."""
+    if certificate.content_type == 'application/pdf':
+        if not shutil.which('pdftoppm'):
+            return {}
+        result = subprocess.run(
+            ['pdftoppm', '-png', '-singlefile', '-f', '1', '-l', '1',
+             '-scale-to', str(THUMBNAIL_SIZE), path, '-'],
+            capture_output=True, timeout=300
+        )
+        if result.returncode != 0:
+            return {}
+        image = result.stdout
+    elif certificate.content_type.startswith('image/'):
+        from PIL import Image
+
+        with Image.open(path) as source:
+            source.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+            buffer = io.BytesIO()
+            source.convert('RGB').save(buffer, format='PNG')
+        image = buffer.getvalue()
+    else:
+        return {}
+
+    field = Certificate._meta.get_field('thumbnail')
+    name = f'{field.upload_to}{certificate.sha256}.png'
+    if not field.storage.exists(name):
+        name = field.storage.save(name, ContentFile(image))
+    return {'thumbnail': name}
+
+
+# Content streams, text objects and the strings shown by Tj/TJ/'/"
+_STREAM_RE = re.compile(rb'stream\r?\n(.*?)\r?\nendstream', re.S)
+_TEXT_OBJECT_RE = re.compile(rb'\bBT\b(.*?)\bET\b', re.S)
+_SHOW_TEXT_RE = re.compile(
+    rb'\[((?:\((?:\\.|[^\\)])*\)|[^\]])*)\]\s*TJ|'
+    rb'\(((?:\\.|[^\\)])*)\)\s*(?:Tj|\'|")',
+    re.S
+)
+_STRING_RE = re.compile(rb'\(((?:\\.|[^\\)])*)\)', re.S)
+_ESCAPE_RE = re.compile(rb'\\([0-7]{1,3}|.)', re.S)
+_ESCAPES = {
+    b'n': b'\n', b'r': b'\r', b't': b'\t', b'b': b'\b', b'f': b'\f',
+}
+
+
+def pdf_text(data):
+    """Return the text shown by a PDF's content streams."""
+    words = []
+    for stream in _STREAM_RE.findall(data):
+        with contextlib.suppress(zlib.error):
+            stream = zlib.decompress(stream)
+        for text_object in _TEXT_OBJECT_RE.findall(stream):
+            for array, string in _SHOW_TEXT_RE.findall(text_object):
+                parts = _STRING_RE.findall(array) if array else [string]
+                words.append(b''.join(_unescape(part) for part in parts))
+    return b' '.join(words).decode('latin-1')
+
+
+def _unescape(string):
+    def replace(match):
+        escape = match.group(1)
+        if escape[:1].isdigit():
+            return bytes([int(escape, 8) & 0xFF])
+        return _ESCAPES.get(escape, escape if escape != b'\n' else b'')
+    return _ESCAPE_RE.sub(replace, string)
+
+
+def _claimable(now):
+    timeout = now - timezone.timedelta(
+        seconds=settings.CERTIFICATE_PROCESSING_TIMEOUT
+    )
+    return Certificate.objects.filter(
+        models.Q(processing_status='pending') |
+        models.Q(
+            processing_status='processing',
+            processing_started_at__lt=timeout
+        )
+    )
+
+
+def _process_in_thread(pk):
+    try:
+        return process_certificate(pk)
+    finally:
+        # Each worker thread opens its own connections
+        connections.close_all()
+
+
+def describe(outcomes):
+    """Return a summary such as ``'3 done, 1 failed'``."""
+    return ', '.join(
+        f'{count} {outcome}' for outcome, count in sorted(outcomes.items())
+    ) or 'nothing processed'
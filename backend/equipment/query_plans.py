@@ -0,0 +1,131 @@
+# ============================================================================
+# File Path: backend/equipment/query_plans.py
+# Description: Query plan regression check for the equipment API
+# ============================================================================
+
+import json
+
+from django.db import connection
+from django.test import Client
+
+from .models import Equipment
+
+# API requests whose queries must be served by indexes
+CHECKED_REQUESTS = (
+    '/api/equipment/',
+    '/api/equipment/{equipment_id}/',
+    '/api/equipment/due_for_calibration/',
+    '/api/equipment/overdue_calibration/',
+    '/api/calibration-records/',
+    '/api/maintenance-records/',
+    # Keyset pages; the second page is followed to check the seek query
+    '/api/equipment/?cursor=',
+    '/api/calibration-records/?cursor=',
+    '/api/maintenance-records/?cursor=',
+    '/api/equipment/?ordering=-next_calibration_date&cursor=',
+    # Per-equipment history windows
+    '/api/equipment/{equipment_id}/calibrations/?cursor=',
+    '/api/equipment/{equipment_id}/maintenance/?cursor=',
+    # Filters with the default ordering, including their page counts
+    '/api/equipment/?category=Category 1',
+    '/api/equipment/?location=Location 1',
+    '/api/equipment/?manufacturer=Manufacturer 1',
+    '/api/calibration-records/?equipment={equipment_id}',
+    '/api/calibration-records/?calibration_date__gte=2024-01-01',
+    '/api/maintenance-records/?equipment={equipment_id}',
+    '/api/maintenance-records/?maintenance_type=preventive',
+    '/api/maintenance-records/?maintenance_date__lte=2024-06-30',
+    # Whitelisted orderings
+    '/api/equipment/?ordering=-name',
+    '/api/equipment/?ordering=serial_number',
+    '/api/equipment/?ordering=next_calibration_date',
+    '/api/equipment/?ordering=next_calibration_date'
+    '&next_calibration_date__gte=2025-01-01',
+    '/api/calibration-records/?ordering=calibration_date',
+    '/api/maintenance-records/?ordering=maintenance_date',
+    # Sync feed
+    '/api/sync/',
+)
+
+
+class QueryPlanError(Exception):
+    """A check that could not be carried out."""
+
+
+def check_requests(progress=None):
+    """Issue the checked requests and EXPLAIN the queries they ran.
+
+    Returns a list of ``(path, sql, problems)`` for every query whose plan
+    has a sequential scan or a sort step. ``progress`` is called with each
+    path and its number of queries.
+    """
+    equipment_id = Equipment.objects.values_list('pk', flat=True).first()
+    client = Client()
+    failures = []
+    paths = [
+        template.format(equipment_id=equipment_id)
+        for template in CHECKED_REQUESTS
+    ]
+    while paths:
+        path = paths.pop(0)
+        queries = []
+
+        def capture(execute, sql, params, many, context):
+            queries.append((sql, params))
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(capture):
+            response = client.get(path)
+        if response.status_code != 200:
+            raise QueryPlanError(f'{path} returned {response.status_code}')
+        if path.endswith('cursor=') and response.json()['next']:
+            paths.insert(0, response.json()['next'])
+
+        for sql, params in queries:
+            if not sql.lstrip().upper().startswith('SELECT'):
+                continue
+            # Unfiltered totals are inherently full scans
+            if sql.startswith('SELECT COUNT(*)') and ' WHERE ' not in sql:
+                continue
+            problems = explain(sql, params)
+            if problems:
+                failures.append((path, sql, problems))
+        if progress is not None:
+            progress(path, len(queries))
+    return failures
+
+
+def explain(sql, params):
+    """Return the plan problems found for ``sql``."""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return _postgres_problems(plan[0]['Plan'])
+        if connection.vendor == 'sqlite':
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            return _sqlite_problems(row[-1] for row in cursor.fetchall())
+    raise QueryPlanError(f'Unsupported database vendor: {connection.vendor}')
+
+
+def _postgres_problems(node):
+    problems = []
+    if node['Node Type'] == 'Seq Scan':
+        problems.append(f"sequential scan on {node['Relation Name']}")
+    elif node['Node Type'] in ('Sort', 'Incremental Sort'):
+        problems.append(f"sort on {', '.join(node.get('Sort Key', []))}")
+    for child in node.get('Plans', []):
+        problems.extend(_postgres_problems(child))
+    return problems
+
+
+def _sqlite_problems(details):
+    problems = []
+    for detail in details:
+        if detail.startswith('SCAN ') and ' USING ' not in detail:
+            problems.append(detail.lower().replace('scan', 'full scan of', 1))
+        elif detail.startswith('USE TEMP B-TREE'):
+            problems.append(detail.lower())
+    return problems
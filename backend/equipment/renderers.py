@@ -0,0 +1,41 @@
+# ============================================================================
+# File Path: backend/equipment/renderers.py
+# Description: orjson-based JSON renderer
+# ============================================================================
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Render JSON with orjson, byte for byte as ``JSONRenderer`` would.
+
+    Types orjson does not handle the same way, such as dates and decimals,
+    go through the DRF encoder, and anything orjson rejects falls back to
+    ``JSONRenderer``, as do indented and ASCII-only output. Floats are the
+    exception: orjson writes e.g. ``1e-05`` as ``0.00001``, so use this
+    renderer for payloads without float values.
+    """
+
+    options = (
+        orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default, option=self.options
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Escaped like JSONRenderer to keep the output a JavaScript subset
+        if b'\xe2\x80' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(
+                b'\xe2\x80\xa9', b'\\u2029'
+            )
+        return ret
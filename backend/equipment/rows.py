@@ -0,0 +1,182 @@
+# ============================================================================
+# File Path: backend/equipment/rows.py
+# Description: Read-optimized serialization of values() rows
+# ============================================================================
+
+import datetime
+import decimal
+import operator
+
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import ISO_8601, fields, relations
+from rest_framework.settings import api_settings
+
+# Fields whose to_representation() returns database values unchanged
+IDENTITY_FIELDS = (
+    fields.BooleanField, fields.CharField, fields.EmailField,
+    fields.FloatField, fields.IntegerField, fields.SlugField,
+    fields.URLField,
+)
+
+
+class RowSerializer:
+    """Serialize ``values()`` rows exactly as a ModelSerializer would.
+
+    Fields backed by a model column are read from the row and converted by
+    a function chosen once per field, equivalent to the field's
+    ``to_representation()``. Other fields are listed in ``computed`` as
+    ``name: (columns, function)``, where the function returns the
+    attribute the field would read from an instance. Rows come out with
+    the serializer's keys in its order, without building model instances
+    or dispatching through every field of every row.
+    """
+
+    def __init__(self, serializer_class, computed=None, context=None):
+        computed = computed or {}
+        serializer = serializer_class(context=context)
+        model = serializer.Meta.model
+        columns = []
+        self.plan = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if name in computed:
+                needed, get = computed[name]
+                columns.extend(needed)
+            elif '.' in field.source or field.source == '*':
+                raise ImproperlyConfigured(
+                    f'Field "{name}" needs a computed value.'
+                )
+            else:
+                column = model._meta.get_field(field.source).attname
+                columns.append(column)
+                get = operator.itemgetter(column)
+            if isinstance(field, fields.SerializerMethodField):
+                # The computed value is the representation
+                convert = None
+            else:
+                convert = _converter(field, name)
+            self.plan.append((name, get, convert))
+        self.columns = list(dict.fromkeys(columns))
+
+    def project(self, queryset):
+        """Return ``queryset`` as ``values()`` rows with every column needed.
+
+        Selected annotations, such as a search rank the queryset is ordered
+        by, are kept so keyset pagination can read them from the rows.
+        """
+        return queryset.values(
+            *dict.fromkeys([
+                *self.columns, *queryset.query.annotation_select
+            ])
+        )
+
+    def to_representation(self, rows):
+        plan = self.plan
+        data = []
+        for row in rows:
+            item = {}
+            for name, get, convert in plan:
+                value = get(row)
+                item[name] = (
+                    value if value is None or convert is None
+                    else convert(value)
+                )
+            data.append(item)
+        return data
+
+
+def _converter(field, name):
+    """Return the conversion of non-null values for ``field``.
+
+    ``None`` stands for values passed through unchanged. Fields without a
+    faster equivalent use their own ``to_representation()``.
+    """
+    kind = type(field)
+    if kind in IDENTITY_FIELDS:
+        return None
+    if kind is fields.ChoiceField and all(
+            key == value
+            for key, value in field.choice_strings_to_values.items()):
+        return None
+    if kind is fields.JSONField and not field.binary:
+        return None
+    if kind is relations.PrimaryKeyRelatedField and field.pk_field is None:
+        # Rows hold the foreign key column
+        return None
+    if kind is fields.DateField:
+        output_format = getattr(field, 'format', api_settings.DATE_FORMAT)
+        if isinstance(output_format, str):
+            if output_format.lower() == ISO_8601:
+                return datetime.date.isoformat
+            if output_format == '%Y-%m-%d':
+                return _iso_date
+            return lambda value: value.strftime(output_format)
+    if kind is fields.DecimalField:
+        return _decimal_converter(field)
+    if kind is fields.DateTimeField:
+        return _datetime_converter(field)
+    if isinstance(
+            field, (relations.RelatedField, fields.SerializerMethodField)):
+        raise ImproperlyConfigured(f'Field "{name}" needs a computed value.')
+    return field.to_representation
+
+
+def _decimal_converter(field):
+    """Return ``field.to_representation`` with the quantize set up once."""
+    coerce_to_string = getattr(
+        field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING
+    )
+    if (field.decimal_places is None or field.localize
+            or not coerce_to_string):
+        return field.to_representation
+    exponent = decimal.Decimal('.1') ** field.decimal_places
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+    rounding = field.rounding
+
+    def convert(value):
+        if not isinstance(value, decimal.Decimal):
+            value = decimal.Decimal(str(value).strip())
+        return '{:f}'.format(
+            value.quantize(exponent, rounding=rounding, context=context)
+        )
+
+    return convert
+
+
+def _datetime_converter(field):
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    timezone = (
+        field.timezone if hasattr(field, 'timezone')
+        else field.default_timezone()
+    )
+    if not isinstance(output_format, str) or timezone is None:
+        return field.to_representation
+    iso = output_format.lower() == ISO_8601
+    offset_format = output_format == '%Y-%m-%dT%H:%M:%S%z'
+
+    def convert(value):
+        if value.tzinfo is None:
+            return field.to_representation(value)
+        value = value.astimezone(timezone)
+        if offset_format and value.year >= 1000:
+            # isoformat() is several times faster than strftime()
+            value = value.isoformat(timespec='seconds')
+            return value[:19] + value[19:].replace(':', '')
+        if not iso:
+            return value.strftime(output_format)
+        value = value.isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+
+    return convert
+
+
+def _iso_date(value):
+    # strftime() does not zero-pad years before 1000
+    if value.year >= 1000:
+        return value.isoformat()
+    return value.strftime('%Y-%m-%d')
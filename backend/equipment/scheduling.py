@@ -0,0 +1,196 @@
+# ============================================================================
+# File Path: backend/equipment/scheduling.py
+# Description: Calibration interval arithmetic and batch rescheduling
+# ============================================================================
+
+import calendar
+import datetime
+
+from django.db import connections, models, transaction
+from django.utils import timezone
+
+from .cache import bump_data_version
+
+INTERVAL_TYPES = ('hourly', 'daily', 'weekly', 'monthly', 'yearly')
+
+# Rows per bulk_update on databases without interval arithmetic
+RESCHEDULE_BATCH_SIZE = 1000
+
+# Fields next_calibration_date is derived from
+SCHEDULE_FIELDS = (
+    'last_calibration_date', 'calibration_interval_type',
+    'calibration_interval_value',
+)
+
+
+def add_months(value, months):
+    """Add calendar months, clamping to the last day of shorter months."""
+    month_index = value.month - 1 + months
+    year = value.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(value.day, calendar.monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
+
+
+def add_interval(value, interval_type, interval_value):
+    """Return ``value`` moved forward by one calibration interval.
+
+    Months and years follow the calendar (31 January + 1 month is the last
+    day of February) instead of being approximated as 30 or 365 days.
+    """
+    if interval_type == 'hourly':
+        return value + datetime.timedelta(hours=interval_value)
+    if interval_type == 'daily':
+        return value + datetime.timedelta(days=interval_value)
+    if interval_type == 'weekly':
+        return value + datetime.timedelta(weeks=interval_value)
+    if interval_type == 'monthly':
+        return add_months(value, interval_value)
+    if interval_type == 'yearly':
+        return add_months(value, 12 * interval_value)
+    raise ValueError(f'Unknown calibration interval type: {interval_type}')
+
+
+def next_calibration_date(last_calibration_date, interval_type,
+                          interval_value):
+    """Return the next due date, or None if the schedule is incomplete."""
+    if not (last_calibration_date and interval_type and interval_value):
+        return None
+    return add_interval(last_calibration_date, interval_type, interval_value)
+
+
+def rescheduled_date(data, instance=None):
+    """Return the due date a write of ``data`` moves equipment to, or None.
+
+    The rule for single and bulk writes alike: a write changing the last
+    calibration date or the interval, without giving the next date itself,
+    reschedules from the resulting values. Fields missing from a partial
+    write keep the ``instance``'s values and a missing interval value
+    counts as one. None leaves the due date as it is, which is also the
+    case when the schedule is incomplete.
+    """
+    if data.get('next_calibration_date') or not any(
+            field in data for field in SCHEDULE_FIELDS):
+        return None
+    last_calibration, interval_type, interval_value = (
+        data.get(field, getattr(instance, field, None))
+        for field in SCHEDULE_FIELDS
+    )
+    return next_calibration_date(
+        last_calibration, interval_type, interval_value or 1
+    )
+
+
+class MakeInterval(models.Func):
+    """PostgreSQL ``make_interval(<unit> => <value>)``."""
+
+    function = 'make_interval'
+    output_field = models.DurationField()
+
+    def __init__(self, unit, value, **extra):
+        super().__init__(value, unit=unit, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler,
+            connection,
+            template='%(function)s(%(unit)s => %(expressions)s)',
+            **extra_context
+        )
+
+
+# Interval type -> (make_interval unit, multiplier)
+_INTERVAL_UNITS = {
+    'hourly': ('hours', 1),
+    'daily': ('days', 1),
+    'weekly': ('weeks', 1),
+    'monthly': ('months', 1),
+    'yearly': ('months', 12),
+}
+
+
+def next_calibration_expression():
+    """Return a PostgreSQL expression computing the next due date per row.
+
+    ``timestamptz + make_interval(months => n)`` follows the calendar and
+    clamps to the end of shorter months, matching ``add_interval``.
+    """
+    whens = []
+    for interval_type, (unit, multiplier) in _INTERVAL_UNITS.items():
+        value = models.F('calibration_interval_value')
+        if multiplier != 1:
+            value = value * multiplier
+        whens.append(models.When(
+            calibration_interval_type=interval_type,
+            then=models.F('last_calibration_date') + MakeInterval(unit, value)
+        ))
+    return models.Case(*whens, output_field=models.DateTimeField())
+
+
+def reschedule(queryset, interval_type=None, interval_value=None):
+    """Recompute ``next_calibration_date`` for every row of ``queryset``.
+
+    When ``interval_type``/``interval_value`` are given the interval policy
+    is changed first. On PostgreSQL the dates are recomputed with a single
+    ``UPDATE`` using interval arithmetic; other databases read the matching
+    keys and write the rows back in batches with ``bulk_update``. Stored
+    statuses are then reconciled in one more ``UPDATE``. Everything runs in
+    one transaction and rescheduled rows get a new ``updated_at``. Returns
+    the number of rescheduled rows.
+    """
+    now = timezone.now()
+    with transaction.atomic(using=queryset.db):
+        if interval_type or interval_value:
+            changes = {'updated_at': now}
+            if interval_type:
+                changes['calibration_interval_type'] = interval_type
+            if interval_value:
+                changes['calibration_interval_value'] = interval_value
+            queryset.update(**changes)
+
+        schedulable = queryset.filter(
+            last_calibration_date__isnull=False,
+            calibration_interval_type__in=INTERVAL_TYPES,
+            calibration_interval_value__isnull=False,
+        )
+        if connections[queryset.db].vendor == 'postgresql':
+            count = schedulable.update(
+                next_calibration_date=next_calibration_expression(),
+                updated_at=now
+            )
+        else:
+            count = _reschedule_in_batches(schedulable, now)
+
+        queryset.reconcile_status()
+        bump_data_version()
+    return count
+
+
+def _reschedule_in_batches(queryset, now):
+    model = queryset.model
+    # Snapshot the keys so no cursor over the table is open while the
+    # batches are written
+    pks = list(queryset.order_by('pk').values_list('pk', flat=True))
+
+    count = 0
+    for start in range(0, len(pks), RESCHEDULE_BATCH_SIZE):
+        rows = model.objects.filter(
+            pk__in=pks[start:start + RESCHEDULE_BATCH_SIZE]
+        ).values_list(
+            'pk', 'last_calibration_date', 'calibration_interval_type',
+            'calibration_interval_value'
+        )
+        batch = [
+            model(
+                pk=pk,
+                next_calibration_date=add_interval(
+                    last, interval_type, interval_value
+                ),
+                updated_at=now
+            )
+            for pk, last, interval_type, interval_value in rows
+        ]
+        count += model.objects.bulk_update(
+            batch, ['next_calibration_date', 'updated_at']
+        )
+    return count
@@ -0,0 +1,310 @@
+# ============================================================================
+# File Path: backend/equipment/schemas.py
+# Description: Compiled, versioned schemas for calibration measurement JSON
+# ============================================================================
+
+import functools
+import json
+import math
+import os
+import re
+from collections import namedtuple
+
+from django.conf import settings
+from django.utils.text import slugify
+
+# Calibration record columns covered by measurement schemas
+MEASUREMENT_COLUMNS = ('measurement_points', 'results')
+
+# Schema files are named "<category slug>.v<version>.json"; "default" applies
+# to categories without schemas of their own
+SCHEMA_FILE_RE = re.compile(r'^(?P<name>[\w-]+)\.v(?P<version>\d+)\.json$')
+DEFAULT_SCHEMA = 'default'
+
+# Errors reported per column; validation stops collecting after these
+MAX_ERRORS = 20
+
+# Supported JSON Schema keywords
+KEYWORDS = {
+    'type', 'enum', 'properties', 'required', 'additionalProperties',
+    'items', 'minItems', 'maxItems', 'minimum', 'maximum', 'minLength',
+    'maxLength', 'description',
+}
+TYPES = {'object', 'array', 'string', 'number', 'integer', 'boolean', 'null'}
+
+# Largest integer a float represents exactly
+MAX_EXACT_INTEGER = 2 ** 53
+
+# A compiled schema; ``label`` is stored on validated records
+MeasurementSchema = namedtuple('MeasurementSchema', 'label validators')
+
+
+class SchemaError(ValueError):
+    """A schema file that cannot be compiled."""
+
+
+class CompactJSONEncoder(json.JSONEncoder):
+    """Encode JSON columns without whitespace and with sorted keys.
+
+    Equal values are stored as identical text, and the columns are smaller
+    and faster to parse on databases storing JSON as text.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.update(
+            separators=(',', ':'), sort_keys=True, ensure_ascii=False,
+            allow_nan=False
+        )
+        super().__init__(**kwargs)
+
+
+def validate_measurements(category, measurement_points, results):
+    """Validate and normalize measurement JSON for equipment ``category``.
+
+    Returns ``(label, values, errors)``: the label of the schema applied,
+    the normalized column values and a dict of error messages per column.
+    Normalized values have sorted keys, numeric strings converted where
+    numbers are expected, integral floats as integers and strings stripped.
+    """
+    schema = get_schema(category)
+    values, errors = {}, {}
+    for column, value in zip(
+            MEASUREMENT_COLUMNS, (measurement_points, results)):
+        messages = []
+        values[column] = schema.validators[column](value, '', messages)
+        if messages:
+            errors[column] = messages[:MAX_ERRORS]
+    return schema.label, values, errors
+
+
+def get_schema(category):
+    """Return the latest compiled schema applying to ``category``."""
+    schemas = load_schemas(settings.MEASUREMENT_SCHEMA_DIR)
+    versions = schemas.get(slugify(category or '')) or schemas[DEFAULT_SCHEMA]
+    return versions[max(versions)]
+
+
+@functools.lru_cache(maxsize=None)
+def load_schemas(directory):
+    """Compile every schema file of ``directory``, once per process.
+
+    Returns ``{name: {version: MeasurementSchema}}``. Old versions stay
+    loadable so records can be checked against the schema they were
+    written with.
+    """
+    schemas = {}
+    for filename in sorted(os.listdir(directory)):
+        match = SCHEMA_FILE_RE.match(filename)
+        if not match:
+            continue
+        name, version = match['name'], int(match['version'])
+        with open(os.path.join(directory, filename), encoding='utf-8') as f:
+            definition = json.load(f)
+        try:
+            validators = {
+                column: compile_schema(definition.get(column, {}))
+                for column in MEASUREMENT_COLUMNS
+            }
+        except SchemaError as exc:
+            raise SchemaError(f'{filename}: {exc}') from None
+        schemas.setdefault(name, {})[version] = MeasurementSchema(
+            f'{name}.v{version}', validators
+        )
+    if DEFAULT_SCHEMA not in schemas:
+        raise SchemaError(f'No "{DEFAULT_SCHEMA}" schema in {directory}.')
+    return schemas
+
+
+def compile_schema(schema):
+    """Compile a JSON Schema subset into a normalizing validator.
+
+    The validator is called as ``validator(value, path, errors)``; it
+    appends messages to ``errors`` and returns the normalized value. All
+    keyword handling is resolved here, so validation is a single pass of
+    plain function calls.
+    """
+    if not isinstance(schema, dict):
+        raise SchemaError('A schema must be an object.')
+    unknown = set(schema) - KEYWORDS
+    if unknown:
+        raise SchemaError(
+            f'Unsupported keywords: {", ".join(sorted(unknown))}.'
+        )
+
+    types = schema.get('type')
+    if isinstance(types, str):
+        types = [types]
+    types = frozenset(types or ())
+    if types - TYPES:
+        raise SchemaError(
+            f'Unknown types: {", ".join(sorted(types - TYPES))}.'
+        )
+    if 'number' in types:
+        types |= {'integer'}
+    expected = _describe(types)
+    coerce_numbers = bool(types & {'number', 'integer'}) and (
+        'string' not in types
+    )
+
+    enum = schema.get('enum')
+    properties = {
+        name: compile_schema(child)
+        for name, child in schema.get('properties', {}).items()
+    }
+    required = tuple(schema.get('required', ()))
+    additional = schema.get('additionalProperties', True)
+    if isinstance(additional, dict):
+        additional = compile_schema(additional)
+    items = compile_schema(schema['items']) if 'items' in schema else None
+    min_items, max_items = schema.get('minItems'), schema.get('maxItems')
+    minimum, maximum = schema.get('minimum'), schema.get('maximum')
+    min_length, max_length = schema.get('minLength'), schema.get('maxLength')
+
+    def validate(value, path, errors):
+        if coerce_numbers and isinstance(value, str):
+            value = _parse_number(value, value)
+        value = _canonical_scalar(value)
+        kind = _kind(value)
+        if kind is None:
+            errors.append(_message(path, 'Expected a finite number.'))
+            return value
+        if types and kind not in types:
+            errors.append(_message(path, f'Expected {expected}.'))
+            return value
+
+        if kind == 'object':
+            result = {}
+            for key in sorted(value):
+                child = properties.get(key)
+                child_path = f'{path}.{key}' if path else key
+                if child is not None:
+                    result[key] = child(value[key], child_path, errors)
+                elif additional is True:
+                    result[key] = _any(value[key], child_path, errors)
+                elif additional is False:
+                    errors.append(_message(child_path, 'Unexpected field.'))
+                else:
+                    result[key] = additional(value[key], child_path, errors)
+            for key in required:
+                if key not in value:
+                    errors.append(_message(
+                        f'{path}.{key}' if path else key,
+                        'This field is required.'
+                    ))
+            value = result
+        elif kind == 'array':
+            if min_items is not None and len(value) < min_items:
+                errors.append(_message(
+                    path, f'Expected at least {min_items} items.'
+                ))
+            if max_items is not None and len(value) > max_items:
+                errors.append(_message(
+                    path, f'Expected at most {max_items} items.'
+                ))
+            if items is not None:
+                value = [
+                    items(item, f'{path}[{index}]', errors)
+                    for index, item in enumerate(value)
+                ]
+            else:
+                value = [
+                    _any(item, f'{path}[{index}]', errors)
+                    for index, item in enumerate(value)
+                ]
+        elif kind in ('number', 'integer'):
+            if minimum is not None and value < minimum:
+                errors.append(_message(
+                    path, f'Ensure this value is at least {minimum}.'
+                ))
+            if maximum is not None and value > maximum:
+                errors.append(_message(
+                    path, f'Ensure this value is at most {maximum}.'
+                ))
+        elif kind == 'string':
+            value = value.strip()
+            if min_length is not None and len(value) < min_length:
+                errors.append(_message(
+                    path, f'Ensure this field has at least {min_length} '
+                    'characters.'
+                ))
+            if max_length is not None and len(value) > max_length:
+                errors.append(_message(
+                    path, f'Ensure this field has no more than {max_length} '
+                    'characters.'
+                ))
+
+        if enum is not None and value not in enum:
+            errors.append(_message(
+                path, f'Expected one of {", ".join(map(str, enum))}.'
+            ))
+        return value
+
+    return validate
+
+
+def _kind(value):
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer'
+    if isinstance(value, float):
+        return 'number' if math.isfinite(value) else None
+    if isinstance(value, str):
+        return 'string'
+    if isinstance(value, dict):
+        return 'object'
+    if isinstance(value, list):
+        return 'array'
+    return None
+
+
+def _parse_number(text, default):
+    """Return the number written in ``text``, or ``default``."""
+    text = text.strip().lstrip('±+')
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return default
+
+
+def _canonical_scalar(value):
+    # 100.0 and 100 are the same JSON number; store the shorter
+    if isinstance(value, float) and value.is_integer() and (
+            abs(value) <= MAX_EXACT_INTEGER):
+        return int(value)
+    return value
+
+
+def _any(value, path, errors):
+    """Normalize a value the schema does not describe."""
+    if isinstance(value, dict):
+        return {
+            key: _any(value[key], f'{path}.{key}' if path else key, errors)
+            for key in sorted(value)
+        }
+    if isinstance(value, list):
+        return [
+            _any(item, f'{path}[{index}]', errors)
+            for index, item in enumerate(value)
+        ]
+    value = _canonical_scalar(value)
+    if _kind(value) is None:
+        errors.append(_message(path, 'Expected a finite number.'))
+    return value
+
+
+def _describe(types):
+    names = sorted(types - {'integer'} if 'number' in types else types)
+    return ' or '.join(
+        f'{"an" if name[0] in "aeiou" else "a"} {name}' for name in names
+    )
+
+
+def _message(path, message):
+    return f'{path}: {message}' if path else message
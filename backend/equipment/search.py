@@ -0,0 +1,344 @@
+# ============================================================================
+# File Path: backend/equipment/search.py
+# Description: Indexed, ranked full-text search over equipment and records
+# ============================================================================
+
+import re
+
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import (
+    SearchQuery, SearchRank, SearchVector, TrigramWordSimilarity,
+)
+from django.db import connections, models
+from django.db.models.functions import Coalesce
+from rest_framework.filters import BaseFilterBackend
+
+from .models import Equipment, CalibrationRecord, MaintenanceRecord
+
+# Model -> (primary text fields, secondary text fields, trigram fields).
+# Primary fields rank higher; trigram fields also match misspellings.
+SEARCH_FIELDS = {
+    Equipment: (
+        ('name', 'serial_number'),
+        ('model_number', 'manufacturer', 'location', 'notes'),
+        ('name', 'serial_number', 'model_number', 'manufacturer', 'location'),
+    ),
+    CalibrationRecord: (
+        ('certificate_number',),
+        ('calibrated_by', 'calibration_standard', 'notes',
+         'certificate_text'),
+        ('certificate_number', 'calibrated_by'),
+    ),
+    MaintenanceRecord: (
+        ('description',),
+        ('performed_by', 'parts_replaced', 'notes'),
+        ('description', 'performed_by'),
+    ),
+}
+
+# Index name prefixes, matching the models' other indexes
+INDEX_PREFIXES = {
+    Equipment: 'equipment',
+    CalibrationRecord: 'calrec',
+    MaintenanceRecord: 'mntrec',
+}
+
+# Text search configuration; 'simple' does not stem serials and model codes
+SEARCH_CONFIG = 'simple'
+
+# Share of the query's trigrams a row must contain on SQLite, mirroring
+# pg_trgm's default word similarity threshold
+TRIGRAM_THRESHOLD = 0.6
+
+
+def search_vector(model):
+    """Return the weighted ``tsvector`` expression indexed for ``model``."""
+    primary, secondary, _ = SEARCH_FIELDS[model]
+    return (
+        SearchVector(*primary, config=SEARCH_CONFIG, weight='A') +
+        SearchVector(*secondary, config=SEARCH_CONFIG, weight='B')
+    )
+
+
+class JoinText(models.Func):
+    """Space-separated ``||`` concatenation.
+
+    Unlike ``Concat``, which uses ``CONCAT()`` on PostgreSQL, this is
+    immutable and therefore usable in an index expression.
+    """
+
+    template = '(%(expressions)s)'
+    arg_joiner = " || ' ' || "
+    output_field = models.TextField()
+
+
+def trigram_text(model):
+    """Return the text expression indexed with ``gin_trgm_ops``."""
+    _, _, fields = SEARCH_FIELDS[model]
+    return JoinText(*[
+        Coalesce(models.F(field), models.Value('')) for field in fields
+    ])
+
+
+def search(queryset, query):
+    """Filter ``queryset`` to rows matching ``query``, annotated with a rank.
+
+    The rank is annotated as ``search_rank``, higher being more relevant.
+    """
+    vendor = connections[queryset.db].vendor
+    if vendor == 'postgresql':
+        return _search_postgresql(queryset, query)
+    if vendor == 'sqlite':
+        return _search_sqlite(queryset, query)
+    return _search_unindexed(queryset, query)
+
+
+def _search_postgresql(queryset, query):
+    model = queryset.model
+    vector = search_vector(model)
+    text = trigram_text(model)
+    search_query = SearchQuery(
+        query, config=SEARCH_CONFIG, search_type='websearch'
+    )
+    # Both conditions match the index expressions exactly, so the planner
+    # can combine the two GIN indexes with a bitmap OR
+    return (
+        queryset
+        .alias(search_document=vector, search_text=text)
+        .filter(
+            models.Q(search_document=search_query) |
+            models.Q(search_text__trigram_word_similar=query)
+        )
+        .annotate(search_rank=models.ExpressionWrapper(
+            SearchRank(vector, search_query) +
+            TrigramWordSimilarity(query, text),
+            output_field=models.FloatField()
+        ))
+    )
+
+
+def _search_sqlite(queryset, query):
+    model = queryset.model
+    words = [word for word in _words(query) if len(word) >= 3]
+    if not words:
+        # The trigram tokenizer cannot look up words shorter than three
+        # characters
+        return _search_unindexed(queryset, query)
+
+    # Rows containing every word are cheap to find and rank; fall back to
+    # matching shared trigrams only when there are none, for typos
+    exact = ' AND '.join(f'"{word}"' for word in words)
+    ranks = {
+        pk: rank for pk, rank, *_ in _fts_search(queryset, exact)
+    }
+    if not ranks:
+        trigrams = _trigrams(words)
+        fuzzy = ' OR '.join(f'"{trigram}"' for trigram in sorted(trigrams))
+        # Oversample, since the threshold below discards weak matches
+        for pk, rank, *values in _fts_search(
+            queryset, fuzzy, oversample=10
+        ):
+            found = _trigrams(_words(' '.join(filter(None, values))))
+            similarity = len(trigrams & found) / len(trigrams)
+            if similarity >= TRIGRAM_THRESHOLD:
+                ranks[pk] = rank * similarity
+            if len(ranks) >= settings.SEARCH_MAX_RESULTS:
+                break
+
+    if not ranks:
+        return queryset.none().annotate(
+            search_rank=models.Value(0.0, output_field=models.FloatField())
+        )
+    return queryset.filter(pk__in=ranks).annotate(search_rank=models.Case(
+        *[models.When(pk=pk, then=models.Value(rank))
+          for pk, rank in ranks.items()],
+        output_field=models.FloatField()
+    ))
+
+
+def _fts_search(queryset, match, oversample=1):
+    """Return ``(rowid, rank, *columns)`` rows of an FTS5 query, best first."""
+    model = queryset.model
+    table = fts_table(model)
+    sql = (
+        f'SELECT rowid, -{_bm25(model)}, {", ".join(_fts_columns(model))} '
+        f'FROM {table} WHERE {table} MATCH %s '
+        f'ORDER BY {_bm25(model)} LIMIT %s'
+    )
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(sql, [match, settings.SEARCH_MAX_RESULTS * oversample])
+        return cursor.fetchall()
+
+
+def _search_unindexed(queryset, query):
+    primary, secondary, _ = SEARCH_FIELDS[queryset.model]
+    condition = models.Q()
+    for word in query.split():
+        matches_word = models.Q()
+        for field in primary + secondary:
+            matches_word |= models.Q(**{f'{field}__icontains': word})
+        condition &= matches_word
+    return queryset.filter(condition).annotate(
+        search_rank=models.Value(0.0, output_field=models.FloatField())
+    )
+
+
+def _words(text):
+    return re.findall(r'\w+', text.lower())
+
+
+def _trigrams(words):
+    return {
+        word[i:i + 3] for word in words for i in range(len(word) - 2)
+    }
+
+
+class IndexedSearchFilter(BaseFilterBackend):
+    """Rank-ordered search on the ``q`` query parameter."""
+
+    search_param = 'q'
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '').strip()
+        if not query:
+            return queryset
+        return search(queryset, query).order_by('-search_rank', 'pk')
+
+
+class IndexedSearchAdminMixin:
+    """Use the search index for the admin changelist search box."""
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        return search(queryset, search_term), False
+
+
+def fts_table(model):
+    return f'{model._meta.db_table}_search'
+
+
+def _fts_fields(model):
+    primary, secondary, trigram = SEARCH_FIELDS[model]
+    return list(dict.fromkeys(primary + secondary + trigram))
+
+
+def _fts_columns(model):
+    return [
+        model._meta.get_field(field).column for field in _fts_fields(model)
+    ]
+
+
+def _bm25(model):
+    """Return the bm25() call weighting primary fields double."""
+    primary = SEARCH_FIELDS[model][0]
+    weights = ', '.join(
+        '2.0' if field in primary else '1.0' for field in _fts_fields(model)
+    )
+    return f'bm25({fts_table(model)}, {weights})'
+
+
+def gin_indexes(model):
+    """Return the PostgreSQL GIN indexes backing search on ``model``."""
+    prefix = INDEX_PREFIXES[model]
+    return [
+        GinIndex(search_vector(model), name=f'{prefix}_search_idx'),
+        GinIndex(
+            OpClass(trigram_text(model), name='gin_trgm_ops'),
+            name=f'{prefix}_trgm_idx'
+        ),
+    ]
+
+
+def install_search_indexes(schema_editor, models_=None):
+    """Create the search indexes; safe to call repeatedly.
+
+    On PostgreSQL these are GIN expression indexes, the trigram one
+    requiring the ``pg_trgm`` extension. On SQLite each table
+    gets an external-content FTS5 table using the trigram tokenizer, kept
+    up to date by triggers. SQLite drops triggers whenever Django rebuilds
+    a table, so this also runs after every ``migrate``. Models whose search
+    columns do not exist yet are skipped; the migration adding the columns
+    installs their index.
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for model in models_ or SEARCH_FIELDS:
+        if not _has_search_columns(schema_editor.connection, model):
+            continue
+        if vendor == 'postgresql':
+            for index in gin_indexes(model):
+                sql = str(index.create_sql(model, schema_editor)).replace(
+                    'CREATE INDEX', 'CREATE INDEX IF NOT EXISTS', 1
+                )
+                schema_editor.execute(sql)
+        elif vendor == 'sqlite':
+            _install_fts(schema_editor, model)
+
+
+def uninstall_search_indexes(schema_editor, models_=None):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for model in models_ or SEARCH_FIELDS:
+        if vendor == 'postgresql':
+            for index in gin_indexes(model):
+                schema_editor.execute(f'DROP INDEX IF EXISTS {index.name}')
+        elif vendor == 'sqlite':
+            table = fts_table(model)
+            for suffix in ('ai', 'ad', 'au'):
+                schema_editor.execute(
+                    f'DROP TRIGGER IF EXISTS {table}_{suffix}'
+                )
+            schema_editor.execute(f'DROP TABLE IF EXISTS {table}')
+
+
+def _has_search_columns(connection, model):
+    with connection.cursor() as cursor:
+        columns = {
+            column.name for column in
+            connection.introspection.get_table_description(
+                cursor, model._meta.db_table
+            )
+        }
+    return columns.issuperset(_fts_columns(model))
+
+
+def _install_fts(schema_editor, model):
+    content = model._meta.db_table
+    table = fts_table(model)
+    columns = _fts_columns(model)
+    new = ', '.join(f'new.{column}' for column in columns)
+    old = ', '.join(f'old.{column}' for column in columns)
+    names = ', '.join(columns)
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' "
+            "AND name IN (%s, %s, %s)",
+            [f'{table}_ai', f'{table}_ad', f'{table}_au']
+        )
+        if cursor.fetchone()[0] == 3:
+            return
+
+    statements = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5({names}, "
+        f"content='{content}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON {content} "
+        f"BEGIN INSERT INTO {table}(rowid, {names}) VALUES (new.id, {new}); "
+        f"END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON {content} "
+        f"BEGIN INSERT INTO {table}({table}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE ON {content} "
+        f"BEGIN INSERT INTO {table}({table}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {table}(rowid, {names}) VALUES (new.id, {new}); END",
+        # Index rows written while the triggers were missing
+        f"INSERT INTO {table}({table}) VALUES ('rebuild')",
+    ]
+    for statement in statements:
+        schema_editor.execute(statement)
@@ -0,0 +1,318 @@
+# ============================================================================
+# File Path: backend/equipment/seeding.py
+# Description: Synthetic data generation for benchmarks and plan checks
+# ============================================================================
+
+import datetime
+import random
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .cache import bump_data_version
+from .measurements import build_points
+from .models import (
+    Equipment, CalibrationRecord, MaintenanceRecord, MeasurementPoint,
+)
+from .scheduling import add_interval
+from .schemas import validate_measurements
+from .summaries import refresh_summaries
+
+# Fleet catalogue: category -> (calibration interval, standard,
+# manufacturers, measurement points as (name, nominal, unit, tolerance))
+FLEET_CATEGORIES = {
+    'Pressure Gauge': (
+        ('monthly', 6), 'Deadweight tester DWT-1', ('WIKA', 'Beamex'),
+        [('0 bar', 0, 'bar', 0.05), ('10 bar', 10, 'bar', 0.1),
+         ('50 bar', 50, 'bar', 0.25), ('100 bar', 100, 'bar', 0.5)],
+    ),
+    'Digital Multimeter': (
+        ('yearly', 1), 'Multifunction calibrator MFC-5', ('Fluke', 'Keysight'),
+        [('1 V DC', 1, 'V', 0.0005), ('10 V DC', 10, 'V', 0.004),
+         ('100 V DC', 100, 'V', 0.05), ('1 A DC', 1, 'A', 0.002),
+         ('10 kOhm', 10, 'kOhm', 0.005)],
+    ),
+    'Thermometer': (
+        ('monthly', 6), 'Reference PRT-100', ('Fluke', 'Omega'),
+        [('0 C', 0, 'C', 0.2), ('37 C', 37, 'C', 0.2),
+         ('100 C', 100, 'C', 0.3)],
+    ),
+    'Torque Wrench': (
+        ('yearly', 1), 'Torque transducer TT-200', ('Norbar', 'Snap-on'),
+        [('20 Nm', 20, 'Nm', 0.8), ('60 Nm', 60, 'Nm', 2.4),
+         ('100 Nm', 100, 'Nm', 4)],
+    ),
+    'Analytical Balance': (
+        ('monthly', 3), 'OIML E2 weight set', ('Mettler Toledo', 'Sartorius'),
+        [('1 g', 1, 'g', 0.0002), ('100 g', 100, 'g', 0.0005),
+         ('200 g', 200, 'g', 0.001)],
+    ),
+    'Caliper': (
+        ('yearly', 1), 'Gauge block set GB-1', ('Mitutoyo', 'Starrett'),
+        [('0 mm', 0, 'mm', 0.02), ('50 mm', 50, 'mm', 0.02),
+         ('150 mm', 150, 'mm', 0.03)],
+    ),
+    'Pipette': (
+        ('monthly', 3), 'Gravimetric station GS-3', ('Eppendorf', 'Gilson'),
+        [('100 uL', 100, 'uL', 0.8), ('500 uL', 500, 'uL', 3),
+         ('1000 uL', 1000, 'uL', 8)],
+    ),
+    'Oscilloscope': (
+        ('yearly', 2), 'Oscilloscope calibrator OC-9', ('Tektronix', 'Rigol'),
+        [('1 kHz', 1, 'kHz', 0.00001), ('1 V', 1, 'V', 0.02)],
+    ),
+}
+FLEET_SITES = (
+    'Plant A', 'Plant B', 'Lab North', 'Lab South', 'Warehouse',
+    'Field Service',
+)
+FLEET_TECHNICIANS = (
+    'A. Novak', 'B. Okafor', 'C. Lindqvist', 'D. Tanaka', 'E. Moreau',
+    'F. Alvarez', 'External lab',
+)
+
+
+def seed_equipment(count, records_per_equipment, seed=0, prefix='SYNTH'):
+    """Bulk insert ``count`` equipment with synthetic history.
+
+    The data is deterministic for a given ``seed`` and planner statistics
+    are refreshed afterwards so query plans reflect the new volume.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    statuses = ['active'] * 8 + ['maintenance', 'retired']
+    equipment = []
+    for i in range(count):
+        last = now - datetime.timedelta(days=rng.randint(0, 400))
+        uncalibrated = rng.random() < 0.02
+        equipment.append(Equipment(
+            name=f'Synthetic {i:07d}',
+            model_number=f'M-{i % 50}',
+            serial_number=f'{prefix}-{i:07d}',
+            manufacturer=f'Manufacturer {i % 20}',
+            category=f'Category {i % 10}',
+            location=f'Location {i % 25}',
+            purchase_date=datetime.date(2020, 1, 1),
+            last_calibration_date=None if uncalibrated else last,
+            next_calibration_date=(
+                None if uncalibrated
+                else last + datetime.timedelta(days=365)
+            ),
+            calibration_interval_type='yearly',
+            calibration_interval_value=1,
+            status=rng.choice(statuses),
+        ))
+    equipment = Equipment.objects.bulk_create(equipment, batch_size=1000)
+
+    calibrations = []
+    maintenance = []
+    for item in equipment:
+        for j in range(records_per_equipment):
+            day = datetime.date(2015, 1, 1) + datetime.timedelta(
+                days=rng.randint(0, 3650)
+            )
+            calibrations.append(CalibrationRecord(
+                equipment=item,
+                calibration_date=day,
+                calibrated_by='Synthetic',
+                certificate_number=f'{item.serial_number}-{j}',
+                calibration_standard='ISO 17025',
+                measurement_points=[],
+                results=[],
+            ))
+            maintenance.append(MaintenanceRecord(
+                equipment=item,
+                maintenance_date=day,
+                maintenance_type='inspection',
+                performed_by='Synthetic',
+                description='Synthetic record',
+            ))
+    CalibrationRecord.objects.bulk_create(calibrations, batch_size=1000)
+    MaintenanceRecord.objects.bulk_create(maintenance, batch_size=1000)
+    refresh_summaries(
+        Equipment.objects.filter(pk__in=[item.pk for item in equipment])
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    return equipment
+
+
+def seed_fleet(count, years=5, seed=0, prefix='FLEET', end=None,
+               batch_size=500):
+    """Bulk insert a realistic fleet of ``count`` equipment with history.
+
+    Each equipment gets a catalogue category, site and interval, and is
+    calibrated on schedule for ``years`` years up to ``end`` (today by
+    default). Its measurement errors follow a per-point bias and drift plus
+    noise, and it is adjusted back to nominal after failing a calibration.
+    Maintenance happens at random about every eight months. The data
+    depends only on ``seed`` and ``end``. Returns the counts of rows
+    inserted per model.
+    """
+    rng = random.Random(seed)
+    end = end or timezone.localdate()
+    categories = sorted(FLEET_CATEGORIES)
+    locations = [
+        f'{site} / Bay {bay}' for site in FLEET_SITES for bay in range(1, 6)
+    ]
+    counts = dict.fromkeys(
+        ('equipment', 'calibration_records', 'maintenance_records',
+         'measurement_points'), 0
+    )
+    for start in range(0, count, batch_size):
+        fleet = [
+            _fleet_member(rng, index, prefix, end, years, categories,
+                          locations)
+            for index in range(start, min(start + batch_size, count))
+        ]
+        with transaction.atomic():
+            Equipment.objects.bulk_create(
+                [equipment for equipment, _, _ in fleet]
+            )
+            calibrations = [
+                record for equipment, records, _ in fleet
+                for record in records
+            ]
+            for equipment, records, maintenance in fleet:
+                for record in records + maintenance:
+                    record.equipment = equipment
+            CalibrationRecord.objects.bulk_create(
+                calibrations, batch_size=1000
+            )
+            MaintenanceRecord.objects.bulk_create(
+                [record for _, _, records in fleet for record in records],
+                batch_size=1000
+            )
+            points = [
+                point for record in calibrations
+                for point in build_points(record)
+            ]
+            MeasurementPoint.objects.bulk_create(points, batch_size=5000)
+        counts['equipment'] += len(fleet)
+        counts['calibration_records'] += len(calibrations)
+        counts['maintenance_records'] += sum(
+            len(records) for _, _, records in fleet
+        )
+        counts['measurement_points'] += len(points)
+
+    fleet = Equipment.objects.filter(serial_number__startswith=f'{prefix}-')
+    refresh_summaries(fleet)
+    fleet.reconcile_status()
+    bump_data_version()
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    return counts
+
+
+def _fleet_member(rng, index, prefix, end, years, categories, locations):
+    """Return one unsaved equipment with its calibrations and maintenance."""
+    category = rng.choice(categories)
+    interval, standard, manufacturers, points = FLEET_CATEGORIES[category]
+    if rng.random() < 0.2:
+        # Critical equipment is calibrated quarterly
+        interval = ('monthly', 3)
+    manufacturer = rng.choice(manufacturers)
+    purchase_date = end - datetime.timedelta(
+        days=365 * years + rng.randint(0, 365)
+    )
+    equipment = Equipment(
+        name=f'{category} {index:06d}',
+        model_number=f'{manufacturer[:3].upper()}-{rng.randint(100, 999)}',
+        serial_number=f'{prefix}-{index:07d}',
+        manufacturer=manufacturer,
+        category=category,
+        location=rng.choice(locations),
+        purchase_date=purchase_date,
+        calibration_interval_type=interval[0],
+        calibration_interval_value=interval[1],
+        status='retired' if rng.random() < 0.03 else 'active',
+    )
+
+    # Per-point bias and drift per year, in units of tolerance
+    behaviour = [
+        [rng.gauss(0, 0.15), rng.gauss(0, 0.12)] for _ in points
+    ]
+    calibrations = []
+    day = purchase_date + datetime.timedelta(days=rng.randint(0, 30))
+    adjusted = day
+    while day <= end:
+        years_since = (day - adjusted).days / 365.25
+        definitions, results = [], []
+        failed = False
+        for (name, nominal, unit, tolerance), (bias, drift) in zip(
+                points, behaviour):
+            error = tolerance * (
+                bias + drift * years_since + rng.gauss(0, 0.15)
+            )
+            passed = abs(error) <= tolerance
+            failed = failed or not passed
+            definitions.append({
+                'point': name, 'nominal': nominal, 'unit': unit,
+                'tolerance': tolerance,
+            })
+            results.append({
+                'point': name,
+                'measured': round(nominal + error, 6),
+                'error': round(error, 6),
+                'uncertainty': round(tolerance / 4, 6),
+                'passed': passed,
+            })
+        label, values, _ = validate_measurements(
+            category, definitions, results
+        )
+        calibrations.append(CalibrationRecord(
+            calibration_date=day,
+            calibrated_by=rng.choice(FLEET_TECHNICIANS),
+            certificate_number=(
+                f'{equipment.serial_number}-{len(calibrations) + 1:03d}'
+            ),
+            calibration_standard=standard,
+            schema_version=label,
+            notes='Adjusted to nominal.' if failed else '',
+            **values,
+        ))
+        if failed:
+            # Adjusted after failing: bias cleared, drift continues
+            adjusted = day
+            for point in behaviour:
+                point[0] = rng.gauss(0, 0.05)
+        day = add_interval(
+            day, equipment.calibration_interval_type,
+            equipment.calibration_interval_value
+        )
+
+    if calibrations:
+        last = calibrations[-1].calibration_date
+        equipment.last_calibration_date = timezone.make_aware(
+            datetime.datetime.combine(last, datetime.time(9))
+        )
+        equipment.next_calibration_date = add_interval(
+            equipment.last_calibration_date,
+            equipment.calibration_interval_type,
+            equipment.calibration_interval_value
+        )
+
+    maintenance = []
+    day = purchase_date
+    while True:
+        day += datetime.timedelta(days=int(rng.expovariate(1 / 240)) + 1)
+        if day > end:
+            break
+        maintenance_type = rng.choices(
+            ('preventive', 'inspection', 'corrective'), (5, 4, 1)
+        )[0]
+        maintenance.append(MaintenanceRecord(
+            maintenance_date=day,
+            maintenance_type=maintenance_type,
+            performed_by=rng.choice(FLEET_TECHNICIANS),
+            description=f'{maintenance_type.capitalize()} maintenance',
+            parts_replaced=(
+                'Seals, fuse' if maintenance_type == 'corrective' else ''
+            ),
+            cost=(
+                None if maintenance_type == 'inspection'
+                else round(rng.uniform(40, 900), 2)
+            ),
+        ))
+    return equipment, calibrations, maintenance
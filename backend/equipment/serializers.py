@@ -3,41 +3,95 @@
 # Description: DRF serializers for equipment management
 # ============================================================================
 
+import decimal
+import operator
+import re
+
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Equipment, CalibrationRecord, MaintenanceRecord
+from rest_framework.reverse import reverse
+from .models import (
+    Equipment, CalibrationRecord, MaintenanceRecord, Certificate,
+    CertificateUpload,
+)
+from .rows import RowSerializer
+from .schemas import MEASUREMENT_COLUMNS, validate_measurements
 
 
 class CalibrationRecordSerializer(serializers.ModelSerializer):
     """Serializer for CalibrationRecord model."""
-    
+
+    certificate_download = serializers.SerializerMethodField()
+
     class Meta:
         model = CalibrationRecord
-        fields = '__all__'
+        # Listed explicitly so internal columns, such as certificate_text
+        # which is only kept for search, are not published
+        fields = (
+            'id', 'certificate_download', 'calibration_date',
+            'calibrated_by', 'certificate_number', 'certificate_file',
+            'calibration_standard', 'measurement_points', 'results',
+            'schema_version', 'notes', 'created_at', 'equipment',
+            'certificate', 'created_by',
+        )
         read_only_fields = ('created_at', 'created_by')
 
+    def get_certificate_download(self, obj):
+        if not (obj.certificate_id or obj.certificate_file):
+            return None
+        return _download_url(self, 'calibrationrecord-certificate', obj.pk)
+
+    def validate(self, attrs):
+        """Validate and normalize the measurement JSON.
+
+        The schema follows the equipment category, so both columns are
+        checked again whenever either of them or the equipment changes.
+        """
+        if not {'equipment', *MEASUREMENT_COLUMNS} & set(attrs):
+            return attrs
+        equipment = attrs.get('equipment') or self.instance.equipment
+        version, values, errors = validate_measurements(
+            equipment.category,
+            *(
+                attrs[column] if column in attrs
+                else getattr(self.instance, column)
+                for column in MEASUREMENT_COLUMNS
+            )
+        )
+        if errors:
+            raise serializers.ValidationError(errors)
+        attrs.update(values, schema_version=version)
+        return attrs
+
 
 class MaintenanceRecordSerializer(serializers.ModelSerializer):
     """Serializer for MaintenanceRecord model."""
     
     class Meta:
         model = MaintenanceRecord
-        fields = '__all__'
+        fields = (
+            'id', 'maintenance_date', 'maintenance_type', 'performed_by',
+            'description', 'parts_replaced', 'cost', 'notes', 'created_at',
+            'equipment', 'created_by',
+        )
         read_only_fields = ('created_at', 'created_by')
 
 
-class EquipmentSerializer(serializers.ModelSerializer):
-    """Serializer for Equipment model."""
-    
-    calibration_records = CalibrationRecordSerializer(
-        many=True,
-        read_only=True
-    )
-    maintenance_records = MaintenanceRecordSerializer(
-        many=True,
+class EquipmentListSerializer(serializers.ModelSerializer):
+    """Compact serializer for Equipment list views.
+
+    Only scalar fields plus the stored record summaries are returned, so
+    list pages stay small and need no joins regardless of how much history
+    an instrument has.
+    """
+
+    status_display = serializers.CharField(
+        source='get_effective_status_display',
         read_only=True
     )
-    status_display = serializers.CharField(
-        source='get_status_display',
+    effective_status = serializers.CharField(
+        source='get_effective_status',
         read_only=True
     )
     purchase_date = serializers.DateField(format='%Y-%m-%d')
@@ -51,8 +105,177 @@ class EquipmentSerializer(serializers.ModelSerializer):
         required=False,
         allow_null=True
     )
+    maintenance_cost_year_to_date = serializers.DecimalField(
+        source='get_maintenance_cost_year_to_date',
+        max_digits=12,
+        decimal_places=2,
+        read_only=True
+    )
+
+    class Meta:
+        model = Equipment
+        # Listed explicitly so columns added to the model later, such as
+        # internal bookkeeping, are not published by default
+        fields = (
+            'id', 'status_display', 'effective_status', 'purchase_date',
+            'last_calibration_date', 'next_calibration_date',
+            'maintenance_cost_year_to_date', 'name', 'model_number',
+            'serial_number', 'manufacturer', 'category', 'location',
+            'calibration_interval_type', 'calibration_interval_value',
+            'status', 'notes', 'created_at', 'updated_at',
+            'latest_calibration_date', 'latest_certificate_number',
+            'calibration_count', 'latest_maintenance_date',
+            'maintenance_count', 'maintenance_cost_total', 'created_by',
+            'latest_calibration',
+        )
+        read_only_fields = ('created_at', 'updated_at', 'created_by')
+
+
+def equipment_list_rows(context=None, now=None):
+    """Return a row serializer matching ``EquipmentListSerializer``.
+
+    The rows must come from querysets annotated with the effective status.
+    """
+    labels = {
+        value: str(label) for value, label
+        in Equipment._meta.get_field('status').flatchoices
+    }
+    year = timezone.localdate(now).year
+    zero = decimal.Decimal('0.00')
+
+    def cost_year_to_date(row):
+        if row['maintenance_cost_year'] != year:
+            return zero
+        return row['maintenance_cost_ytd']
+
+    return RowSerializer(EquipmentListSerializer, context=context, computed={
+        'status_display': (
+            ('effective_status',),
+            lambda row: labels[row['effective_status']]
+        ),
+        'effective_status': (
+            ('effective_status',), operator.itemgetter('effective_status')
+        ),
+        'maintenance_cost_year_to_date': (
+            ('maintenance_cost_ytd', 'maintenance_cost_year'),
+            cost_year_to_date
+        ),
+    })
+
+
+class EquipmentDetailSerializer(EquipmentListSerializer):
+    """Serializer for a single Equipment with its recent history.
+
+    Nested record lists are capped at ``EQUIPMENT_DETAIL_HISTORY_LIMIT``
+    entries, each read with one ``LIMIT`` query served by the
+    ``(equipment, date, id)`` index.
+    """
+
+    calibration_records = serializers.SerializerMethodField()
+    maintenance_records = serializers.SerializerMethodField()
+
+    class Meta(EquipmentListSerializer.Meta):
+        fields = EquipmentListSerializer.Meta.fields + (
+            'calibration_records', 'maintenance_records',
+        )
+
+    def get_calibration_records(self, obj):
+        records = obj.calibration_records.all()[:_history_limit()]
+        return CalibrationRecordSerializer(
+            records, many=True, context=self.context
+        ).data
+
+    def get_maintenance_records(self, obj):
+        records = obj.maintenance_records.all()[:_history_limit()]
+        return MaintenanceRecordSerializer(
+            records, many=True, context=self.context
+        ).data
+
+
+def _history_limit():
+    return settings.EQUIPMENT_DETAIL_HISTORY_LIMIT
+
+
+def _download_url(serializer, view_name, pk):
+    return reverse(
+        view_name, args=[pk], request=serializer.context.get('request')
+    )
+
+
+class EquipmentBulkSerializer(serializers.ModelSerializer):
+    """Serializer validating one row of a bulk equipment upsert.
+
+    The unique check on ``serial_number`` is dropped because rows are matched
+    to existing equipment by serial number before validation.
+    """
 
     class Meta:
         model = Equipment
-        fields = '__all__'
-        read_only_fields = ('created_at', 'updated_at', 'created_by') 
\ No newline at end of file
+        exclude = ('created_at', 'updated_at', 'created_by')
+        extra_kwargs = {'serial_number': {'validators': []}}
+
+
+class CertificateSerializer(serializers.ModelSerializer):
+    """Serializer for stored certificates and their processing state."""
+
+    download = serializers.SerializerMethodField()
+    thumbnail = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Certificate
+        fields = (
+            'id', 'sha256', 'size', 'content_type', 'original_name',
+            'download', 'thumbnail', 'processing_status', 'processing_error',
+            'created_at', 'processed_at',
+        )
+        read_only_fields = fields
+
+    def get_download(self, obj):
+        if not obj.file:
+            return None
+        return _download_url(self, 'certificate-download', obj.pk)
+
+    def get_thumbnail(self, obj):
+        if not obj.thumbnail:
+            return None
+        return _download_url(self, 'certificate-thumbnail', obj.pk)
+
+
+class CertificateUploadSerializer(serializers.ModelSerializer):
+    """Serializer starting a chunked certificate upload.
+
+    A declared ``sha256`` is checked against the uploaded content.
+    """
+
+    certificate = CertificateSerializer(read_only=True)
+
+    class Meta:
+        model = CertificateUpload
+        fields = (
+            'id', 'filename', 'content_type', 'size', 'sha256',
+            'calibration_record', 'offset', 'status', 'error',
+            'certificate', 'created_at', 'updated_at',
+        )
+        read_only_fields = (
+            'offset', 'status', 'error', 'created_at', 'updated_at'
+        )
+
+    def validate_size(self, value):
+        if value > settings.CERTIFICATE_MAX_SIZE:
+            raise serializers.ValidationError(
+                f'Certificates are limited to '
+                f'{settings.CERTIFICATE_MAX_SIZE} bytes.'
+            )
+        return value
+
+    def validate_sha256(self, value):
+        value = value.lower()
+        if value and not re.fullmatch(r'[0-9a-f]{64}', value):
+            raise serializers.ValidationError(
+                'Expected a hex-encoded SHA-256 digest.'
+            )
+        return value
+
+
+# Kept for backwards compatibility with existing imports
+EquipmentSerializer = EquipmentDetailSerializer
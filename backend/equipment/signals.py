@@ -0,0 +1,107 @@
+# ============================================================================
+# File Path: backend/equipment/signals.py
+# Description: Signal handlers for equipment models
+# ============================================================================
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache import bump_data_version
+from .models import (
+    Equipment, CalibrationRecord, MaintenanceRecord, Tombstone,
+    allocate_sync_seq,
+)
+from .measurements import sync_points
+from .summaries import record_changed
+
+TOMBSTONE_MODELS = {
+    Equipment: 'equipment',
+    CalibrationRecord: 'calibration_record',
+    MaintenanceRecord: 'maintenance_record',
+}
+
+
+@receiver(post_save, sender=Equipment)
+@receiver(post_save, sender=CalibrationRecord)
+@receiver(post_save, sender=MaintenanceRecord)
+@receiver(post_delete, sender=Equipment)
+@receiver(post_delete, sender=CalibrationRecord)
+@receiver(post_delete, sender=MaintenanceRecord)
+def invalidate_equipment_cache(sender, instance, **kwargs):
+    """Invalidate cached results whenever equipment data changes.
+
+    A record moved to other equipment invalidates both equipment.
+    """
+    if sender is Equipment:
+        equipment_ids = [instance.pk]
+    else:
+        equipment_ids = [instance.equipment_id]
+        previous = getattr(instance, '_previous_equipment_id', None)
+        if previous is not None and previous != instance.equipment_id:
+            equipment_ids.append(previous)
+    bump_data_version(equipment_ids=equipment_ids)
+
+
+@receiver(pre_save, sender=CalibrationRecord)
+@receiver(pre_save, sender=MaintenanceRecord)
+def remember_record_equipment(sender, instance, **kwargs):
+    """Note the equipment an updated record belonged to before the save."""
+    if instance._state.adding:
+        return
+    instance._previous_equipment_id = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list('equipment_id', flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=CalibrationRecord)
+@receiver(post_save, sender=MaintenanceRecord)
+def update_summary_on_save(sender, instance, created, **kwargs):
+    """Update the equipment summary in the record's save transaction."""
+    record_changed(
+        instance,
+        delta=1 if created else 0,
+        previous_equipment_id=getattr(
+            instance, '_previous_equipment_id', None
+        )
+    )
+
+
+@receiver(post_save, sender=CalibrationRecord)
+def sync_measurement_points(sender, instance, update_fields=None, **kwargs):
+    """Rewrite the record's typed measurement points in its transaction."""
+    if update_fields is not None and not update_fields & {
+        'measurement_points', 'results', 'calibration_date', 'equipment'
+    }:
+        return
+    sync_points([instance])
+
+
+@receiver(post_delete, sender=CalibrationRecord)
+@receiver(post_delete, sender=MaintenanceRecord)
+def update_summary_on_delete(sender, instance, origin=None, **kwargs):
+    """Update the equipment summary in the record's delete transaction."""
+    if isinstance(origin, Equipment) or getattr(
+            origin, 'model', None) is Equipment:
+        # The equipment itself is being deleted along with its records
+        return
+    record_changed(instance, delta=-1)
+
+
+@receiver(post_delete, sender=Equipment)
+@receiver(post_delete, sender=CalibrationRecord)
+@receiver(post_delete, sender=MaintenanceRecord)
+def record_tombstone(sender, instance, origin=None, using=None, **kwargs):
+    """Leave a tombstone for the sync feed in the delete transaction."""
+    if sender is not Equipment and (
+            isinstance(origin, Equipment)
+            or getattr(origin, 'model', None) is Equipment):
+        # Implied by the equipment's own tombstone
+        return
+    Tombstone.objects.using(using).create(
+        model=TOMBSTONE_MODELS[sender],
+        object_id=instance.pk,
+        equipment_id=None if sender is Equipment else instance.equipment_id,
+        sync_seq=allocate_sync_seq(using=using),
+    )
@@ -0,0 +1,144 @@
+# ============================================================================
+# File Path: backend/equipment/summaries.py
+# Description: Denormalized calibration and maintenance summaries on Equipment
+# ============================================================================
+
+import datetime
+
+from django.db import models
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+# Equipment columns derived from its records; never written by the API
+SUMMARY_FIELDS = (
+    'latest_calibration',
+    'latest_calibration_date',
+    'latest_certificate_number',
+    'calibration_count',
+    'latest_maintenance_date',
+    'maintenance_count',
+    'maintenance_cost_total',
+    'maintenance_cost_ytd',
+    'maintenance_cost_year',
+)
+
+COST_FIELD = models.DecimalField(max_digits=12, decimal_places=2)
+
+
+def refresh_summaries(queryset, now=None):
+    """Recompute the summaries of the equipment in ``queryset``.
+
+    Runs a single ``UPDATE`` with correlated subqueries, each served by the
+    records' ``(equipment, date, id)`` indexes. Works with historical models
+    in migrations. Returns the number of equipment updated.
+    """
+    return queryset.order_by().update(
+        **calibration_summary(queryset.model),
+        **maintenance_summary(queryset.model, now),
+    )
+
+
+def calibration_summary(equipment_model):
+    """Return update expressions for the calibration summary columns."""
+    records = _records(equipment_model, 'calibration_records')
+    return {
+        **latest_calibration(equipment_model),
+        'calibration_count': _aggregate(
+            records, models.Count('pk'), models.IntegerField()
+        ),
+    }
+
+
+def latest_calibration(equipment_model):
+    """Return update expressions for the latest calibration columns."""
+    latest = (
+        _records(equipment_model, 'calibration_records')
+        .order_by('-calibration_date', '-id')
+    )
+    return {
+        'latest_calibration': models.Subquery(latest.values('pk')[:1]),
+        'latest_calibration_date': models.Subquery(
+            latest.values('calibration_date')[:1]
+        ),
+        'latest_certificate_number': Coalesce(
+            models.Subquery(latest.values('certificate_number')[:1]),
+            models.Value('')
+        ),
+    }
+
+
+def maintenance_summary(equipment_model, now=None):
+    """Return update expressions for the maintenance summary columns.
+
+    The year-to-date cost is stored with the year it covers, see
+    ``Equipment.get_maintenance_cost_year_to_date``.
+    """
+    year = timezone.localdate(now).year
+    records = _records(equipment_model, 'maintenance_records')
+    latest = records.order_by('-maintenance_date', '-id')
+    return {
+        'latest_maintenance_date': models.Subquery(
+            latest.values('maintenance_date')[:1]
+        ),
+        'maintenance_count': _aggregate(
+            records, models.Count('pk'), models.IntegerField()
+        ),
+        'maintenance_cost_total': _aggregate(
+            records, models.Sum('cost'), COST_FIELD
+        ),
+        'maintenance_cost_ytd': _aggregate(
+            records.filter(maintenance_date__gte=datetime.date(year, 1, 1)),
+            models.Sum('cost'),
+            COST_FIELD
+        ),
+        'maintenance_cost_year': models.Value(year),
+    }
+
+
+def record_changed(record, delta=0, previous_equipment_id=None):
+    """Update the summary of ``record``'s equipment after a write.
+
+    ``delta`` is +1 for an insert, -1 for a delete and 0 for an update.
+    Calibration counts are adjusted in place, as equipment can collect tens
+    of thousands of records; the latest calibration is a single index seek.
+    Maintenance history is short, so its totals are recomputed, which also
+    keeps the year-to-date cost exact. Updates moving a record to another
+    equipment refresh both.
+    """
+    Equipment = type(record)._meta.get_field('equipment').related_model
+    if (previous_equipment_id is not None and
+            previous_equipment_id != record.equipment_id):
+        refresh_summaries(Equipment.objects.filter(
+            pk__in=[previous_equipment_id, record.equipment_id]
+        ))
+        return
+
+    equipment = Equipment.objects.filter(pk=record.equipment_id)
+    if type(record)._meta.model_name == 'calibrationrecord':
+        equipment.update(
+            calibration_count=models.F('calibration_count') + delta,
+            **latest_calibration(Equipment)
+        )
+    else:
+        equipment.update(**maintenance_summary(Equipment))
+
+
+def _records(equipment_model, relation):
+    model = equipment_model._meta.get_field(relation).related_model
+    return model.objects.filter(equipment=models.OuterRef('pk'))
+
+
+def _aggregate(records, aggregate, output_field):
+    """Return a subquery aggregating ``records`` per outer equipment."""
+    values = (
+        records
+        .order_by()
+        .values('equipment')
+        .annotate(value=aggregate)
+        .values('value')
+    )
+    return Coalesce(
+        models.Subquery(values, output_field=output_field),
+        models.Value(0),
+        output_field=output_field
+    )
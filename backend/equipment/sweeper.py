@@ -0,0 +1,188 @@
+# ============================================================================
+# File Path: backend/equipment/sweeper.py
+# Description: Periodic calibration status sweep and notification digests
+# ============================================================================
+
+import logging
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import models, transaction
+from django.utils import timezone
+
+from .cache import bump_data_version
+from .models import (
+    CALIBRATION_WARNING_DAYS, MANUAL_STATUSES, Equipment, SweeperState,
+    effective_status_expression,
+)
+
+logger = logging.getLogger(__name__)
+
+# Equipment listed per digest section; the remainder is summarised
+DIGEST_MAX_ITEMS = 500
+
+# Digest sections in the order they are rendered
+DIGEST_SECTIONS = (
+    ('calibration_overdue', 'Calibration overdue'),
+    ('calibration_due', 'Calibration due'),
+    ('active', 'Back in calibration'),
+)
+
+
+def window_q(since, now):
+    """Return a ``Q`` for equipment whose status may have changed.
+
+    A stored status only goes stale when ``now`` or ``now + warning`` passes
+    ``next_calibration_date``, so between two sweeps only two date ranges
+    need scanning. Both are served by the ``next_calibration_date`` index.
+    Without a previous sweep everything up to the warning horizon is
+    considered.
+    """
+    warning = timezone.timedelta(days=CALIBRATION_WARNING_DAYS)
+    if since is None:
+        return models.Q(next_calibration_date__lt=now + warning)
+    return (
+        models.Q(next_calibration_date__gte=since,
+                 next_calibration_date__lt=now) |
+        models.Q(next_calibration_date__gte=since + warning,
+                 next_calibration_date__lt=now + warning)
+    )
+
+
+def sweep(now=None, notify=True, connection=None):
+    """Reconcile stale statuses since the last sweep and send digests.
+
+    The stale rows are read once for the digest and updated with a single
+    ``UPDATE``. Digests are sent over one mail connection before that
+    ``UPDATE``, which may take the sync sequence counter until the sweep
+    commits, so writes elsewhere never wait on mail delivery. A failed
+    delivery rolls the sweep back and is retried by the next one. Returns
+    ``(transitions, digests_sent)``.
+    """
+    now = now or timezone.now()
+    with transaction.atomic():
+        state, _ = SweeperState.objects.get_or_create(pk=1)
+        # Serialise concurrent sweepers on the watermark row
+        state = SweeperState.objects.select_for_update().get(pk=state.pk)
+        since = state.swept_until
+        if since is not None and since >= now:
+            return 0, 0
+
+        candidates = (
+            Equipment.objects
+            .exclude(status__in=MANUAL_STATUSES)
+            .filter(window_q(since, now))
+        )
+        stale = (
+            candidates
+            .alias(computed_status=effective_status_expression(now))
+            .exclude(status=models.F('computed_status'))
+            .annotate(new_status=models.F('computed_status'))
+            .order_by('location', 'next_calibration_date', 'pk')
+            .values_list(
+                'name', 'serial_number', 'location',
+                'next_calibration_date', 'new_status', 'created_by__email'
+            )
+        )
+        digests = build_digests(stale.iterator())
+
+        messages = []
+        if notify:
+            messages = [
+                digest_message(recipients, items, now)
+                for recipients, items in digests.items()
+            ]
+            if messages:
+                connection = connection or get_connection()
+                connection.send_messages(messages)
+
+        # Only the sweeper row is locked until here
+        transitions = candidates.reconcile_status(now)
+        state.swept_until = now
+        state.transitions = transitions
+        state.digests_sent = len(messages)
+        state.save()
+
+    if transitions:
+        bump_data_version()
+    logger.info(
+        'Calibration sweep until %s: %d transitions, %d digests',
+        now, transitions, len(messages)
+    )
+    return transitions, len(messages)
+
+
+def build_digests(rows):
+    """Group stale equipment rows into digests keyed by recipients.
+
+    Equipment is reported to the user who registered it, or to
+    ``CALIBRATION_DIGEST_RECIPIENTS`` when it has no owner with an email
+    address. Each digest groups its equipment by location.
+    """
+    fallback = tuple(settings.CALIBRATION_DIGEST_RECIPIENTS)
+    digests = defaultdict(lambda: defaultdict(list))
+    for name, serial, location, due, new_status, email in rows:
+        recipients = (email,) if email else fallback
+        if recipients:
+            digests[recipients][location].append(
+                (new_status, name, serial, due)
+            )
+    return digests
+
+
+def digest_message(recipients, items_by_location, now):
+    """Render one plain-text digest email."""
+    counts = defaultdict(int)
+    lines = []
+    for location, items in items_by_location.items():
+        lines.append(f'{location}')
+        lines.append('=' * len(location))
+        for status, heading in DIGEST_SECTIONS:
+            section = [item for item in items if item[0] == status]
+            if not section:
+                continue
+            counts[status] += len(section)
+            lines.append(f'{heading} ({len(section)}):')
+            for _, name, serial, due in section[:DIGEST_MAX_ITEMS]:
+                due = due.strftime('%Y-%m-%d') if due else 'never calibrated'
+                lines.append(f'  - {name} ({serial}), due {due}')
+            if len(section) > DIGEST_MAX_ITEMS:
+                lines.append(
+                    f'  ... and {len(section) - DIGEST_MAX_ITEMS} more'
+                )
+        lines.append('')
+
+    subject = (
+        f"{settings.EMAIL_SUBJECT_PREFIX}Calibration digest: "
+        f"{counts['calibration_overdue']} overdue, "
+        f"{counts['calibration_due']} due"
+    )
+    body = (
+        f"Calibration status changes as of {now:%Y-%m-%d %H:%M %Z}\n\n" +
+        '\n'.join(lines)
+    )
+    return EmailMessage(
+        subject=subject,
+        body=body,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=list(recipients),
+    )
+
+
+def run_forever(interval, notify=True, stdout=None):
+    """Sweep every ``interval`` seconds until interrupted."""
+    while True:
+        started = time.monotonic()
+        try:
+            transitions, sent = sweep(notify=notify)
+            if stdout:
+                stdout.write(
+                    f'{timezone.now():%Y-%m-%d %H:%M:%S} '
+                    f'{transitions} transitions, {sent} digests sent'
+                )
+        except Exception:
+            # Keep the scheduler alive; the next sweep retries the window
+            logger.exception('Calibration sweep failed')
+        time.sleep(max(0, interval - (time.monotonic() - started)))
@@ -0,0 +1,218 @@
+# ============================================================================
+# File Path: backend/equipment/sync.py
+# Description: Incremental change feed for offline clients
+# ============================================================================
+
+import base64
+import binascii
+import heapq
+import itertools
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+
+from .models import (
+    Equipment, CalibrationRecord, MaintenanceRecord, SyncState, Tombstone,
+    sync_horizon,
+)
+from .serializers import (
+    CalibrationRecordSerializer, EquipmentListSerializer,
+    MaintenanceRecordSerializer,
+)
+
+# Sources of the feed, in the order changes sharing a sequence number are
+# listed; tombstones come last so a delete follows any upsert of the object
+SOURCES = (
+    ('equipment', Equipment, EquipmentListSerializer),
+    ('calibration_record', CalibrationRecord, CalibrationRecordSerializer),
+    ('maintenance_record', MaintenanceRecord, MaintenanceRecordSerializer),
+    ('tombstone', Tombstone, None),
+)
+TOMBSTONE_SOURCE = len(SOURCES) - 1
+
+# Position before every change, including rows written before the feed
+START = (0, 0, 0)
+
+
+class SyncError(ValueError):
+    """Invalid sync parameters."""
+
+
+class SyncExpired(SyncError):
+    """A sync token older than the retained tombstones."""
+
+
+def get_changes(params, context=None):
+    """Return the page of changes after the ``since`` token of ``params``.
+
+    Changes are ordered by sequence number, so each object appears at most
+    once per page with its latest state, and deletes as tombstones. The
+    response carries the token to resume from; ``has_more`` tells the
+    client to ask again straight away. Without a token the feed starts with
+    every existing object, which is also how a client recovers from an
+    expired token. Changes of transactions that may still commit below the
+    page are held back until they have.
+    """
+    limit = _limit(params)
+    since = params.get('since', '').strip()
+    position = decode_token(since) if since else START
+    if since:
+        pruned_through = (
+            SyncState.objects.filter(pk=1)
+            .values_list('pruned_through', flat=True)
+            .first()
+        ) or 0
+        if position[0] < pruned_through:
+            raise SyncExpired(
+                'The sync token has expired; start a full sync without '
+                '"since".'
+            )
+
+    horizon = sync_horizon()
+    keys = heapq.merge(*(
+        _keys(source, position, limit + 1, horizon)
+        for source in range(len(SOURCES))
+    ))
+    page = list(itertools.islice(keys, limit + 1))
+    has_more = len(page) > limit
+    page = page[:limit]
+
+    objects = _objects(page)
+    changes = []
+    for key in page:
+        seq, source, pk = key
+        obj = objects[source].get(pk)
+        if obj is None:
+            # Deleted since the keys were read; its tombstone follows
+            continue
+        if source == TOMBSTONE_SOURCE:
+            change = {
+                'type': obj.model,
+                'op': 'delete',
+                'id': obj.object_id,
+            }
+            if obj.equipment_id is not None:
+                change['equipment'] = obj.equipment_id
+        else:
+            name, _, serializer = SOURCES[source]
+            change = {
+                'type': name,
+                'op': 'upsert',
+                'id': pk,
+                'data': serializer(obj, context=context).data,
+            }
+        change['seq'] = seq
+        changes.append(change)
+
+    return {
+        'changes': changes,
+        'next': encode_token(page[-1] if page else position),
+        'has_more': has_more,
+    }
+
+
+def prune_tombstones(before):
+    """Delete tombstones older than ``before``.
+
+    Clients whose token predates a pruned tombstone could miss the delete,
+    so the highest pruned sequence number is recorded and such tokens are
+    refused from then on. Returns the number of tombstones deleted.
+    """
+    with transaction.atomic():
+        state, _ = SyncState.objects.get_or_create(pk=1)
+        state = SyncState.objects.select_for_update().get(pk=state.pk)
+        tombstones = Tombstone.objects.filter(deleted_at__lt=before)
+        last = tombstones.aggregate(last=Max('sync_seq'))['last']
+        if last is None:
+            return 0
+        deleted, _ = tombstones.delete()
+        if last > state.pruned_through:
+            SyncState.objects.filter(pk=state.pk).update(pruned_through=last)
+        return deleted
+
+
+def encode_token(position):
+    """Return the opaque token of a feed position."""
+    raw = '.'.join(str(part) for part in position).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_token(token):
+    """Return the feed position of ``token``."""
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        seq, source, pk = (int(part) for part in raw.decode().split('.'))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise SyncError('Invalid sync token.')
+    if seq < 0 or not 0 <= source < len(SOURCES) or pk < 0:
+        raise SyncError('Invalid sync token.')
+    return seq, source, pk
+
+
+def _queryset(source):
+    model = SOURCES[source][1]
+    if model is Equipment:
+        return model.objects.with_effective_status()
+    if model is CalibrationRecord:
+        # Only kept for search
+        return model.objects.defer('certificate_text')
+    return model.objects.all()
+
+
+def _keys(source, position, limit, horizon=None):
+    """Return up to ``limit`` keys of ``source`` after ``position``.
+
+    Rows sharing the position's sequence number and rows after it are read
+    separately, so both are plain ranges on the ``(sync_seq, id)`` index.
+    Only rows numbered below ``horizon`` are returned.
+    """
+    seq, after_source, after_pk = position
+    queryset = SOURCES[source][1].objects.order_by()
+    if horizon is not None:
+        queryset = queryset.filter(sync_seq__lt=horizon)
+    keys = []
+    if source >= after_source:
+        keys = [
+            (seq, source, pk) for pk in
+            queryset.filter(
+                sync_seq=seq,
+                pk__gt=after_pk if source == after_source else 0
+            )
+            .order_by('pk')
+            .values_list('pk', flat=True)[:limit]
+        ]
+    if len(keys) < limit:
+        keys += [
+            (row_seq, source, pk) for row_seq, pk in
+            queryset.filter(sync_seq__gt=seq)
+            .order_by('sync_seq', 'pk')
+            .values_list('sync_seq', 'pk')[:limit - len(keys)]
+        ]
+    return keys
+
+
+def _objects(page):
+    """Load the objects of ``page``, one query per source."""
+    pks = [[] for _ in SOURCES]
+    for _, source, pk in page:
+        pks[source].append(pk)
+    return [
+        _queryset(source).order_by().in_bulk(source_pks) if source_pks else {}
+        for source, source_pks in enumerate(pks)
+    ]
+
+
+def _limit(params):
+    raw = params.get('limit', '').strip()
+    if not raw:
+        return settings.SYNC_PAGE_SIZE
+    try:
+        value = int(raw)
+    except ValueError:
+        raise SyncError('"limit" must be an integer.')
+    if not 1 <= value <= settings.SYNC_MAX_PAGE_SIZE:
+        raise SyncError(
+            f'"limit" must be between 1 and {settings.SYNC_MAX_PAGE_SIZE}.'
+        )
+    return value
@@ -0,0 +1,89 @@
+# ============================================================================
+# File Path: backend/equipment/tests/conftest.py
+# Description: Shared fixtures for the equipment tests
+# ============================================================================
+
+import datetime
+import itertools
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from equipment.models import CalibrationRecord, Equipment, MaintenanceRecord
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Cached bodies and versions must not leak between tests
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def make_equipment(db):
+    """Return a factory of saved equipment with unique serial numbers."""
+    numbers = itertools.count(1)
+
+    def make(**fields):
+        number = next(numbers)
+        values = {
+            'name': f'Instrument {number:04d}',
+            'model_number': 'M-100',
+            'serial_number': f'SN-{number:06d}',
+            'manufacturer': 'Acme',
+            'category': 'Thermometer',
+            'location': 'Lab 1',
+            'purchase_date': datetime.date(2020, 1, 1),
+            'calibration_interval_type': 'monthly',
+            'calibration_interval_value': 6,
+        }
+        values.update(fields)
+        return Equipment.objects.create(**values)
+
+    return make
+
+
+@pytest.fixture
+def make_calibration(db):
+    """Return a factory of saved calibration records."""
+    numbers = itertools.count(1)
+
+    def make(equipment, calibration_date, **fields):
+        values = {
+            'calibrated_by': 'Metrology Lab',
+            'certificate_number': f'CERT-{next(numbers):06d}',
+            'calibration_standard': 'ISO 17025',
+            'measurement_points': [],
+            'results': [],
+        }
+        values.update(fields)
+        return CalibrationRecord.objects.create(
+            equipment=equipment, calibration_date=calibration_date, **values
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_maintenance(db):
+    """Return a factory of saved maintenance records."""
+
+    def make(equipment, maintenance_date, **fields):
+        values = {
+            'maintenance_type': 'preventive',
+            'performed_by': 'Service Team',
+            'description': 'Routine service',
+        }
+        values.update(fields)
+        return MaintenanceRecord.objects.create(
+            equipment=equipment, maintenance_date=maintenance_date, **values
+        )
+
+    return make
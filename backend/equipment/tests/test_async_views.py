@@ -0,0 +1,133 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_async_views.py
+# Description: Tests that the async read views answer like the DRF views
+# ============================================================================
+
+import datetime
+import decimal
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+
+from equipment import async_views, views
+from equipment.urls import router
+
+pytestmark = pytest.mark.django_db
+
+SYNC_VIEWS = {url.name: url.callback for url in router.urls}
+
+# URL name -> (sync view, async handler)
+READ_VIEWS = {
+    'equipment-list': (
+        SYNC_VIEWS['equipment-list'], async_views.equipment_list
+    ),
+    'equipment-detail': (
+        SYNC_VIEWS['equipment-detail'], async_views.equipment_detail
+    ),
+    'equipment-calibrations': (
+        SYNC_VIEWS['equipment-calibrations'],
+        async_views.calibration_history
+    ),
+    'equipment-maintenance': (
+        SYNC_VIEWS['equipment-maintenance'],
+        async_views.maintenance_history
+    ),
+    'dashboard': (views.dashboard, async_views.dashboard),
+}
+
+
+@pytest.fixture
+def fleet(make_equipment, make_calibration, make_maintenance):
+    equipment = [
+        make_equipment(name=name, location=location)
+        for name, location in (
+            ('Balance', 'Lab 2'), ('Gauge', 'Lab 1'), ('Caliper', 'Lab 1'),
+        )
+    ]
+    for month in (1, 2, 3):
+        make_calibration(equipment[0], datetime.date(2024, month, 1))
+        make_maintenance(equipment[0], datetime.date(2024, month, 2),
+                         cost=decimal.Decimal('9.99'))
+    return equipment
+
+
+def both(name, path, headers=None, **kwargs):
+    """Return the responses of the sync and the async view to one GET."""
+    sync_view, handler = READ_VIEWS[name]
+    factory = RequestFactory()
+    headers = {'HTTP_ACCEPT': 'application/json', **(headers or {})}
+    response = sync_view(factory.get(path, **headers), **kwargs)
+    if hasattr(response, 'render'):
+        response.render()
+    async_view = async_views.read_view(sync_view, handler)
+    async_response = async_to_sync(async_view)(
+        factory.get(path, **headers), **kwargs
+    )
+    return response, async_response
+
+
+def assert_same(response, async_response):
+    assert async_response.status_code == response.status_code
+    assert async_response.content == response.content
+    for header in ('Content-Type', 'ETag', 'Last-Modified', 'Allow'):
+        assert async_response.get(header) == response.get(header)
+
+
+@pytest.mark.parametrize('query', [
+    '',
+    '?ordering=-name',
+    '?location=Lab 1',
+    '?cursor=&page_size=2',
+    '?page=2&page_size=2',
+    '?status=broken',
+])
+def test_equipment_list(fleet, query):
+    assert_same(*both('equipment-list', f'/api/equipment/{query}'))
+
+
+def test_equipment_list_next_cursor_page(fleet):
+    response, _ = both('equipment-list', '/api/equipment/?cursor=&page_size=2')
+    assert_same(*both('equipment-list', response.data['next']))
+
+
+def test_not_modified(fleet):
+    response, _ = both('equipment-list', '/api/equipment/')
+    unchanged = {'HTTP_IF_NONE_MATCH': response['ETag']}
+    response, async_response = both(
+        'equipment-list', '/api/equipment/', unchanged
+    )
+    assert response.status_code == 304
+    assert_same(response, async_response)
+
+
+@pytest.mark.parametrize('lookup', ['first', 'missing', 'text'])
+def test_equipment_detail(fleet, lookup):
+    pk = {'first': fleet[0].pk, 'missing': 0, 'text': 'abc'}[lookup]
+    assert_same(*both(
+        'equipment-detail', f'/api/equipment/{pk}/', pk=str(pk)
+    ))
+
+
+@pytest.mark.parametrize('name', [
+    'equipment-calibrations', 'equipment-maintenance',
+])
+@pytest.mark.parametrize('query', ['', '?page_size=2'])
+def test_history(fleet, name, query):
+    pk = fleet[0].pk
+    path = f"/api/equipment/{pk}/{name.split('-')[1]}/{query}"
+    response, async_response = both(name, path, pk=str(pk))
+    assert len(response.data['results']) == (2 if query else 3)
+    assert_same(response, async_response)
+
+
+def test_history_of_missing_equipment(fleet):
+    assert_same(*both(
+        'equipment-calibrations', '/api/equipment/0/calibrations/', pk='0'
+    ))
+
+
+def test_dashboard(fleet):
+    response, async_response = both('dashboard', '/api/dashboard/')
+    assert response.status_code == 200
+    assert_same(response, async_response)
@@ -0,0 +1,110 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_bulk.py
+# Description: Tests of the bulk equipment upsert endpoint
+# ============================================================================
+
+import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from equipment.models import Equipment
+
+pytestmark = pytest.mark.django_db
+
+
+def at(*args):
+    return timezone.make_aware(datetime.datetime(*args))
+
+
+def row(**fields):
+    values = {
+        'name': 'Gauge',
+        'model_number': 'PG-10',
+        'serial_number': 'BULK-1',
+        'manufacturer': 'WIKA',
+        'category': 'Pressure Gauge',
+        'location': 'Lab 1',
+        'purchase_date': '2020-01-01',
+        'calibration_interval_type': 'monthly',
+        'calibration_interval_value': 6,
+    }
+    values.update(fields)
+    return values
+
+
+def test_update_moves_next_calibration_with_last(api_client, make_equipment):
+    equipment = make_equipment(
+        serial_number='BULK-1',
+        last_calibration_date=at(2025, 9, 16),
+        next_calibration_date=at(2026, 3, 16),
+    )
+    response = api_client.post('/api/equipment/bulk/', [{
+        'serial_number': 'BULK-1',
+        'last_calibration_date': '2026-09-01T00:00:00Z',
+    }], format='json')
+    assert response.status_code == 200
+    assert response.json()['updated'] == 1
+
+    equipment.refresh_from_db()
+    assert equipment.next_calibration_date == at(2027, 3, 1)
+    assert equipment.status == equipment.calculate_status()
+
+
+def test_update_keeps_explicit_next_calibration(api_client, make_equipment):
+    make_equipment(
+        serial_number='BULK-1', last_calibration_date=at(2025, 9, 16)
+    )
+    api_client.post('/api/equipment/bulk/', [{
+        'serial_number': 'BULK-1',
+        'last_calibration_date': '2026-09-01T00:00:00Z',
+        'next_calibration_date': '2026-12-24T00:00:00Z',
+    }], format='json')
+    equipment = Equipment.objects.get(serial_number='BULK-1')
+    assert equipment.next_calibration_date == at(2026, 12, 24)
+
+
+def test_interval_change_reschedules(api_client, make_equipment):
+    make_equipment(
+        serial_number='BULK-1', last_calibration_date=at(2026, 1, 31)
+    )
+    api_client.post('/api/equipment/bulk/', [{
+        'serial_number': 'BULK-1', 'calibration_interval_value': 1,
+    }], format='json')
+    equipment = Equipment.objects.get(serial_number='BULK-1')
+    assert equipment.next_calibration_date == at(2026, 2, 28)
+
+
+def test_creates_and_updates_in_one_request(api_client, make_equipment):
+    make_equipment(serial_number='BULK-1')
+    response = api_client.post('/api/equipment/bulk/', [
+        {'serial_number': 'BULK-1', 'location': 'Lab 2'},
+        row(serial_number='BULK-2'),
+        row(serial_number='BULK-3', purchase_date='not a date'),
+    ], format='json')
+    report = response.json()
+    assert (report['created'], report['updated'], report['failed']) == (
+        1, 1, 1
+    )
+    assert Equipment.objects.get(serial_number='BULK-1').location == 'Lab 2'
+    assert Equipment.objects.filter(serial_number='BULK-2').exists()
+
+
+def test_upsert_assigns_sync_seq_once(api_client, make_equipment):
+    equipment = make_equipment(serial_number='BULK-1')
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.post('/api/equipment/bulk/', [
+            {'serial_number': 'BULK-1', 'location': 'Lab 2'},
+        ], format='json')
+    assert response.json()['updated'] == 1
+    upsert = next(
+        query['sql'] for query in queries
+        if 'ON CONFLICT' in query['sql']
+    )
+    # PostgreSQL refuses multiple assignments to the same column
+    assert upsert.count('"sync_seq" = EXCLUDED."sync_seq"') == 1
+    assert Equipment.objects.get(pk=equipment.pk).sync_seq > (
+        equipment.sync_seq
+    )
@@ -0,0 +1,77 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_conditional.py
+# Description: Tests of conditional GETs and cached equipment details
+# ============================================================================
+
+import datetime
+
+import pytest
+from django.core.files.storage import FileSystemStorage
+
+from equipment.models import CalibrationRecord
+
+pytestmark = pytest.mark.django_db
+
+
+def record_ids(client, equipment):
+    body = client.get(f'/api/equipment/{equipment.pk}/').json()
+    return [record['id'] for record in body['calibration_records']]
+
+
+def test_moved_record_invalidates_both_details(
+        api_client, make_equipment, make_calibration,
+        django_capture_on_commit_callbacks):
+    source, target = make_equipment(), make_equipment()
+    record = make_calibration(source, datetime.date(2024, 1, 1))
+    # Cache both detail bodies
+    assert record_ids(api_client, source) == [record.pk]
+    assert record_ids(api_client, target) == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.patch(
+            f'/api/calibration-records/{record.pk}/',
+            {'equipment': target.pk}, format='json'
+        )
+    assert response.status_code == 200
+
+    assert record_ids(api_client, source) == []
+    assert record_ids(api_client, target) == [record.pk]
+
+
+def test_unchanged_detail_is_not_modified(api_client, make_equipment):
+    equipment = make_equipment()
+    response = api_client.get(f'/api/equipment/{equipment.pk}/')
+    again = api_client.get(
+        f'/api/equipment/{equipment.pk}/',
+        HTTP_IF_NONE_MATCH=response['ETag']
+    )
+    assert again.status_code == 304
+
+
+def test_cached_detail_links_follow_the_request_origin(
+        api_client, settings, monkeypatch, tmp_path, make_equipment,
+        make_calibration):
+    settings.ALLOWED_HOSTS = ['lab.example.com', 'api.example.com']
+    field = CalibrationRecord._meta.get_field('certificate_file')
+    monkeypatch.setattr(
+        field, 'storage', FileSystemStorage(location=str(tmp_path))
+    )
+    equipment = make_equipment()
+    make_calibration(
+        equipment, datetime.date(2024, 1, 1),
+        certificate_file='calibration_certificates/c.pdf'
+    )
+    path = f'/api/equipment/{equipment.pk}/'
+
+    def download(**extra):
+        response = api_client.get(path, **extra)
+        record, = response.json()['calibration_records']
+        return response['ETag'], record['certificate_download']
+
+    lab = download(HTTP_HOST='lab.example.com')
+    assert lab[1].startswith('http://lab.example.com/api/')
+    api = download(HTTP_HOST='api.example.com', secure=True)
+    assert api[1].startswith('https://api.example.com/api/')
+    assert api[0] != lab[0]
+    # Each origin is served its own cached body
+    assert download(HTTP_HOST='lab.example.com') == lab
@@ -0,0 +1,41 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_dashboard.py
+# Description: Tests of the dashboard aggregates
+# ============================================================================
+
+import pytest
+from django.utils import timezone
+
+from equipment.dashboard import build_dashboard_data
+
+pytestmark = pytest.mark.django_db
+
+
+def test_calibration_buckets_match_effective_status(make_equipment):
+    now = timezone.now()
+    days = timezone.timedelta(days=1)
+    calibrated = {'last_calibration_date': now - 200 * days}
+    make_equipment(next_calibration_date=now - days, **calibrated)
+    make_equipment(next_calibration_date=now + 3 * days, **calibrated)
+    make_equipment(next_calibration_date=now + 20 * days, **calibrated)
+    # Never calibrated, so overdue whatever its next date says
+    make_equipment(next_calibration_date=now + 20 * days)
+    make_equipment()
+    # Set by hand, so not in any calibration bucket
+    make_equipment(
+        status='maintenance', next_calibration_date=now - days, **calibrated
+    )
+    make_equipment(
+        status='retired', next_calibration_date=now + 3 * days, **calibrated
+    )
+
+    data = build_dashboard_data(now)
+    calibration = data['calibration']
+    assert calibration['overdue'] == 3
+    assert calibration['overdue'] == data['by_status']['calibration_overdue']
+    assert calibration['due_in_7_days'] == 1
+    assert calibration['due_in_7_days'] == (
+        data['by_status']['calibration_due']
+    )
+    assert calibration['due_in_30_days'] == 2
+    assert calibration['due_in_90_days'] == 2
@@ -0,0 +1,84 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_downloads.py
+# Description: Tests for certificate ranges and archive entries
+# ============================================================================
+
+import datetime
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.test import RequestFactory
+
+from equipment.downloads import (
+    archive_records, archive_response, record_certificate, serve_file,
+)
+from equipment.models import CalibrationRecord
+
+pytestmark = pytest.mark.django_db
+
+CONTENT = b'0123456789' * 10
+
+
+class CountingStorage(FileSystemStorage):
+    """File system storage counting the size lookups it answers."""
+
+    sizes = 0
+
+    def size(self, name):
+        type(self).sizes += 1
+        return super().size(name)
+
+
+@pytest.fixture
+def storage(monkeypatch, tmp_path):
+    storage = CountingStorage(location=str(tmp_path))
+    monkeypatch.setattr(CountingStorage, 'sizes', 0)
+    field = CalibrationRecord._meta.get_field('certificate_file')
+    monkeypatch.setattr(field, 'storage', storage)
+    return storage
+
+
+@pytest.fixture
+def legacy_record(storage, make_equipment, make_calibration):
+    """A record whose certificate predates content-addressed uploads."""
+    record = make_calibration(make_equipment(), datetime.date(2024, 1, 1))
+    record.certificate_file.save(
+        'certificate.pdf', ContentFile(CONTENT), save=True
+    )
+    return record
+
+
+def download(record, **headers):
+    request = RequestFactory().get('/', headers=headers)
+    return serve_file(request, record_certificate(record))
+
+
+@pytest.mark.parametrize('header, status, body', [
+    ('bytes=10-19', 206, CONTENT[10:20]),
+    ('bytes=-5', 206, CONTENT[-5:]),
+    ('bytes=500-', 416, b''),
+    # Invalid ranges are ignored rather than refused
+    ('bytes=20-10', 200, CONTENT),
+])
+def test_ranges(legacy_record, header, status, body):
+    response = download(legacy_record, Range=header)
+    assert response.status_code == status
+    assert b''.join(response) == body
+
+
+def test_streamed_archive_does_not_ask_storage_for_sizes(legacy_record):
+    records = archive_records(CalibrationRecord.objects.all())
+    response = archive_response(records, 'certificates.zip')
+    assert CountingStorage.sizes == 0
+    assert CONTENT in b''.join(response.streaming_content)
+
+
+def test_mod_zip_archive_lists_sizes(legacy_record, settings):
+    settings.CERTIFICATE_DOWNLOAD_OFFLOAD = 'x-accel'
+    settings.CERTIFICATE_ZIP_OFFLOAD = True
+    records = archive_records(CalibrationRecord.objects.all())
+    response = archive_response(records, 'certificates.zip')
+    assert response['X-Archive-Files'] == 'zip'
+    assert response.content.decode().startswith(f'- {len(CONTENT)} ')
+    assert CountingStorage.sizes == 1
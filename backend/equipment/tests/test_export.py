@@ -0,0 +1,140 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_export.py
+# Description: Tests of the streaming CSV/NDJSON export
+# ============================================================================
+
+import csv
+import datetime
+import decimal
+import gzip
+import io
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from equipment import export
+from equipment.export import astream_export, get_export_queryset
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # Spread a handful of rows over several chunks
+    monkeypatch.setattr(export, 'ROWS_PER_CHUNK', 2)
+
+
+@pytest.fixture
+def history(make_equipment, make_calibration, make_maintenance):
+    lab, field = (
+        make_equipment(name='Lab thermometer', location='Lab 1'),
+        make_equipment(name='Field gauge', location='Site 2',
+                       category='Pressure Gauge'),
+    )
+    for equipment in (lab, field):
+        for day in (1, 15, 28):
+            make_calibration(
+                equipment, datetime.date(2024, 2, day),
+                measurement_points=[{'point': '0 C', 'nominal': 0}],
+            )
+    make_maintenance(
+        lab, datetime.date(2024, 3, 1), cost=decimal.Decimal('12.50'),
+        notes='Replaced probe, "PT100"',
+    )
+    return lab, field
+
+
+def download(client, **params):
+    response = client.get('/api/export/', params)
+    assert response.status_code == 200
+    return response, b''.join(response.streaming_content)
+
+
+def test_csv_lists_every_column(api_client, history):
+    lab, field = history
+    response, body = download(api_client, type='equipment')
+    assert response['Content-Type'] == 'text/csv'
+    assert response['Content-Disposition'] == (
+        'attachment; filename="equipment.csv"'
+    )
+    rows = list(csv.DictReader(io.StringIO(body.decode())))
+    assert [row['id'] for row in rows] == [str(lab.pk), str(field.pk)]
+    assert rows[0]['name'] == 'Lab thermometer'
+    assert rows[0]['purchase_date'] == '2020-01-01'
+    assert rows[0]['effective_status'] == lab.calculate_status()
+    assert rows[1]['category'] == 'Pressure Gauge'
+    assert rows[1]['notes'] == ''
+
+
+def test_csv_encodes_decimals_json_and_quotes(api_client, history):
+    _, body = download(api_client, type='maintenance')
+    row, = csv.DictReader(io.StringIO(body.decode()))
+    assert row['cost'] == '12.50'
+    assert row['notes'] == 'Replaced probe, "PT100"'
+    assert row['equipment_serial_number'] == history[0].serial_number
+
+    _, body = download(api_client, type='calibrations')
+    row = next(csv.DictReader(io.StringIO(body.decode())))
+    assert row['measurement_points'] == '[{"nominal":0,"point":"0 C"}]'
+    assert row['certificate_file'] == ''
+
+
+def test_ndjson_has_one_object_per_row(api_client, history):
+    response, body = download(api_client, type='calibrations',
+                              output='ndjson')
+    assert response['Content-Type'] == 'application/x-ndjson'
+    lines = body.decode().splitlines()
+    assert len(lines) == 6
+    first = json.loads(lines[0])
+    assert first['equipment_id'] == history[0].pk
+    assert first['calibration_date'] == '2024-02-01'
+    assert first['measurement_points'] == [{'point': '0 C', 'nominal': 0}]
+    assert list(first) == list(get_export_queryset('calibrations', {})[1])
+
+
+@pytest.mark.parametrize('params, count', [
+    ({'start': '2024-02-15'}, 4),
+    ({'end': '2024-02-15'}, 4),
+    ({'start': '2024-02-15', 'end': '2024-02-15'}, 2),
+    ({'location': 'Site 2'}, 3),
+    ({'category': 'Pressure Gauge', 'start': '2024-02-28'}, 1),
+    ({'location': 'Nowhere'}, 0),
+])
+def test_filters(api_client, history, params, count):
+    _, body = download(api_client, type='calibrations', output='ndjson',
+                       **params)
+    assert len(body.splitlines()) == count
+
+
+def test_gzip_body_matches_plain_body(api_client, history):
+    _, plain = download(api_client, type='calibrations')
+    response, body = download(api_client, type='calibrations', gzip='1')
+    assert response['Content-Type'] == 'application/gzip'
+    assert response['Content-Disposition'].endswith('calibrations.csv.gz"')
+    assert gzip.decompress(body) == plain
+
+
+@pytest.mark.parametrize('output', ['csv', 'ndjson'])
+def test_async_stream_matches_sync_stream(api_client, history, output):
+    _, plain = download(api_client, type='calibrations', output=output)
+    queryset, header = get_export_queryset('calibrations', {})
+
+    async def collect():
+        return b''.join([
+            chunk async for chunk in astream_export(queryset, header, output)
+        ])
+
+    assert async_to_sync(collect)() == plain
+
+
+@pytest.mark.parametrize('params', [
+    {'type': 'invoices'},
+    {'output': 'xlsx'},
+    {'start': '2024-13-01'},
+    {'end': 'yesterday'},
+])
+def test_invalid_parameters(api_client, params):
+    response = api_client.get('/api/export/', params)
+    assert response.status_code == 400
+    assert 'detail' in response.json()
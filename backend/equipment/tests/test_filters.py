@@ -0,0 +1,136 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_filters.py
+# Description: Tests of the declarative API filters and orderings
+# ============================================================================
+
+import datetime
+import decimal
+
+import pytest
+from django.utils import timezone
+
+pytestmark = pytest.mark.django_db
+
+DAY = datetime.timedelta(days=1)
+
+
+def ids(client, path):
+    response = client.get(path)
+    assert response.status_code == 200, response.content
+    return [row['id'] for row in response.json()['results']]
+
+
+@pytest.fixture
+def fleet(make_equipment):
+    now = timezone.now()
+    return {
+        'ok': make_equipment(
+            name='C', category='Thermometer', location='Lab 1',
+            last_calibration_date=now - timezone.timedelta(days=10),
+            next_calibration_date=now + timezone.timedelta(days=60),
+        ),
+        'due': make_equipment(
+            name='A', category='Balance', location='Lab 2',
+            manufacturer='Mettler',
+            last_calibration_date=now - timezone.timedelta(days=170),
+            next_calibration_date=now + timezone.timedelta(days=2),
+        ),
+        'retired': make_equipment(
+            name='B', category='Balance', location='Lab 1', status='retired',
+            next_calibration_date=now + timezone.timedelta(days=400),
+        ),
+    }
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('category=Balance', ['due', 'retired']),
+    ('category__in=Thermometer,Balance', ['due', 'retired', 'ok']),
+    ('location=Lab 1&category=Balance', ['retired']),
+    ('manufacturer=Mettler', ['due']),
+    ('status=calibration_due', ['due']),
+    ('status__in=active,retired', ['retired', 'ok']),
+    ('next_calibration_date__gte=2099-01-01', []),
+    ('category=', ['due', 'retired', 'ok']),
+])
+def test_equipment_filters(api_client, fleet, query, expected):
+    assert ids(api_client, f'/api/equipment/?{query}') == [
+        fleet[name].pk for name in expected
+    ]
+
+
+def test_date_only_upper_bound_includes_the_whole_day(api_client, fleet):
+    day = timezone.localtime(fleet['due'].next_calibration_date).date()
+    assert fleet['due'].pk in ids(
+        api_client, f'/api/equipment/?next_calibration_date__lte={day}'
+    )
+    assert fleet['due'].pk not in ids(
+        api_client,
+        f'/api/equipment/?next_calibration_date__lte={day - DAY}'
+    )
+
+
+@pytest.mark.parametrize('query, errors', [
+    ('status=broken', ['status']),
+    ('next_calibration_date__gte=soon', ['next_calibration_date__gte']),
+    ('status__in=active,broken&next_calibration_date__lte=x',
+     ['status__in', 'next_calibration_date__lte']),
+])
+def test_invalid_filter_values_are_rejected(api_client, query, errors):
+    response = api_client.get(f'/api/equipment/?{query}')
+    assert response.status_code == 400
+    assert sorted(response.json()) == sorted(errors)
+
+
+def test_undeclared_parameters_are_ignored(api_client, fleet):
+    # Only declared fields and lookups filter
+    assert len(ids(api_client, '/api/equipment/?name=A')) == 3
+    assert len(ids(api_client, '/api/equipment/?category__lt=B')) == 3
+
+
+def test_record_filters(api_client, fleet, make_calibration,
+                        make_maintenance):
+    early = make_calibration(fleet['ok'], datetime.date(2024, 1, 10))
+    late = make_calibration(fleet['due'], datetime.date(2024, 6, 10))
+    cheap = make_maintenance(fleet['ok'], datetime.date(2024, 2, 1),
+                             cost=decimal.Decimal('5'))
+    costly = make_maintenance(fleet['ok'], datetime.date(2024, 3, 1),
+                              cost=decimal.Decimal('500'),
+                              maintenance_type='corrective')
+    assert ids(
+        api_client,
+        '/api/calibration-records/?calibration_date__gte=2024-03-01'
+    ) == [late.pk]
+    assert ids(
+        api_client, f"/api/calibration-records/?equipment={fleet['ok'].pk}"
+    ) == [early.pk]
+    assert ids(
+        api_client, '/api/maintenance-records/?cost__gte=100'
+    ) == [costly.pk]
+    assert ids(
+        api_client, '/api/maintenance-records/?maintenance_type=preventive'
+    ) == [cheap.pk]
+
+
+@pytest.mark.parametrize('ordering, expected', [
+    ('name', ['due', 'retired', 'ok']),
+    ('-name', ['ok', 'retired', 'due']),
+    ('next_calibration_date', ['due', 'ok', 'retired']),
+    ('-next_calibration_date', ['retired', 'ok', 'due']),
+])
+def test_allowed_orderings(api_client, fleet, ordering, expected):
+    assert ids(api_client, f'/api/equipment/?ordering={ordering}') == [
+        fleet[name].pk for name in expected
+    ]
+
+
+@pytest.mark.parametrize('path, ordering', [
+    ('/api/equipment/', 'location'),
+    ('/api/equipment/', 'name,serial_number'),
+    ('/api/equipment/', '--name'),
+    ('/api/calibration-records/', 'calibrated_by'),
+    ('/api/maintenance-records/', 'cost'),
+])
+def test_rejected_orderings(api_client, path, ordering):
+    response = api_client.get(f'{path}?ordering={ordering}')
+    assert response.status_code == 400
+    assert 'ordering' in response.json()
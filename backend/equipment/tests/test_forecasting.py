@@ -0,0 +1,173 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_forecasting.py
+# Description: Tests of calibration workload forecasts and levelling
+# ============================================================================
+
+import datetime
+
+import pytest
+from django.utils import timezone
+
+from equipment.forecasting import (
+    ForecastError, build_forecast, level, parse_forecast_params,
+)
+from equipment.models import Equipment
+
+TODAY = datetime.date(2030, 1, 1)
+
+
+def due(day, hour=10):
+    return timezone.make_aware(datetime.datetime(2030, 1, day, hour))
+
+
+def forecast(**params):
+    return build_forecast(
+        Equipment.objects.all(), parse_forecast_params(params), TODAY
+    )
+
+
+def loads(result, name='due'):
+    """Return the non-empty periods of a series."""
+    return {
+        entry['period']: entry[name]
+        for entry in result['series'] if entry[name]
+    }
+
+
+@pytest.mark.django_db
+def test_weekly_schedule_by_day_week_and_month(make_equipment):
+    make_equipment(
+        next_calibration_date=due(3), calibration_interval_type='weekly',
+        calibration_interval_value=1,
+    )
+    daily = forecast(months='1')
+    assert daily['start'] == TODAY
+    assert daily['end'] == datetime.date(2030, 1, 31)
+    assert daily['total'] == 5
+    assert loads(daily) == {
+        datetime.date(2030, 1, day): 1 for day in (3, 10, 17, 24, 31)
+    }
+    # Weeks start on Monday, even before the forecast does
+    weekly = forecast(months='1', bucket='week')
+    assert [entry['period'] for entry in weekly['series']] == [
+        datetime.date(2029, 12, 31), datetime.date(2030, 1, 7),
+        datetime.date(2030, 1, 14), datetime.date(2030, 1, 21),
+        datetime.date(2030, 1, 28),
+    ]
+    assert [entry['due'] for entry in weekly['series']] == [1] * 5
+    assert forecast(months='1', bucket='month')['series'] == [
+        {'period': TODAY, 'due': 5}
+    ]
+
+
+@pytest.mark.django_db
+def test_months_clamp_once_and_keep_the_day(make_equipment):
+    make_equipment(next_calibration_date=due(31),
+                   calibration_interval_type='monthly',
+                   calibration_interval_value=1)
+    assert loads(forecast(months='3')) == {
+        datetime.date(2030, 1, 31): 1,
+        datetime.date(2030, 2, 28): 1,
+        datetime.date(2030, 3, 28): 1,
+    }
+
+
+@pytest.mark.django_db
+def test_hourly_schedules_repeat_within_the_day(make_equipment):
+    make_equipment(next_calibration_date=due(2),
+                   calibration_interval_type='hourly',
+                   calibration_interval_value=10)
+    result = loads(forecast(months='1'))
+    # From midnight on the 2nd: 0, 10 and 20 h, then 6 and 16 h, ...
+    assert result[datetime.date(2030, 1, 2)] == 3
+    assert result[datetime.date(2030, 1, 3)] == 2
+    assert sum(result.values()) == (30 * 24 - 1) // 10 + 1
+
+
+@pytest.mark.django_db
+def test_overdue_retired_and_undated_equipment(make_equipment):
+    make_equipment(
+        next_calibration_date=timezone.make_aware(
+            datetime.datetime(2029, 12, 20)
+        ),
+        calibration_interval_type='yearly', calibration_interval_value=1,
+    )
+    make_equipment(next_calibration_date=due(5), status='retired')
+    undated = make_equipment()
+    Equipment.objects.filter(pk=undated.pk).update(next_calibration_date=None)
+    result = forecast(months='1')
+    assert result['overdue'] == 1
+    assert loads(result) == {TODAY: 1}
+
+
+@pytest.mark.django_db
+def test_groups(make_equipment):
+    for location, day in (('Lab 1', 2), ('Lab 2', 2), ('Lab 2', 9)):
+        make_equipment(location=location, next_calibration_date=due(day),
+                       calibration_interval_type='yearly',
+                       calibration_interval_value=1)
+    result = forecast(months='1', bucket='month', group_by='location')
+    assert result['series'] == [{
+        'period': TODAY, 'due': 3, 'groups': {'Lab 1': 1, 'Lab 2': 2},
+    }]
+
+
+@pytest.mark.django_db
+def test_capacity_levels_the_forecast(make_equipment):
+    for _ in range(5):
+        make_equipment(next_calibration_date=due(3),
+                       calibration_interval_type='yearly',
+                       calibration_interval_value=1)
+    result = forecast(months='1', capacity='2')
+    assert loads(result, 'scheduled') == {
+        datetime.date(2030, 1, 1): 1,
+        datetime.date(2030, 1, 2): 2,
+        datetime.date(2030, 1, 3): 2,
+    }
+    assert result['moves'] == [
+        {'from': due(3).date(), 'to': TODAY, 'count': 1},
+        {'from': due(3).date(), 'to': datetime.date(2030, 1, 2),
+         'count': 2},
+    ]
+    assert result['unplaced'] == 0
+
+
+@pytest.mark.parametrize('load, capacity, expected', [
+    ([0, 0, 3], 1, ([1, 1, 1], [(2, 0, 1), (2, 1, 1)], 0)),
+    # Excess never moves past its due date; what fits nowhere stays first
+    ([1, 5, 0, 2], 2, ([4, 2, 0, 2], [(1, 0, 1)], 2)),
+    ([2, 1, 3, 0], 3, ([2, 1, 3, 0], [], 0)),
+    ([], 1, ([], [], 0)),
+])
+def test_level(load, capacity, expected):
+    assert level(load, capacity) == expected
+
+
+@pytest.mark.parametrize('params', [
+    {'months': '0'},
+    {'months': '37'},
+    {'bucket': 'year'},
+    {'group_by': 'manufacturer'},
+    {'capacity': '-1'},
+    {'capacity': 'many'},
+])
+def test_invalid_parameters(params):
+    with pytest.raises(ForecastError):
+        parse_forecast_params(params)
+
+
+@pytest.mark.django_db
+def test_forecast_endpoint_applies_list_filters(api_client, make_equipment):
+    now = timezone.now()
+    make_equipment(location='Lab 1',
+                   next_calibration_date=now + datetime.timedelta(days=3))
+    make_equipment(location='Lab 2',
+                   next_calibration_date=now + datetime.timedelta(days=3))
+    response = api_client.get(
+        '/api/equipment/forecast/', {'location': 'Lab 1', 'months': '1'}
+    )
+    assert response.status_code == 200
+    assert response.json()['total'] == 1
+    assert api_client.get(
+        '/api/equipment/forecast/', {'bucket': 'hour'}
+    ).status_code == 400
@@ -0,0 +1,95 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_history.py
+# Description: Tests of the per-equipment history windows
+# ============================================================================
+
+import datetime
+
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+def window(client, path, **params):
+    response = client.get(path, params)
+    assert response.status_code == 200, response.content
+    body = response.json()
+    assert list(body) == ['next', 'latest', 'results']
+    return body
+
+
+def ids(body):
+    return [row['id'] for row in body['results']]
+
+
+@pytest.fixture
+def history(make_equipment, make_calibration):
+    """Five calibrations of one instrument, oldest first."""
+    equipment, other = make_equipment(), make_equipment()
+    records = [
+        make_calibration(equipment, datetime.date(2024, month, 1))
+        for month in (1, 2, 3, 3, 4)
+    ]
+    make_calibration(other, datetime.date(2024, 5, 1))
+    return equipment, records, f'/api/equipment/{equipment.pk}/calibrations/'
+
+
+def test_latest_window_is_newest_first(api_client, history):
+    _, records, path = history
+    body = window(api_client, path, page_size=2)
+    # Same-day records are ordered by id
+    assert ids(body) == [records[4].pk, records[3].pk]
+    assert body['latest']
+
+    older = window(api_client, body['next'])
+    assert ids(older) == [records[2].pk, records[1].pk]
+    # Only the window holding the newest record hands out a token
+    assert older['latest'] is None
+    assert ids(window(api_client, older['next'])) == [records[0].pk]
+
+
+def test_since_latest_without_changes(api_client, history):
+    _, _, path = history
+    latest = window(api_client, path)['latest']
+    body = window(api_client, path, since=latest)
+    assert body == {'next': None, 'latest': latest, 'results': []}
+
+
+def test_since_returns_only_newer_records_oldest_first(
+    api_client, history, make_calibration
+):
+    equipment, _, path = history
+    latest = window(api_client, path)['latest']
+    added = [
+        make_calibration(equipment, datetime.date(2024, 6, day))
+        for day in (1, 2, 3)
+    ]
+    make_calibration(equipment, datetime.date(2023, 1, 1))
+
+    body = window(api_client, path, since=latest, page_size=2)
+    assert ids(body) == [added[0].pk, added[1].pk]
+    rest = window(api_client, body['next'])
+    assert ids(rest) == [added[2].pk]
+    assert rest['next'] is None
+    # The delta hands back a token for the newest record it saw
+    assert window(api_client, path, since=rest['latest'])['results'] == []
+    assert rest['latest'] == window(api_client, path)['latest']
+
+
+def test_maintenance_history(api_client, make_equipment, make_maintenance):
+    equipment = make_equipment()
+    records = [
+        make_maintenance(equipment, datetime.date(2024, month, 1))
+        for month in (1, 2)
+    ]
+    body = window(api_client, f'/api/equipment/{equipment.pk}/maintenance/')
+    assert ids(body) == [records[1].pk, records[0].pk]
+    assert body['next'] is None
+
+
+def test_invalid_windows(api_client, history):
+    _, _, path = history
+    assert api_client.get(path, {'since': 'bogus'}).status_code == 404
+    assert api_client.get(
+        '/api/equipment/0/calibrations/'
+    ).status_code == 404
@@ -0,0 +1,85 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_importers.py
+# Description: Tests of the calibration CSV importer
+# ============================================================================
+
+import csv
+import datetime
+import io
+
+import pytest
+from django.utils import timezone
+
+from equipment.importers import CalibrationImporter
+from equipment.scheduling import add_interval
+
+pytestmark = pytest.mark.django_db
+
+
+def csv_stream(*rows):
+    stream = io.StringIO()
+    writer = csv.writer(stream)
+    writer.writerow([
+        'serial_number', 'calibration_date', 'calibrated_by',
+        'certificate_number', 'calibration_standard', 'measurement_points',
+        'results',
+    ])
+    for number, (serial_number, date) in enumerate(rows):
+        writer.writerow([
+            serial_number, date.isoformat(), 'Metrology Lab',
+            f'IMP-{number}', 'ISO 17025', '[]', '[]',
+        ])
+    stream.seek(0)
+    return stream
+
+
+def midnight(date):
+    return timezone.make_aware(
+        datetime.datetime.combine(date, datetime.time.min)
+    )
+
+
+def test_import_advances_schedule(make_equipment):
+    equipment = make_equipment(serial_number='IMP-1')
+    assert equipment.status == 'calibration_overdue'
+    today = timezone.localdate()
+    newest = today - datetime.timedelta(days=10)
+
+    report = CalibrationImporter(chunk_size=1).run(csv_stream(
+        ('IMP-1', today - datetime.timedelta(days=40)),
+        ('IMP-1', newest),
+    ))
+    assert report['created'] == 2
+
+    equipment.refresh_from_db()
+    assert equipment.last_calibration_date == midnight(newest)
+    assert equipment.next_calibration_date == add_interval(
+        midnight(newest), 'monthly', 6
+    )
+    assert equipment.status == 'active'
+    assert equipment.calibration_count == 2
+
+
+def test_import_ignores_back_dated_calibrations(make_equipment):
+    last = timezone.now() - datetime.timedelta(days=5)
+    equipment = make_equipment(
+        serial_number='IMP-1', last_calibration_date=last
+    )
+    next_date = equipment.next_calibration_date
+
+    CalibrationImporter().run(csv_stream(
+        ('IMP-1', timezone.localdate() - datetime.timedelta(days=30)),
+    ))
+
+    equipment.refresh_from_db()
+    assert equipment.last_calibration_date == last
+    assert equipment.next_calibration_date == next_date
+
+
+def test_dry_run_leaves_schedule(make_equipment):
+    equipment = make_equipment(serial_number='IMP-1')
+    CalibrationImporter(dry_run=True).run(csv_stream(
+        ('IMP-1', timezone.localdate()),
+    ))
+    equipment.refresh_from_db()
+    assert equipment.last_calibration_date is None
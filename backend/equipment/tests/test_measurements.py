@@ -0,0 +1,198 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_measurements.py
+# Description: Tests of typed measurement points and drift analytics
+# ============================================================================
+
+import datetime
+
+import pytest
+from django.utils import timezone
+
+from equipment.analytics import build_drift_report, parse_drift_params
+from equipment.measurements import build_points
+from equipment.models import CalibrationRecord, MeasurementPoint
+
+DAY = datetime.date(2024, 5, 1)
+
+
+def points(measurement_points, results):
+    record = CalibrationRecord(
+        pk=7, equipment_id=3, calibration_date=DAY,
+        measurement_points=measurement_points, results=results,
+    )
+    return [
+        {
+            column: getattr(point, column)
+            for column in ('position', 'point', 'nominal', 'measured',
+                           'error', 'tolerance', 'unit', 'passed')
+        }
+        for point in build_points(record)
+    ]
+
+
+def test_results_are_merged_by_name():
+    merged = points(
+        [{'point': 'low', 'nominal': 10, 'tolerance': -0.5, 'unit': 'C'},
+         {'Name': 'high', 'setpoint': '100'}],
+        [{'label': 'high', 'reading': '±100.25'},
+         {'point': 'low', 'measured': 10.75}],
+    )
+    assert merged == [
+        {'position': 0, 'point': 'low', 'nominal': 10.0, 'measured': 10.75,
+         'error': 0.75, 'tolerance': 0.5, 'unit': 'C', 'passed': False},
+        {'position': 1, 'point': 'high', 'nominal': 100.0,
+         'measured': 100.25, 'error': 0.25, 'tolerance': None, 'unit': '',
+         'passed': None},
+    ]
+
+
+def test_unnamed_results_are_merged_by_position():
+    merged = points(
+        [{'nominal': 1, 'tolerance': 0.1}, {'nominal': 2, 'tolerance': 0.1}],
+        [1.05, {'actual': 2.5}, {'measured': 3}],
+    )
+    assert [
+        (point['nominal'], point['measured'], point['passed'])
+        for point in merged
+    ] == [(1.0, 1.05, True), (2.0, 2.5, False), (None, 3.0, None)]
+
+
+def test_results_may_be_a_mapping():
+    merged = points(
+        [{'point': 'a', 'nominal': 5}],
+        {'a': 5.5, 'b': {'nominal': 1, 'measured': 1, 'status': 'PASS'}},
+    )
+    assert [(point['point'], point['error'], point['passed'])
+            for point in merged] == [('a', 0.5, None), ('b', 0.0, True)]
+
+
+@pytest.mark.parametrize('entry, error, passed', [
+    # Stated values win over the derived ones
+    ({'error': 0.2, 'passed': True}, 0.2, True),
+    ({'deviation': '-0.2', 'result': 'out of tolerance'}, -0.2, False),
+    ({'status': 'unknown'}, 1.0, False),
+    ({'pass': 'yes'}, 1.0, True),
+    ({'tolerance': 1}, 1.0, True),
+])
+def test_error_and_verdict_defaults(entry, error, passed):
+    merged = points(
+        [{'point': 'p', 'nominal': 4, 'tolerance': 0.5}],
+        [{'point': 'p', 'measured': 5, **entry}],
+    )
+    assert (merged[0]['error'], merged[0]['passed']) == (error, passed)
+
+
+def test_entries_without_values_are_skipped():
+    merged = points(
+        [{'point': 'note only'}, {'point': 'x', 'nominal': 'n/a'},
+         {'point': 'y', 'nominal': 'inf', 'measured': 1}],
+        [],
+    )
+    assert [(point['position'], point['nominal'])
+            for point in merged] == [(2, None)]
+
+
+@pytest.mark.django_db
+def test_saved_records_keep_their_points(make_equipment, make_calibration):
+    record = make_calibration(
+        make_equipment(), DAY,
+        measurement_points=[{'point': 'p', 'nominal': 1}],
+        results=[{'point': 'p', 'measured': 1.5}],
+    )
+    assert list(record.points.values_list('point', 'error')) == [('p', 0.5)]
+    record.results = [{'point': 'p', 'measured': 0.75}]
+    record.save()
+    assert list(record.points.values_list('error', flat=True)) == [-0.25]
+    record.delete()
+    assert not MeasurementPoint.objects.exists()
+
+
+@pytest.fixture
+def drift(make_equipment, make_calibration):
+    """Instruments with a linear drift, a constant error and one sample."""
+    now = timezone.now()
+    today = timezone.localdate(now)
+
+    def calibrate(equipment, days_ago, error):
+        make_calibration(
+            equipment, today - datetime.timedelta(days=days_ago),
+            measurement_points=[{'point': '0 C', 'nominal': 0,
+                                 'tolerance': 2}],
+            results=[{'point': '0 C', 'measured': error}],
+        )
+
+    drifting = make_equipment(
+        next_calibration_date=now + datetime.timedelta(days=256)
+    )
+    # An exact slope of 1/256 per day, ending at 1.5 today
+    for step, error in enumerate((0, 0.5, 1, 1.5)):
+        calibrate(drifting, 384 - 128 * step, error)
+    offset = make_equipment(category='Hygrometer')
+    for days_ago in (30, 20, 10):
+        calibrate(offset, days_ago, -3)
+    single = make_equipment()
+    calibrate(single, 5, 0.25)
+    return now, today, drifting, offset, single
+
+
+@pytest.mark.django_db
+def test_drift_regression_and_crossings(drift):
+    now, today, drifting, offset, single = drift
+    report = build_drift_report(parse_drift_params({'point': '0 C'}), now)
+    assert report['samples'] == 8
+    rows = {row['equipment_id']: row for row in report['equipment']}
+    # Ordered by the size of the drift, unknown slopes last
+    assert [row['equipment_id'] for row in report['equipment']] == [
+        drifting.pk, offset.pk, single.pk
+    ]
+
+    trend = rows[drifting.pk]
+    assert trend['samples'] == 4
+    assert trend['drift_per_year'] == round(365.25 / 256, 6)
+    assert trend['current_error_estimate'] == 1.5
+    assert trend['mean_error'] == 0.75
+    assert trend['predicted_error_at_next_calibration'] == 2.5
+    assert trend['predicted_out_of_tolerance_on'] == (
+        today + datetime.timedelta(days=128)
+    )
+
+    # Already outside tolerance, with no drift
+    assert rows[offset.pk]['drift_per_year'] == 0
+    assert rows[offset.pk]['out_of_tolerance'] == 3
+    assert rows[offset.pk]['predicted_out_of_tolerance_on'] == today
+
+    # One calibration has no trend
+    assert rows[single.pk]['drift_per_year'] is None
+    assert rows[single.pk]['predicted_out_of_tolerance_on'] is None
+
+    assert [
+        (row['category'], row['equipment_count'], row['samples'])
+        for row in report['categories']
+    ] == [('Hygrometer', 1, 3), ('Thermometer', 2, 5)]
+
+
+@pytest.mark.django_db
+def test_drift_filters(drift):
+    now, _, drifting, offset, _ = drift
+    report = build_drift_report(parse_drift_params({
+        'nominal': '0', 'unit': '', 'category': 'Thermometer', 'last': '2',
+    }), now)
+    assert report['samples'] == 3
+    rows = {row['equipment_id']: row for row in report['equipment']}
+    assert offset.pk not in rows
+    # The two latest calibrations of the drifting instrument
+    assert rows[drifting.pk]['samples'] == 2
+    assert rows[drifting.pk]['drift_per_year'] == round(365.25 / 256, 6)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('params', [
+    {},
+    {'point': 'p', 'last': '0'},
+    {'nominal': 'nan'},
+    {'point': 'p', 'start': '2024-02-30'},
+    {'point': 'p', 'equipment': '1,x'},
+])
+def test_invalid_drift_parameters(api_client, params):
+    response = api_client.get('/api/analytics/drift/', params)
+    assert response.status_code == 400
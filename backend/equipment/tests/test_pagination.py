@@ -0,0 +1,126 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_pagination.py
+# Description: Tests of keyset pagination over the equipment list
+# ============================================================================
+
+import base64
+import json
+
+import pytest
+from django.utils import timezone
+
+pytestmark = pytest.mark.django_db
+
+
+def walk(client, path):
+    """Follow ``next`` links from ``path`` and return every row's id."""
+    seen = []
+    while path:
+        response = client.get(path)
+        assert response.status_code == 200
+        body = response.json()
+        assert set(body) == {'next', 'results'}
+        seen += [row['id'] for row in body['results']]
+        path = body['next']
+    return seen
+
+
+def cursor(payload):
+    encoded = base64.urlsafe_b64encode(json.dumps(payload).encode())
+    return encoded.decode().rstrip('=')
+
+
+@pytest.fixture
+def dated(make_equipment):
+    """Equipment with distinct, shared and missing calibration due dates."""
+    now = timezone.now()
+    days = [3, None, 1, 3, None, 2, 3, None]
+    return [
+        make_equipment(
+            name=f'Dated {number}',
+            next_calibration_date=(
+                None if day is None else now + timezone.timedelta(day)
+            ),
+        )
+        for number, day in enumerate(days)
+    ]
+
+
+def by_due_date(equipment, descending=False):
+    # NULLs sort above every date, with the id breaking ties
+    def key(item):
+        due = item.next_calibration_date
+        return (due is None, due or timezone.now(), item.pk)
+    return [
+        item.pk for item in sorted(equipment, key=key, reverse=descending)
+    ]
+
+
+def test_pages_follow_the_default_ordering(api_client, make_equipment):
+    equipment = [make_equipment(name=name) for name in 'ebdac']
+    first = api_client.get('/api/equipment/?cursor=&page_size=2').json()
+    assert len(first['results']) == 2
+    assert walk(api_client, '/api/equipment/?cursor=&page_size=2') == [
+        item.pk for item in sorted(equipment, key=lambda item: item.name)
+    ]
+
+
+def test_descending_pages(api_client, make_equipment):
+    equipment = [make_equipment(name=name) for name in 'ebdac']
+    assert walk(
+        api_client, '/api/equipment/?ordering=-name&cursor=&page_size=2'
+    ) == [
+        item.pk
+        for item in sorted(equipment, key=lambda item: item.name)[::-1]
+    ]
+
+
+def test_ties_are_broken_by_id(api_client, make_equipment):
+    equipment = [make_equipment(name='Same') for _ in range(5)]
+    pks = [item.pk for item in equipment]
+    assert walk(api_client, '/api/equipment/?cursor=&page_size=2') == pks
+    assert walk(
+        api_client, '/api/equipment/?ordering=-name&cursor=&page_size=2'
+    ) == pks[::-1]
+
+
+@pytest.mark.parametrize('page_size', [1, 2, 3])
+def test_null_sort_keys_come_last_ascending(api_client, dated, page_size):
+    assert walk(
+        api_client, '/api/equipment/?ordering=next_calibration_date'
+        f'&cursor=&page_size={page_size}'
+    ) == by_due_date(dated)
+
+
+@pytest.mark.parametrize('page_size', [1, 2, 3])
+def test_null_sort_keys_come_first_descending(api_client, dated, page_size):
+    assert walk(
+        api_client, '/api/equipment/?ordering=-next_calibration_date'
+        f'&cursor=&page_size={page_size}'
+    ) == by_due_date(dated, descending=True)
+
+
+def test_rows_added_behind_the_cursor_are_not_repeated(
+    api_client, make_equipment
+):
+    equipment = {name: make_equipment(name=name) for name in 'bdf'}
+    first = api_client.get('/api/equipment/?cursor=&page_size=2').json()
+    make_equipment(name='a')
+    equipment['e'] = make_equipment(name='e')
+    assert walk(api_client, first['next']) == [
+        equipment['e'].pk, equipment['f'].pk
+    ]
+
+
+@pytest.mark.parametrize('token', [
+    'not-a-cursor',
+    cursor([['name', 'id'], ['a']]),
+    cursor([['-name', '-id'], ['a', 1]]),
+    cursor([['name', 'id'], ['a', 'one']]),
+    cursor({'name': 'a'}),
+])
+def test_tampered_cursors_are_rejected(api_client, make_equipment, token):
+    make_equipment()
+    response = api_client.get(f'/api/equipment/?cursor={token}')
+    assert response.status_code == 404
+    assert response.json() == {'detail': 'Invalid cursor'}
@@ -0,0 +1,72 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_queries.py
+# Description: Query count regression tests for the equipment endpoints
+# ============================================================================
+
+import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def fleet(make_equipment, make_calibration, make_maintenance):
+    """Return a factory adding ``count`` equipment with some history."""
+
+    def make(count):
+        equipment = [make_equipment() for _ in range(count)]
+        for instrument in equipment:
+            for day in (1, 2, 3):
+                make_calibration(instrument, datetime.date(2024, 1, day))
+                make_maintenance(instrument, datetime.date(2024, 2, day))
+        return equipment
+
+    return make
+
+
+def count_queries(client, path):
+    """Return the queries of a request once the list validators are cached."""
+    client.get(path)
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(path)
+    assert response.status_code == 200
+    return len(queries)
+
+
+def test_list_queries_do_not_grow_with_rows(api_client, fleet):
+    fleet(3)
+    few = count_queries(api_client, '/api/equipment/?page_size=100')
+    fleet(30)
+    many = count_queries(api_client, '/api/equipment/?page_size=100')
+    assert few == many
+
+
+def test_list_query_count(api_client, fleet, django_assert_num_queries):
+    fleet(20)
+    # Cache the list validators, which are shared by every list request
+    api_client.get('/api/equipment/')
+    # The count and the page
+    with django_assert_num_queries(2):
+        response = api_client.get('/api/equipment/?page_size=100')
+    assert response.json()['count'] == 20
+
+
+def test_detail_query_count(api_client, fleet, django_assert_num_queries):
+    equipment = fleet(1)[0]
+    # Equipment, then the capped calibration and maintenance windows
+    with django_assert_num_queries(3):
+        response = api_client.get(f'/api/equipment/{equipment.pk}/')
+    body = response.json()
+    assert len(body['calibration_records']) == 3
+    assert len(body['maintenance_records']) == 3
+
+
+def test_detail_history_is_capped(api_client, fleet, settings):
+    settings.EQUIPMENT_DETAIL_HISTORY_LIMIT = 2
+    equipment = fleet(1)[0]
+    body = api_client.get(f'/api/equipment/{equipment.pk}/').json()
+    assert len(body['calibration_records']) == 2
+    assert len(body['maintenance_records']) == 2
@@ -0,0 +1,24 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_query_plans.py
+# Description: Fails when an API query plan needs a full scan or a sort
+# ============================================================================
+
+import pytest
+
+from equipment.query_plans import check_requests
+from equipment.seeding import seed_equipment
+
+pytestmark = pytest.mark.django_db
+
+# Large enough for the planners to prefer indexes over scanning the tables
+SEEDED_EQUIPMENT = 2000
+SEEDED_RECORDS = 5
+
+
+def test_api_queries_use_indexes():
+    seed_equipment(SEEDED_EQUIPMENT, SEEDED_RECORDS, prefix='PLAN-CHECK')
+    failures = check_requests()
+    assert not failures, '\n'.join(
+        f'{path}: {", ".join(problems)}\n  {sql}'
+        for path, sql, problems in failures
+    )
@@ -0,0 +1,86 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_rows.py
+# Description: Tests that list rows render exactly like the list serializer
+# ============================================================================
+
+import datetime
+import decimal
+
+import pytest
+from django.contrib.auth.models import User
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from equipment.models import Equipment
+from equipment.renderers import ORJSONRenderer
+from equipment.serializers import EquipmentListSerializer, equipment_list_rows
+
+pytestmark = pytest.mark.django_db
+
+
+def at(*args):
+    return timezone.make_aware(datetime.datetime(*args))
+
+
+@pytest.fixture
+def fleet(make_equipment, make_calibration, make_maintenance):
+    user = User.objects.create(username='metrology', email='m@example.com')
+    today = timezone.localdate()
+    # Never calibrated: null dates, summaries and foreign keys
+    make_equipment(name='Unbenutztes Gerät')
+    calibrated = make_equipment(
+        name='Thermomètre de référence ✓ 温度計',
+        notes='Line\u2028separator and "quotes" \\ backslash',
+        manufacturer='Ōmega',
+        calibration_interval_type='yearly',
+        calibration_interval_value=1,
+        created_by=user,
+    )
+    record = make_calibration(
+        calibrated, datetime.date(2024, 3, 5), certificate_number='ZERT-Ä1'
+    )
+    calibrated.last_calibration_date = at(2024, 3, 5, 9, 30, 15, 123456)
+    calibrated.next_calibration_date = at(2999, 3, 5, 9, 30)
+    calibrated.save()
+    make_maintenance(calibrated, today, cost=decimal.Decimal('1234.5'))
+    make_maintenance(
+        calibrated, today.replace(year=today.year - 1),
+        cost=decimal.Decimal('0.1')
+    )
+    # Manual statuses and a due date inside the warning window
+    make_equipment(name='In repair', status='maintenance')
+    make_equipment(name='Retired', status='retired')
+    make_equipment(
+        name='Due soon',
+        last_calibration_date=timezone.now() - timezone.timedelta(days=180),
+        next_calibration_date=timezone.now() + timezone.timedelta(days=2),
+    )
+    assert record.pk
+
+
+def test_rows_render_like_list_serializer(fleet):
+    queryset = Equipment.objects.with_effective_status().order_by('pk')
+    expected = JSONRenderer().render(
+        EquipmentListSerializer(queryset, many=True).data
+    )
+    rows = equipment_list_rows()
+    actual = ORJSONRenderer().render(
+        rows.to_representation(rows.project(queryset))
+    )
+    assert actual == expected
+    # Every value kind the contract is about is present
+    for fragment in (
+        b'null', b'"1234.50"', b'"0.00"', b'"Maintenance"', b'"Retired"',
+        b'\\u2028', '温度計'.encode(), b'+0000"',
+        b'"2024-03-05T09:30:15+0000"',
+    ):
+        assert fragment in expected
+
+
+def test_list_endpoint_matches_list_serializer(api_client, fleet):
+    body = api_client.get('/api/equipment/?ordering=name').content
+    queryset = Equipment.objects.with_effective_status().order_by('name')
+    results = JSONRenderer().render(
+        EquipmentListSerializer(queryset, many=True).data
+    )
+    assert b'"results":' + results in body
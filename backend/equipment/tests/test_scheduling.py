@@ -0,0 +1,115 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_scheduling.py
+# Description: Tests of calibration interval arithmetic and rescheduling
+# ============================================================================
+
+import datetime
+
+import pytest
+from django.utils import timezone
+
+from equipment.models import Equipment, EquipmentQuerySet
+from equipment.scheduling import add_interval, reschedule
+
+pytestmark = pytest.mark.django_db
+
+
+def at(*args):
+    return timezone.make_aware(datetime.datetime(*args))
+
+
+def test_add_interval_follows_the_calendar():
+    assert add_interval(at(2024, 1, 31), 'monthly', 1) == at(2024, 2, 29)
+    assert add_interval(at(2024, 2, 29), 'yearly', 1) == at(2025, 2, 28)
+    assert add_interval(at(2024, 1, 1), 'weekly', 2) == at(2024, 1, 15)
+
+
+def test_reschedule_updates_dates_and_timestamps(make_equipment):
+    calibrated = [
+        make_equipment(last_calibration_date=at(2026, 1, 31))
+        for _ in range(3)
+    ]
+    uncalibrated = make_equipment()
+    before = timezone.now()
+
+    count = reschedule(
+        Equipment.objects.all(), interval_type='monthly', interval_value=1
+    )
+    assert count == 3
+    for equipment in calibrated:
+        equipment.refresh_from_db()
+        assert equipment.calibration_interval_value == 1
+        assert equipment.next_calibration_date == at(2026, 2, 28)
+        assert equipment.updated_at >= before
+        assert equipment.status == equipment.calculate_status()
+    uncalibrated.refresh_from_db()
+    assert uncalibrated.next_calibration_date is None
+
+
+def test_reschedule_is_atomic(make_equipment, monkeypatch):
+    equipment = make_equipment(last_calibration_date=at(2026, 1, 31))
+    next_date = equipment.next_calibration_date
+
+    def fail(self, now=None):
+        raise RuntimeError('interrupted')
+
+    monkeypatch.setattr(EquipmentQuerySet, 'reconcile_status', fail)
+    with pytest.raises(RuntimeError):
+        reschedule(Equipment.objects.all(), interval_value=1)
+
+    equipment.refresh_from_db()
+    assert equipment.calibration_interval_value == 6
+    assert equipment.next_calibration_date == next_date
+
+
+@pytest.mark.parametrize('change, expected', [
+    ({'calibration_interval_type': 'weekly'}, at(2026, 3, 14)),
+    ({'calibration_interval_value': 1}, at(2026, 2, 28)),
+    ({'last_calibration_date': '2026-03-31T00:00:00Z'}, at(2026, 9, 30)),
+    ({'calibration_interval_value': 1,
+      'next_calibration_date': '2026-05-01T00:00:00Z'}, at(2026, 5, 1)),
+    # Changes unrelated to the schedule keep the due date
+    ({'location': 'Lab 9'}, at(2026, 7, 31)),
+])
+@pytest.mark.parametrize('path', ['single', 'bulk'])
+def test_single_and_bulk_updates_reschedule_alike(
+    api_client, make_equipment, path, change, expected
+):
+    equipment = make_equipment(
+        serial_number='SCHED-1', last_calibration_date=at(2026, 1, 31),
+        calibration_interval_type='monthly', calibration_interval_value=6,
+    )
+    assert equipment.next_calibration_date == at(2026, 7, 31)
+
+    if path == 'single':
+        response = api_client.patch(
+            f'/api/equipment/{equipment.pk}/', change, format='json'
+        )
+    else:
+        response = api_client.post('/api/equipment/bulk/', [
+            {'serial_number': 'SCHED-1', **change}
+        ], format='json')
+    assert response.status_code == 200, response.content
+    equipment.refresh_from_db()
+    assert equipment.next_calibration_date == expected
+
+
+@pytest.mark.parametrize('path', ['single', 'bulk'])
+def test_incomplete_schedule_keeps_the_due_date(
+    api_client, make_equipment, path
+):
+    equipment = make_equipment(
+        serial_number='SCHED-1', next_calibration_date=at(2026, 7, 31)
+    )
+    change = {'calibration_interval_value': 1}
+    if path == 'single':
+        api_client.patch(
+            f'/api/equipment/{equipment.pk}/', change, format='json'
+        )
+    else:
+        api_client.post('/api/equipment/bulk/', [
+            {'serial_number': 'SCHED-1', **change}
+        ], format='json')
+    equipment.refresh_from_db()
+    assert equipment.calibration_interval_value == 1
+    assert equipment.next_calibration_date == at(2026, 7, 31)
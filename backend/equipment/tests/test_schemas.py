@@ -0,0 +1,65 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_schemas.py
+# Description: Tests for the per-category measurement schemas
+# ============================================================================
+
+import pytest
+from django.utils.text import slugify
+
+from equipment.models import CalibrationRecord
+from equipment.schemas import validate_measurements
+from equipment.seeding import FLEET_CATEGORIES, seed_fleet
+
+
+@pytest.mark.parametrize('category', sorted(FLEET_CATEGORIES))
+def test_seed_categories_have_schemas(category):
+    points = FLEET_CATEGORIES[category][3]
+    definitions = [
+        {'point': name, 'nominal': nominal, 'unit': unit,
+         'tolerance': tolerance}
+        for name, nominal, unit, tolerance in points
+    ]
+    results = [
+        {'point': name, 'measured': nominal, 'passed': True}
+        for name, nominal, _, _ in points
+    ]
+    label, _, errors = validate_measurements(category, definitions, results)
+    assert label == f'{slugify(category)}.v1'
+    assert errors == {}
+
+
+def test_unknown_category_uses_default():
+    label, _, errors = validate_measurements('Spectrometer', [], [])
+    assert label == 'default.v1'
+    assert errors == {}
+
+
+def test_category_schema_checks_units():
+    _, _, errors = validate_measurements(
+        'Thermometer', [{'point': '0 C', 'nominal': 0, 'unit': 'bar'}], []
+    )
+    assert errors['measurement_points'] == [
+        '[0].unit: Expected one of C, °C, K, F, °F.'
+    ]
+
+
+def test_negative_mass_is_rejected():
+    _, _, errors = validate_measurements(
+        'Analytical Balance', {'-1 g': {'nominal': -1, 'unit': 'g'}}, []
+    )
+    assert errors['measurement_points'] == [
+        '-1 g.nominal: Ensure this value is at least 0.'
+    ]
+
+
+@pytest.mark.django_db
+def test_seeded_records_carry_their_category_schema():
+    seed_fleet(16, years=1)
+    labels = set(
+        CalibrationRecord.objects.values_list(
+            'equipment__category', 'schema_version'
+        )
+    )
+    assert labels
+    for category, label in labels:
+        assert label == f'{slugify(category)}.v1'
@@ -0,0 +1,48 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_search.py
+# Description: Tests of indexed search on the equipment API
+# ============================================================================
+
+import datetime
+
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+def names(response):
+    return [row['name'] for row in response.json()['results']]
+
+
+def test_search_ranks_matches(api_client, make_equipment):
+    make_equipment(name='Pressure gauge', notes='Spare thermometer')
+    make_equipment(name='Reference thermometer')
+    make_equipment(name='Torque wrench')
+    response = api_client.get('/api/equipment/?q=thermometer')
+    assert names(response) == ['Reference thermometer', 'Pressure gauge']
+
+
+def test_search_follows_updates(api_client, make_equipment):
+    equipment = make_equipment(name='Caliper')
+    equipment.name = 'Micrometer'
+    equipment.save()
+    assert names(api_client.get('/api/equipment/?q=caliper')) == []
+    assert names(api_client.get('/api/equipment/?q=micrometer')) == [
+        'Micrometer'
+    ]
+
+
+def test_records_match_certificate_text(
+    api_client, make_equipment, make_calibration
+):
+    # Indexed from migration 0010 on
+    equipment = make_equipment()
+    make_calibration(
+        equipment, datetime.date(2024, 1, 1),
+        certificate_text='Traceable to PTB reference 4711'
+    )
+    make_calibration(equipment, datetime.date(2024, 2, 1))
+    response = api_client.get('/api/calibration-records/?q=PTB')
+    assert [row['calibration_date'] for row in response.json()['results']] == [
+        '2024-01-01'
+    ]
@@ -0,0 +1,106 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_seeding.py
+# Description: Tests that synthetic fleets are reproducible
+# ============================================================================
+
+import datetime
+import io
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from equipment.models import (
+    CalibrationRecord, Equipment, MaintenanceRecord, MeasurementPoint,
+)
+from equipment.seeding import seed_fleet
+
+pytestmark = pytest.mark.django_db
+
+END = datetime.date(2024, 6, 30)
+
+# Columns that depend on when or in which order rows were inserted
+VOLATILE = {'id', 'created_at', 'updated_at', 'sync_seq'}
+
+
+def columns(model, *extra):
+    return [
+        field.attname for field in model._meta.concrete_fields
+        if field.attname not in VOLATILE and not field.attname.endswith('_id')
+    ] + list(extra)
+
+
+def snapshot():
+    """Return the generated fleet without ids and insertion times."""
+    return {
+        'equipment': list(
+            Equipment.objects.order_by('serial_number')
+            .values_list(*columns(Equipment))
+        ),
+        'calibrations': list(
+            CalibrationRecord.objects.order_by('certificate_number')
+            .values_list(*columns(CalibrationRecord,
+                                  'equipment__serial_number'))
+        ),
+        'maintenance': list(
+            MaintenanceRecord.objects
+            .order_by('equipment__serial_number', 'maintenance_date')
+            .values_list(*columns(MaintenanceRecord,
+                                  'equipment__serial_number'))
+        ),
+        'points': list(
+            MeasurementPoint.objects
+            .order_by('record__certificate_number', 'position')
+            .values_list(*columns(MeasurementPoint,
+                                  'record__certificate_number'))
+        ),
+    }
+
+
+def reseed(**options):
+    Equipment.objects.all().delete()
+    counts = seed_fleet(12, years=2, end=END, **options)
+    return counts, snapshot()
+
+
+def test_same_seed_gives_the_same_fleet():
+    counts, first = reseed(seed=7)
+    assert counts['equipment'] == 12
+    assert counts['calibration_records'] == len(first['calibrations']) > 12
+    assert counts['measurement_points'] == len(first['points'])
+    assert first['maintenance']
+    # Batching does not change what is generated
+    assert reseed(seed=7, batch_size=5) == (counts, first)
+
+
+def test_other_seeds_give_other_fleets():
+    _, first = reseed(seed=7)
+    _, other = reseed(seed=8)
+    assert other['equipment'] != first['equipment']
+    assert other['points'] != first['points']
+
+
+def test_history_ends_at_end_date():
+    reseed(seed=1)
+    dates = CalibrationRecord.objects.values_list(
+        'calibration_date', flat=True
+    )
+    assert max(dates) <= END
+    assert all(
+        equipment.last_calibration_date.date() <= END
+        for equipment in Equipment.objects.exclude(
+            last_calibration_date__isnull=True
+        )
+    )
+
+
+def test_command_refuses_to_overwrite_without_replace():
+    arguments = ['seed_fleet', '--equipment', '3', '--years', '1',
+                 '--end-date', END.isoformat()]
+    call_command(*arguments, stdout=io.StringIO())
+    first = snapshot()
+    with pytest.raises(CommandError):
+        call_command(*arguments, stdout=io.StringIO())
+    out = io.StringIO()
+    call_command(*arguments, '--replace', stdout=out)
+    assert 'Inserted 3 equipment' in out.getvalue()
+    assert snapshot() == first
@@ -0,0 +1,49 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_serializers.py
+# Description: Tests of the equipment API representations
+# ============================================================================
+
+import datetime
+
+import pytest
+
+from equipment.serializers import (
+    CalibrationRecordSerializer, EquipmentListSerializer,
+    MaintenanceRecordSerializer,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_list_publishes_only_listed_fields(api_client, make_equipment):
+    make_equipment()
+    row = api_client.get('/api/equipment/').json()['results'][0]
+    assert list(row) == list(EquipmentListSerializer.Meta.fields)
+    assert 'sync_seq' not in row
+    assert 'maintenance_cost_ytd' not in row
+
+
+def test_detail_adds_history(api_client, make_equipment):
+    equipment = make_equipment()
+    body = api_client.get(f'/api/equipment/{equipment.pk}/').json()
+    assert set(body) == {
+        *EquipmentListSerializer.Meta.fields,
+        'calibration_records', 'maintenance_records',
+    }
+
+
+@pytest.mark.parametrize('path, serializer', [
+    ('/api/calibration-records/', CalibrationRecordSerializer),
+    ('/api/maintenance-records/', MaintenanceRecordSerializer),
+])
+def test_records_publish_only_listed_fields(
+    api_client, make_equipment, make_calibration, make_maintenance, path,
+    serializer
+):
+    equipment = make_equipment()
+    make_calibration(equipment, datetime.date(2024, 1, 1))
+    make_maintenance(equipment, datetime.date(2024, 2, 1))
+    row = api_client.get(path).json()['results'][0]
+    assert list(row) == list(serializer.Meta.fields)
+    assert 'sync_seq' not in row
+    assert 'certificate_text' not in row
@@ -0,0 +1,100 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_status.py
+# Description: Tests of the effective status derived in the database
+# ============================================================================
+
+import pytest
+from django.utils import timezone
+
+from equipment.models import CALIBRATION_WARNING_DAYS, Equipment
+
+pytestmark = pytest.mark.django_db
+
+STATUSES = (
+    'active', 'calibration_due', 'calibration_overdue', 'maintenance',
+    'retired',
+)
+MICROSECOND = timezone.timedelta(microseconds=1)
+WARNING = timezone.timedelta(days=CALIBRATION_WARNING_DAYS)
+
+
+@pytest.fixture
+def now():
+    return timezone.now().replace(microsecond=500000)
+
+
+@pytest.mark.parametrize('due, expected', [
+    (-MICROSECOND, 'calibration_overdue'),
+    (timezone.timedelta(0), 'calibration_due'),
+    (WARNING - MICROSECOND, 'calibration_due'),
+    (WARNING, 'active'),
+])
+def test_boundaries(make_equipment, now, due, expected):
+    equipment = make_equipment(
+        last_calibration_date=now - timezone.timedelta(days=180),
+        next_calibration_date=now + due,
+    )
+    annotated = Equipment.objects.with_effective_status(now=now).get(
+        pk=equipment.pk
+    )
+    assert annotated.effective_status == expected
+    assert equipment.calculate_status(now=now) == expected
+    # Exactly one status filter selects the equipment
+    assert [
+        status for status in STATUSES
+        if Equipment.objects.with_status(status, now=now)
+        .filter(pk=equipment.pk).exists()
+    ] == [expected]
+
+
+def test_missing_dates_are_overdue(make_equipment, now):
+    uncalibrated = make_equipment(next_calibration_date=now + 2 * WARNING)
+    undated = make_equipment(
+        last_calibration_date=now - timezone.timedelta(days=1)
+    )
+    # Saving derives a due date from the interval, so clear it directly
+    Equipment.objects.filter(pk=undated.pk).update(next_calibration_date=None)
+    statuses = Equipment.objects.with_effective_status(now=now).values_list(
+        'effective_status', flat=True
+    )
+    assert list(statuses) == ['calibration_overdue'] * 2
+    assert set(
+        Equipment.objects.with_status('calibration_overdue', now=now)
+    ) == {uncalibrated, undated}
+
+
+@pytest.mark.parametrize('status', ['maintenance', 'retired'])
+def test_manual_statuses_are_kept(make_equipment, now, status):
+    equipment = make_equipment(status=status)
+    assert Equipment.objects.with_effective_status(now=now).get(
+        pk=equipment.pk
+    ).effective_status == status
+    assert list(
+        Equipment.objects.with_status(status, now=now)
+    ) == [equipment]
+
+
+def test_reconcile_updates_only_stale_rows(make_equipment, now):
+    last = now - timezone.timedelta(days=180)
+    fresh = make_equipment(
+        last_calibration_date=last, next_calibration_date=now + 2 * WARNING
+    )
+    # Saving derives the stored status from the clock, so keep clear of it
+    due = make_equipment(
+        last_calibration_date=last,
+        next_calibration_date=now + WARNING + timezone.timedelta(hours=1),
+    )
+    retired = make_equipment(status='retired')
+    assert due.status == 'active'
+
+    # A week later the first due date is inside the warning window and
+    # the second one has passed
+    later = due.next_calibration_date + MICROSECOND
+    assert Equipment.objects.reconcile_status(now=later) == 2
+    statuses = dict(Equipment.objects.values_list('pk', 'status'))
+    assert statuses == {
+        fresh.pk: 'calibration_due',
+        due.pk: 'calibration_overdue',
+        retired.pk: 'retired',
+    }
+    assert Equipment.objects.reconcile_status(now=later) == 0
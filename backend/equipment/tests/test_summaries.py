@@ -0,0 +1,141 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_summaries.py
+# Description: Tests of the record summaries stored on Equipment
+# ============================================================================
+
+import datetime
+import decimal
+import io
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from equipment.models import Equipment
+from equipment.summaries import SUMMARY_FIELDS
+
+pytestmark = pytest.mark.django_db
+
+
+def summary(equipment):
+    return Equipment.objects.values(*SUMMARY_FIELDS).get(pk=equipment.pk)
+
+
+def test_calibration_summary_follows_writes(make_equipment, make_calibration):
+    equipment = make_equipment()
+    march = make_calibration(
+        equipment, datetime.date(2024, 3, 1), certificate_number='MAR'
+    )
+    make_calibration(
+        equipment, datetime.date(2024, 1, 1), certificate_number='JAN'
+    )
+    values = summary(equipment)
+    assert values['calibration_count'] == 2
+    assert values['latest_calibration'] == march.pk
+    assert values['latest_calibration_date'] == datetime.date(2024, 3, 1)
+    assert values['latest_certificate_number'] == 'MAR'
+
+    # Moving the latest record back in time re-seeks the latest one
+    march.calibration_date = datetime.date(2023, 12, 1)
+    march.save()
+    values = summary(equipment)
+    assert values['calibration_count'] == 2
+    assert values['latest_certificate_number'] == 'JAN'
+
+    equipment.calibration_records.get(certificate_number='JAN').delete()
+    march.delete()
+    values = summary(equipment)
+    assert values['calibration_count'] == 0
+    assert values['latest_calibration'] is None
+    assert values['latest_calibration_date'] is None
+    assert values['latest_certificate_number'] == ''
+
+
+def test_maintenance_summary_follows_writes(make_equipment, make_maintenance):
+    equipment = make_equipment()
+    today = timezone.localdate()
+    last_year = today.replace(year=today.year - 1, day=1)
+    recent = make_maintenance(equipment, today, cost=decimal.Decimal('40'))
+    make_maintenance(equipment, last_year, cost=decimal.Decimal('2.50'))
+    values = summary(equipment)
+    assert values['maintenance_count'] == 2
+    assert values['latest_maintenance_date'] == today
+    assert values['maintenance_cost_total'] == decimal.Decimal('42.50')
+    assert values['maintenance_cost_ytd'] == decimal.Decimal('40')
+    assert values['maintenance_cost_year'] == today.year
+
+    recent.cost = decimal.Decimal('60')
+    recent.save()
+    assert summary(equipment)['maintenance_cost_total'] == 62.5
+
+    recent.delete()
+    values = summary(equipment)
+    assert values['maintenance_count'] == 1
+    assert values['latest_maintenance_date'] == last_year
+    assert values['maintenance_cost_ytd'] == 0
+
+
+def test_ytd_cost_reads_zero_after_its_year(make_equipment, make_maintenance):
+    equipment = make_equipment()
+    make_maintenance(
+        equipment, timezone.localdate(), cost=decimal.Decimal('10')
+    )
+    equipment.refresh_from_db()
+    now = timezone.now()
+    assert equipment.get_maintenance_cost_year_to_date(now) == 10
+    next_year = now + timezone.timedelta(days=366)
+    assert equipment.get_maintenance_cost_year_to_date(next_year) == 0
+
+
+def test_moved_record_updates_both_equipment(
+    make_equipment, make_calibration, make_maintenance
+):
+    source, target = make_equipment(), make_equipment()
+    record = make_calibration(source, datetime.date(2024, 1, 1))
+    repair = make_maintenance(source, datetime.date(2024, 1, 1),
+                              cost=decimal.Decimal('7'))
+    record.equipment = target
+    record.save()
+    repair.equipment = target
+    repair.save()
+    assert summary(source)['calibration_count'] == 0
+    assert summary(source)['latest_calibration'] is None
+    assert summary(source)['maintenance_cost_total'] == 0
+    assert summary(target)['calibration_count'] == 1
+    assert summary(target)['latest_calibration'] == record.pk
+    assert summary(target)['maintenance_cost_total'] == 7
+
+
+def test_stale_instance_does_not_overwrite_summary(
+    make_equipment, make_calibration
+):
+    equipment = make_equipment()
+    make_calibration(equipment, datetime.date(2024, 1, 1))
+    # The instance still holds the summary from before the record
+    equipment.location = 'Lab 7'
+    equipment.save()
+    assert summary(equipment)['calibration_count'] == 1
+
+
+def test_rebuild_command(make_equipment, make_calibration, make_maintenance):
+    equipment = [make_equipment() for _ in range(3)]
+    for number, item in enumerate(equipment):
+        make_calibration(item, datetime.date(2024, 1, 1))
+        make_maintenance(item, timezone.localdate(),
+                         cost=decimal.Decimal(number))
+    expected = [summary(item) for item in equipment]
+    Equipment.objects.update(
+        calibration_count=99, latest_calibration=None,
+        latest_certificate_number='', maintenance_cost_total=0,
+        maintenance_cost_ytd=0, maintenance_cost_year=None,
+    )
+
+    out = io.StringIO()
+    call_command('rebuild_equipment_summaries', batch_size=2, stdout=out)
+    assert 'Rebuilt summaries of 3 equipment.' in out.getvalue()
+    assert [summary(item) for item in equipment] == expected
+
+
+def test_rebuild_command_rejects_empty_batches():
+    with pytest.raises(CommandError):
+        call_command('rebuild_equipment_summaries', batch_size=0)
@@ -0,0 +1,69 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_sweeper.py
+# Description: Tests of the calibration status sweeper
+# ============================================================================
+
+import pytest
+from django.core import mail
+from django.utils import timezone
+
+from equipment import models
+from equipment.models import SweeperState
+from equipment.sweeper import sweep
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def due_soon(make_equipment, settings):
+    settings.CALIBRATION_DIGEST_RECIPIENTS = ['lab@example.com']
+    now = timezone.now()
+    equipment = make_equipment(
+        last_calibration_date=now - timezone.timedelta(days=180),
+        next_calibration_date=now + timezone.timedelta(days=3),
+    )
+    assert equipment.status == 'calibration_due'
+    return equipment, now + timezone.timedelta(days=4)
+
+
+class FailingConnection:
+    def send_messages(self, messages):
+        raise OSError('SMTP unavailable')
+
+
+def test_sweep_reconciles_and_sends_digest(due_soon):
+    equipment, later = due_soon
+    assert sweep(now=later) == (1, 1)
+    equipment.refresh_from_db()
+    assert equipment.status == 'calibration_overdue'
+    assert mail.outbox[0].to == ['lab@example.com']
+    assert SweeperState.objects.get().swept_until == later
+
+
+def test_mail_is_sent_before_sequence_lock(due_soon, monkeypatch):
+    equipment, later = due_soon
+    events = []
+    allocate = models.allocate_sync_seq
+
+    def allocate_sync_seq(using=None):
+        events.append('lock')
+        return allocate(using=using)
+
+    class Connection:
+        def send_messages(self, messages):
+            events.append('send')
+
+    monkeypatch.setattr(models, 'allocate_sync_seq', allocate_sync_seq)
+    sweep(now=later, connection=Connection())
+    assert events == ['send', 'lock']
+
+
+def test_failed_delivery_is_retried(due_soon):
+    equipment, later = due_soon
+    with pytest.raises(OSError):
+        sweep(now=later, connection=FailingConnection())
+    equipment.refresh_from_db()
+    assert equipment.status == 'calibration_due'
+    assert not SweeperState.objects.exclude(swept_until=None).exists()
+
+    assert sweep(now=later) == (1, 1)
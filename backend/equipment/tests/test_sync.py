@@ -0,0 +1,131 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_sync.py
+# Description: Tests of the incremental change feed
+# ============================================================================
+
+import datetime
+
+import pytest
+from django.utils import timezone
+
+from equipment.models import Equipment, sync_horizon
+from equipment.sync import encode_token, prune_tombstones
+
+pytestmark = pytest.mark.django_db
+
+
+def changes(client, since=None, **params):
+    if since is not None:
+        params['since'] = since
+    response = client.get('/api/sync/', params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def keys(page):
+    return [(change['type'], change['op'], change['id'])
+            for change in page['changes']]
+
+
+@pytest.fixture
+def synced(api_client, make_equipment, make_calibration):
+    """Two instruments with a calibration each and the token after them."""
+    equipment = [make_equipment(), make_equipment()]
+    records = [
+        make_calibration(instrument, datetime.date(2024, 1, 1))
+        for instrument in equipment
+    ]
+    return equipment, records, changes(api_client)['next']
+
+
+def test_full_sync_lists_every_object(api_client, synced):
+    equipment, records, _ = synced
+    page = changes(api_client)
+    assert sorted(keys(page)) == sorted(
+        [('equipment', 'upsert', item.pk) for item in equipment] +
+        [('calibration_record', 'upsert', item.pk) for item in records]
+    )
+    assert not page['has_more']
+    assert 'sync_seq' not in page['changes'][0]['data']
+
+
+def test_resume_returns_only_later_changes(api_client, synced):
+    equipment, _, token = synced
+    assert changes(api_client, token)['changes'] == []
+
+    equipment[1].location = 'Lab 9'
+    equipment[1].save()
+    page = changes(api_client, token)
+    assert keys(page) == [('equipment', 'upsert', equipment[1].pk)]
+    assert page['changes'][0]['data']['location'] == 'Lab 9'
+    assert changes(api_client, page['next'])['changes'] == []
+
+
+def test_pages_resume_inside_a_shared_sequence_number(
+    api_client, make_equipment
+):
+    # One bulk write gives every row the same sequence number
+    Equipment.objects.bulk_create([
+        Equipment(
+            name=f'Bulk {number}', model_number='M', manufacturer='Acme',
+            serial_number=f'BULK-{number}', category='Thermometer',
+            location='Lab 1', purchase_date=datetime.date(2020, 1, 1),
+        )
+        for number in range(5)
+    ])
+    seen, token = [], None
+    while True:
+        page = changes(api_client, token, limit=2)
+        seen += keys(page)
+        token = page['next']
+        if not page['has_more']:
+            break
+    assert len(seen) == len(set(seen)) == 5
+
+
+def test_deleted_record_leaves_tombstone(api_client, synced):
+    equipment, records, token = synced
+    pk = records[0].pk
+    records[0].delete()
+    page = changes(api_client, token)
+    # The equipment's record summary changed along with it
+    assert keys(page) == [
+        ('equipment', 'upsert', equipment[0].pk),
+        ('calibration_record', 'delete', pk),
+    ]
+    tombstone = page['changes'][1]
+    assert tombstone['equipment'] == equipment[0].pk
+    assert tombstone['seq'] >= page['changes'][0]['seq']
+
+
+def test_deleted_equipment_implies_its_records(api_client, synced):
+    equipment, _, token = synced
+    pk = equipment[0].pk
+    equipment[0].delete()
+    assert keys(changes(api_client, token)) == [('equipment', 'delete', pk)]
+
+
+def test_pruned_token_has_expired(api_client, synced):
+    _, records, token = synced
+    pk = records[0].pk
+    records[0].delete()
+    assert prune_tombstones(timezone.now() + timezone.timedelta(1)) == 1
+    response = api_client.get('/api/sync/', {'since': token})
+    assert response.status_code == 410
+    # A full sync still works and no longer mentions the record
+    page = changes(api_client)
+    assert ('calibration_record', 'delete', pk) not in keys(page)
+
+
+@pytest.mark.parametrize('params', [
+    {'since': 'not a token'},
+    {'since': encode_token((1, 99, 1))},
+    {'limit': '0'},
+])
+def test_invalid_parameters(api_client, params):
+    assert api_client.get('/api/sync/', params).status_code == 400
+
+
+def test_counter_changes_are_visible_at_once():
+    # Only PostgreSQL numbers changes by transaction and needs a horizon
+    assert sync_horizon() is None
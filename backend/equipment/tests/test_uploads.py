@@ -0,0 +1,139 @@
+# ============================================================================
+# File Path: backend/equipment/tests/test_uploads.py
+# Description: Tests for resumable certificate uploads and their dedup
+# ============================================================================
+
+import datetime
+import hashlib
+import io
+
+import pytest
+from django.core.files.storage import FileSystemStorage
+
+from equipment import uploads
+from equipment.models import Certificate
+
+pytestmark = pytest.mark.django_db
+
+CONTENT = b'%PDF-1.4 calibration certificate'
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def upload_root(settings, tmp_path):
+    settings.CERTIFICATE_UPLOAD_ROOT = str(tmp_path)
+
+
+@pytest.fixture
+def certificate():
+    # Stored under its digest, so no storage access is needed to reuse it
+    return Certificate.objects.create(
+        sha256=DIGEST,
+        file=f'certificates/{DIGEST[:2]}/{DIGEST}.pdf',
+        size=len(CONTENT),
+        content_type='application/pdf',
+        processing_status='done',
+    )
+
+
+@pytest.fixture
+def record(make_equipment, make_calibration):
+    return make_calibration(make_equipment(), datetime.date(2024, 1, 1))
+
+
+def start(client, record, **fields):
+    response = client.post('/api/certificate-uploads/', {
+        'filename': 'certificate.pdf',
+        'size': len(CONTENT),
+        'calibration_record': record.pk,
+        **fields,
+    }, format='json')
+    assert response.status_code == 201
+    return response.json()
+
+
+def send(client, upload, content):
+    return client.patch(
+        f"/api/certificate-uploads/{upload['id']}/", content,
+        content_type='application/octet-stream', HTTP_UPLOAD_OFFSET='0'
+    )
+
+
+def test_declared_digest_does_not_attach_stored_certificate(
+    api_client, certificate, record
+):
+    upload = start(api_client, record, sha256=DIGEST)
+    assert upload['status'] == 'uploading'
+    assert upload['certificate'] is None
+    record.refresh_from_db()
+    assert record.certificate is None
+
+
+def test_received_content_is_deduplicated(api_client, certificate, record):
+    upload = start(api_client, record, sha256=DIGEST)
+    response = send(api_client, upload, CONTENT)
+    assert response.status_code == 200
+    assert response.json()['status'] == 'complete'
+    record.refresh_from_db()
+    assert record.certificate == certificate
+    assert Certificate.objects.count() == 1
+
+
+def test_content_must_match_declared_digest(api_client, certificate, record):
+    upload = start(api_client, record, sha256=DIGEST)
+    response = send(api_client, upload, CONTENT.upper())
+    assert response.status_code == 422
+    record.refresh_from_db()
+    assert record.certificate is None
+
+
+def test_failed_completion_can_be_retried(
+    api_client, certificate, record, monkeypatch
+):
+    upload = start(api_client, record)
+    stored = uploads.store_certificate
+
+    def unavailable(*args, **kwargs):
+        raise OSError('storage unavailable')
+
+    monkeypatch.setattr(uploads, 'store_certificate', unavailable)
+    response = send(api_client, upload, CONTENT)
+    assert response.status_code == 503
+    assert response['Upload-Offset'] == str(len(CONTENT))
+    assert api_client.get(
+        f"/api/certificate-uploads/{upload['id']}/"
+    ).json()['status'] == 'uploading'
+
+    monkeypatch.setattr(uploads, 'store_certificate', stored)
+    response = api_client.patch(
+        f"/api/certificate-uploads/{upload['id']}/", b'',
+        content_type='application/octet-stream',
+        HTTP_UPLOAD_OFFSET=str(len(CONTENT))
+    )
+    assert response.status_code == 200
+    assert response.json()['status'] == 'complete'
+    assert response.json()['error'] == ''
+    record.refresh_from_db()
+    assert record.certificate == certificate
+
+
+@pytest.mark.parametrize('filename, content_type, extension', [
+    ('certificate.pdf', '', '.pdf'),
+    ('scan.JPG', 'image/jpeg', '.jpg'),
+    ('page.html', 'text/html', ''),
+    ('shell.php', '', ''),
+    ('report.pdf.php', 'application/pdf', '.pdf'),
+])
+def test_stored_name_extension_is_allow_listed(
+    monkeypatch, tmp_path, filename, content_type, extension
+):
+    field = Certificate._meta.get_field('file')
+    monkeypatch.setattr(
+        field, 'storage', FileSystemStorage(location=str(tmp_path))
+    )
+    stored = uploads.store_certificate(
+        io.BytesIO(CONTENT), DIGEST, len(CONTENT), filename, content_type
+    )
+    assert stored.file.name == (
+        f'{field.upload_to}{DIGEST[:2]}/{DIGEST}{extension}'
+    )
@@ -0,0 +1,255 @@
+# ============================================================================
+# File Path: backend/equipment/uploads.py
+# Description: Resumable chunked certificate uploads with content dedup
+# ============================================================================
+
+import hashlib
+import logging
+import mimetypes
+import os
+import posixpath
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.core.files import File
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import Certificate, CertificateUpload
+
+logger = logging.getLogger(__name__)
+
+# Bytes copied per read when receiving, hashing and storing files
+BLOCK_SIZE = 1024 * 1024
+
+# Extensions of stored certificates by content type; files of other types
+# are stored without one, whatever the client named them
+CERTIFICATE_EXTENSIONS = {
+    'application/pdf': '.pdf',
+    'image/png': '.png',
+    'image/jpeg': '.jpg',
+    'image/tiff': '.tif',
+}
+
+
+class UploadError(Exception):
+    """A chunk or upload that cannot be accepted.
+
+    ``status`` is the HTTP status to answer with. Offset conflicts carry
+    the upload's current ``offset`` so the client can resume from it.
+    """
+
+    def __init__(self, message, status=400, offset=None):
+        super().__init__(message)
+        self.status = status
+        self.offset = offset
+
+
+def staging_path(upload):
+    return os.path.join(settings.CERTIFICATE_UPLOAD_ROOT, f'{upload.pk}.part')
+
+
+def start_upload(upload):
+    """Prepare a new upload's staging file.
+
+    A declared checksum is only verified against the received bytes;
+    content is deduplicated by the digest the server computes.
+    """
+    os.makedirs(settings.CERTIFICATE_UPLOAD_ROOT, exist_ok=True)
+    open(staging_path(upload), 'wb').close()
+
+
+def append_chunk(upload, stream, offset, length):
+    """Append ``length`` bytes read from ``stream`` at ``offset``.
+
+    The body is received into a temporary file first, so the upload row is
+    only locked for the local append, never for the network transfer. A
+    chunk whose offset no longer matches the upload is rejected with 409.
+    Completes the upload once every byte has arrived; an empty chunk at
+    the final offset retries completing an upload whose completion failed.
+    """
+    if upload.status != 'uploading':
+        raise UploadError(f'Upload is {upload.status}.', status=409)
+    if offset != upload.offset:
+        raise UploadError(
+            'Offset does not match the upload.', status=409,
+            offset=upload.offset
+        )
+    if length > settings.CERTIFICATE_CHUNK_MAX_SIZE:
+        raise UploadError(
+            'Chunk is larger than the maximum of '
+            f'{settings.CERTIFICATE_CHUNK_MAX_SIZE} bytes.', status=413
+        )
+    if offset + length > upload.size:
+        raise UploadError('Chunk extends past the declared size.')
+
+    with tempfile.TemporaryFile(dir=settings.CERTIFICATE_UPLOAD_ROOT) as part:
+        received = _copy(stream, part, length)
+        if received != length:
+            raise UploadError(
+                f'Expected {length} bytes but received {received}.'
+            )
+        part.seek(0)
+        with transaction.atomic():
+            upload = CertificateUpload.objects.select_for_update().get(
+                pk=upload.pk
+            )
+            if upload.status != 'uploading' or upload.offset != offset:
+                raise UploadError(
+                    'Offset does not match the upload.', status=409,
+                    offset=upload.offset
+                )
+            with open(staging_path(upload), 'ab') as staged:
+                # Drop bytes left by an append whose commit failed
+                staged.truncate(offset)
+                shutil.copyfileobj(part, staged, BLOCK_SIZE)
+            upload.offset = offset + length
+            upload.save(update_fields=['offset', 'updated_at'])
+
+    if upload.offset == upload.size:
+        finalize_upload(upload)
+    return upload
+
+
+def finalize_upload(upload):
+    """Hash the staged file and store it as a certificate.
+
+    If storage or the database fails, the staged file is kept and the
+    upload stays at its final offset with the error recorded, so it can be
+    retried. Certificates are stored by digest, which makes retrying safe.
+    """
+    path = staging_path(upload)
+    digest = file_sha256(path)
+    if upload.sha256 and upload.sha256 != digest:
+        fail_upload(upload, 'Checksum does not match the uploaded content.')
+        raise UploadError(upload.error, status=422)
+    try:
+        with open(path, 'rb') as content:
+            certificate = store_certificate(
+                content, digest, upload.size, upload.filename,
+                upload.content_type
+            )
+        complete_upload(upload, certificate)
+    except UploadError:
+        raise
+    except Exception as exc:
+        logger.exception('Completing upload %s failed', upload.pk)
+        CertificateUpload.objects.filter(pk=upload.pk).update(
+            error=f'{type(exc).__name__}: {exc}', updated_at=timezone.now()
+        )
+        raise UploadError(
+            'The upload could not be stored. Send an empty chunk at the '
+            'final offset to retry.', status=503, offset=upload.size
+        )
+    os.remove(path)
+
+
+def file_sha256(path):
+    """Return the hex SHA-256 of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as content:
+        for block in iter(lambda: content.read(BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def store_certificate(content, digest, size, filename, content_type=''):
+    """Return the certificate for ``digest``, storing ``content`` if new.
+
+    The stored name is derived from the digest, so concurrent uploads of the
+    same file write the same object and only one row is created.
+    """
+    certificate = Certificate.objects.filter(sha256=digest).first()
+    if certificate is not None:
+        return certificate
+
+    content_type = (
+        content_type or mimetypes.guess_type(filename)[0] or ''
+    )
+    field = Certificate._meta.get_field('file')
+    extension = CERTIFICATE_EXTENSIONS.get(content_type, '')
+    name = posixpath.join(
+        field.upload_to, digest[:2], f'{digest}{extension}'
+    )
+    if not field.storage.exists(name):
+        name = field.storage.save(name, File(content, name=name))
+    try:
+        with transaction.atomic():
+            return Certificate.objects.create(
+                sha256=digest,
+                file=name,
+                size=size,
+                content_type=content_type,
+                original_name=filename,
+            )
+    except IntegrityError:
+        return Certificate.objects.get(sha256=digest)
+
+
+def complete_upload(upload, certificate):
+    """Mark ``upload`` complete and attach the certificate to its record."""
+    if certificate.processing_status == 'rejected':
+        fail_upload(upload, 'The certificate was rejected by the scanner.')
+        raise UploadError(upload.error, status=422)
+    with transaction.atomic():
+        upload.certificate = certificate
+        upload.offset = upload.size
+        upload.status = 'complete'
+        upload.error = ''
+        upload.save(update_fields=[
+            'certificate', 'offset', 'status', 'error', 'updated_at'
+        ])
+        if upload.calibration_record is not None:
+            upload.calibration_record.attach_certificate(certificate)
+
+
+def fail_upload(upload, error):
+    upload.status = 'failed'
+    upload.error = error
+    upload.save(update_fields=['status', 'error', 'updated_at'])
+    _remove_staged(upload)
+
+
+def abort_upload(upload):
+    """Delete an upload and its staged bytes."""
+    _remove_staged(upload)
+    upload.delete()
+
+
+def expire_uploads(now=None):
+    """Delete uploads that have not received a chunk within the expiry.
+
+    Returns the number of uploads removed.
+    """
+    now = now or timezone.now()
+    stale = CertificateUpload.objects.filter(
+        status='uploading',
+        updated_at__lt=now - timezone.timedelta(
+            seconds=settings.CERTIFICATE_UPLOAD_EXPIRY
+        )
+    )
+    expired = 0
+    for upload in stale.iterator():
+        abort_upload(upload)
+        expired += 1
+    return expired
+
+
+def _remove_staged(upload):
+    try:
+        os.remove(staging_path(upload))
+    except FileNotFoundError:
+        pass
+
+
+def _copy(stream, target, length):
+    """Copy up to ``length`` bytes; returns the number copied."""
+    copied = 0
+    while copied < length:
+        block = stream.read(min(BLOCK_SIZE, length - copied))
+        if not block:
+            break
+        target.write(block)
+        copied += len(block)
+    return copied
@@ -3,15 +3,65 @@
 # Description: Django URLs configuration for equipment app
 # ============================================================================
 
-from django.urls import path, include
+from django.conf import settings
+from django.urls import path, re_path, include
 from rest_framework.routers import DefaultRouter
-from . import views
+from . import async_views, views
 
 router = DefaultRouter()
 router.register(r'equipment', views.EquipmentViewSet)
 router.register(r'calibration-records', views.CalibrationRecordViewSet)
 router.register(r'maintenance-records', views.MaintenanceRecordViewSet)
+router.register(r'certificates', views.CertificateViewSet)
+router.register(r'certificate-uploads', views.CertificateUploadViewSet)
 
 urlpatterns = [
+    path('dashboard/', views.dashboard, name='dashboard'),
+    path('analytics/drift/', views.drift, name='analytics-drift'),
+    path('export/', views.export, name='export'),
+    path('sync/', views.sync, name='sync'),
     path('', include(router.urls)),
-] 
\ No newline at end of file
+]
+
+if settings.ASYNC_READ_VIEWS:
+    # Async views answer GETs of these URLs ahead of the DRF views, which
+    # still handle every other request; names match so reverse() is
+    # unchanged
+    sync_views = {url.name: url.callback for url in router.urls}
+    urlpatterns = [
+        path(
+            'equipment/',
+            async_views.read_view(
+                sync_views['equipment-list'], async_views.equipment_list
+            ),
+            name='equipment-list'
+        ),
+        re_path(
+            r'^equipment/(?P<pk>[^/.]+)/$',
+            async_views.read_view(
+                sync_views['equipment-detail'], async_views.equipment_detail
+            ),
+            name='equipment-detail'
+        ),
+        re_path(
+            r'^equipment/(?P<pk>[^/.]+)/calibrations/$',
+            async_views.read_view(
+                sync_views['equipment-calibrations'],
+                async_views.calibration_history
+            ),
+            name='equipment-calibrations'
+        ),
+        re_path(
+            r'^equipment/(?P<pk>[^/.]+)/maintenance/$',
+            async_views.read_view(
+                sync_views['equipment-maintenance'],
+                async_views.maintenance_history
+            ),
+            name='equipment-maintenance'
+        ),
+        path(
+            'dashboard/',
+            async_views.read_view(views.dashboard, async_views.dashboard),
+            name='dashboard'
+        ),
+    ] + urlpatterns
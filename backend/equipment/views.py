@@ -3,65 +3,122 @@
 # Description: DRF views for equipment management
 # ============================================================================
 
-from rest_framework import viewsets, permissions
-from rest_framework.decorators import action
+import datetime
+import io
+
+from django.conf import settings
+from django.db import transaction
+from django.http import Http404, StreamingHttpResponse
+from django.utils.dateparse import parse_date
+from rest_framework import mixins, viewsets, permissions, status
+from rest_framework.generics import get_object_or_404
+from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from django.utils import timezone
-from .models import Equipment, CalibrationRecord, MaintenanceRecord
+from core.streaming import is_asgi
+from .analytics import AnalyticsError, get_drift_report
+from .bulk import upsert_equipment
+from .conditional import CachedDetailMixin, conditional_list
+from .dashboard import get_dashboard_data
+from .downloads import (
+    DOWNLOAD_RENDERERS, archive_records, archive_response,
+    record_certificate, safe_filename, serve_file, stored_certificate,
+)
+from .export import (
+    EXPORT_FORMATS, ExportError, astream_export, get_export_queryset,
+    stream_export,
+)
+from .filters import FieldFilterBackend, IndexedOrderingFilter
+from .forecasting import ForecastError, get_forecast
+from .importers import CalibrationImporter
+from .models import (
+    Equipment, CalibrationRecord, MaintenanceRecord, Certificate,
+    CertificateUpload,
+)
+from .pagination import HistoryPagination, KeysetPagination
+from .renderers import ORJSONRenderer
+from .scheduling import rescheduled_date
+from .search import IndexedSearchFilter
 from .serializers import (
-    EquipmentSerializer,
+    EquipmentListSerializer,
+    EquipmentDetailSerializer,
     CalibrationRecordSerializer,
-    MaintenanceRecordSerializer
+    MaintenanceRecordSerializer,
+    CertificateSerializer,
+    CertificateUploadSerializer,
+    equipment_list_rows,
 )
+from .sync import SyncError, SyncExpired, get_changes
+from .uploads import UploadError, abort_upload, append_chunk, start_upload
 
 
-class EquipmentViewSet(viewsets.ModelViewSet):
+class EquipmentViewSet(CachedDetailMixin, viewsets.ModelViewSet):
     """ViewSet for Equipment model."""
     
     queryset = Equipment.objects.all()
-    serializer_class = EquipmentSerializer
+    serializer_class = EquipmentDetailSerializer
+    pagination_class = KeysetPagination
+    filter_backends = [
+        FieldFilterBackend, IndexedSearchFilter, IndexedOrderingFilter
+    ]
     permission_classes = [permissions.AllowAny]  # Temporarily allow all access
+    filter_fields = {
+        'status': ['exact', 'in'],
+        'category': ['exact', 'in'],
+        'location': ['exact', 'in'],
+        'manufacturer': ['exact', 'in'],
+        'next_calibration_date': ['gte', 'lte'],
+    }
+    # Ordering name -> columns of the index serving it
+    ordering_fields = {
+        'name': ('name', 'id'),
+        'serial_number': ('serial_number',),
+        'next_calibration_date': ('next_calibration_date', 'id'),
+    }
+    # Actions that return many rows and use the compact representation
+    list_actions = ('list', 'due_for_calibration', 'overdue_calibration')
+
+    def get_queryset(self):
+        return super().get_queryset().with_effective_status()
+
+    def get_serializer_class(self):
+        if self.action in self.list_actions:
+            return EquipmentListSerializer
+        return EquipmentDetailSerializer
+
+    def get_renderers(self):
+        if self.action in self.list_actions:
+            # List rows carry no floats, so orjson output is identical
+            return [ORJSONRenderer(), BrowsableAPIRenderer()]
+        return super().get_renderers()
+
+    def get_row_serializer(self):
+        """Return the read-optimized equivalent of the list serializer."""
+        return equipment_list_rows(context=self.get_serializer_context())
+
+    @conditional_list
+    def list(self, request, *args, **kwargs):
+        rows = self.get_row_serializer()
+        queryset = rows.project(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(rows.to_representation(page))
+        return Response(rows.to_representation(queryset))
+
+    def filter_status(self, queryset, lookup, value):
+        # Filter on the effective status rather than the stored column
+        statuses = value if lookup == 'in' else [value]
+        return queryset.with_status(*statuses)
 
     def perform_create(self, serializer):
         data = serializer.validated_data
         # Set default status if not provided
         if 'status' not in data:
             data['status'] = 'active'
-            
-        # Calculate next calibration date if last_calibration_date is provided
-        last_calibration = data.get('last_calibration_date')
-        next_calibration = data.get('next_calibration_date')
-        
-        if last_calibration and not next_calibration:
-            interval_days = 0
-            interval_value = data.get('calibration_interval_value', 1)
-            interval_type = data.get('calibration_interval_type')
-
-            if interval_type == 'hourly':
-                interval_days = interval_value / 24
-            elif interval_type == 'daily':
-                interval_days = interval_value
-            elif interval_type == 'weekly':
-                interval_days = interval_value * 7
-            elif interval_type == 'monthly':
-                interval_days = interval_value * 30
-            elif interval_type == 'yearly':
-                interval_days = interval_value * 365
-
-            data['next_calibration_date'] = (
-                last_calibration + 
-                timezone.timedelta(days=interval_days)
-            )
-        
-        # Ensure calibration interval fields are properly set
-        if ('calibration_interval_type' in data and 
-            'calibration_interval_value' in data):
-            # Convert calibration_interval_value to integer if it's a string
-            if isinstance(data['calibration_interval_value'], str):
-                data['calibration_interval_value'] = int(
-                    data['calibration_interval_value']
-                )
-        
+        self._schedule_next_calibration(data)
         serializer.save(
             created_by=(
                 self.request.user if self.request.user.is_authenticated 
@@ -70,64 +127,137 @@ class EquipmentViewSet(viewsets.ModelViewSet):
         )
 
     def perform_update(self, serializer):
-        data = serializer.validated_data
-        # Calculate next calibration date if last_calibration_date is updated
-        last_calibration = data.get('last_calibration_date')
-        next_calibration = data.get('next_calibration_date')
-        
-        if last_calibration and not next_calibration:
-            interval_days = 0
-            interval_value = data.get('calibration_interval_value', 1)
-            interval_type = data.get('calibration_interval_type')
-
-            if interval_type == 'hourly':
-                interval_days = interval_value / 24
-            elif interval_type == 'daily':
-                interval_days = interval_value
-            elif interval_type == 'weekly':
-                interval_days = interval_value * 7
-            elif interval_type == 'monthly':
-                interval_days = interval_value * 30
-            elif interval_type == 'yearly':
-                interval_days = interval_value * 365
-
-            data['next_calibration_date'] = (
-                last_calibration + 
-                timezone.timedelta(days=interval_days)
+        self._schedule_next_calibration(
+            serializer.validated_data, serializer.instance
+        )
+        serializer.save()
+
+    @staticmethod
+    def _schedule_next_calibration(data, instance=None):
+        """Move next_calibration_date after a change to its inputs."""
+        next_date = rescheduled_date(data, instance)
+        if next_date is not None:
+            data['next_calibration_date'] = next_date
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """Create or update many equipment in one request.
+
+        Accepts a list of equipment objects keyed by ``serial_number`` and
+        returns a per-row report of created, updated and rejected rows.
+        """
+        rows = request.data
+        if not isinstance(rows, list):
+            return Response(
+                {'detail': 'Expected a list of equipment objects.'},
+                status=status.HTTP_400_BAD_REQUEST
             )
-        
-        # Ensure calibration interval fields are properly set
-        if ('calibration_interval_type' in data and 
-            'calibration_interval_value' in data):
-            # Convert calibration_interval_value to integer if it's a string
-            if isinstance(data['calibration_interval_value'], str):
-                data['calibration_interval_value'] = int(
-                    data['calibration_interval_value']
+        if len(rows) > settings.EQUIPMENT_BULK_MAX_ROWS:
+            return Response(
+                {'detail': (
+                    'Too many rows; the maximum is '
+                    f'{settings.EQUIPMENT_BULK_MAX_ROWS}.'
+                )},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        user = request.user if request.user.is_authenticated else None
+        return Response(upsert_equipment(rows, user=user))
+
+    @action(detail=True, methods=['get'])
+    def calibrations(self, request, pk=None):
+        """Get a window of the equipment's calibration history."""
+        return self._history(CalibrationRecord, CalibrationRecordSerializer)
+
+    @action(detail=True, methods=['get'])
+    def maintenance(self, request, pk=None):
+        """Get a window of the equipment's maintenance history."""
+        return self._history(MaintenanceRecord, MaintenanceRecordSerializer)
+
+    @action(
+        detail=True,
+        methods=['get'],
+        renderer_classes=DOWNLOAD_RENDERERS,
+        permission_classes=[permissions.IsAuthenticated]
+    )
+    def certificates(self, request, pk=None):
+        """Download the equipment's certificates as a zip archive.
+
+        Optional ``start`` and ``end`` dates limit the calibration dates.
+        """
+        equipment = get_object_or_404(
+            Equipment.objects.only('pk', 'serial_number'), pk=pk
+        )
+        records = CalibrationRecord.objects.filter(equipment=equipment)
+        for param, lookup in (('start', 'gte'), ('end', 'lte')):
+            raw = request.query_params.get(param)
+            if not raw:
+                continue
+            try:
+                value = parse_date(raw)
+            except ValueError:
+                value = None
+            if value is None:
+                return Response(
+                    {param: ['Expected a date as YYYY-MM-DD.']},
+                    status=status.HTTP_400_BAD_REQUEST
                 )
-        
-        serializer.save()
+            records = records.filter(**{f'calibration_date__{lookup}': value})
+        return _certificate_archive(
+            records,
+            f'{safe_filename(equipment.serial_number)}-certificates.zip'
+        )
+
+    def _history(self, model, serializer_class):
+        equipment = get_object_or_404(
+            Equipment.objects.only('pk'), pk=self.kwargs['pk']
+        )
+        paginator = HistoryPagination()
+        records = paginator.paginate_queryset(
+            model.objects.filter(equipment=equipment), self.request, view=self
+        )
+        serializer = serializer_class(
+            records, many=True, context=self.get_serializer_context()
+        )
+        return paginator.get_paginated_response(serializer.data)
 
     @action(detail=False, methods=['get'])
+    @conditional_list
     def due_for_calibration(self, request):
-        """Get equipment due for calibration."""
-        today = timezone.now().date()
-        equipment = self.get_queryset().filter(
-            next_calibration_date__lte=today,
-            status__in=['active', 'calibration_due']
+        """Get equipment due or overdue for calibration."""
+        equipment = self.filter_queryset(self.get_queryset()).with_status(
+            'calibration_due', 'calibration_overdue'
         )
-        serializer = self.get_serializer(equipment, many=True)
-        return Response(serializer.data)
+        rows = self.get_row_serializer()
+        return Response(rows.to_representation(rows.project(equipment)))
 
     @action(detail=False, methods=['get'])
+    @conditional_list
     def overdue_calibration(self, request):
         """Get equipment with overdue calibration."""
-        today = timezone.now().date()
-        equipment = self.get_queryset().filter(
-            next_calibration_date__lt=today,
-            status__in=['active', 'calibration_due']
-        )
-        serializer = self.get_serializer(equipment, many=True)
-        return Response(serializer.data)
+        equipment = self.filter_queryset(
+            self.get_queryset()
+        ).with_status('calibration_overdue')
+        rows = self.get_row_serializer()
+        return Response(rows.to_representation(rows.project(equipment)))
+
+    @action(detail=False, methods=['get'])
+    def forecast(self, request):
+        """Forecast the calibration workload of the filtered equipment.
+
+        Query parameters: ``months``, ``bucket`` (day, week, month),
+        ``group_by`` (location, category) and ``capacity`` per day, plus
+        the list filters.
+        """
+        try:
+            forecast = get_forecast(
+                self.filter_queryset(self.get_queryset()),
+                request.query_params
+            )
+        except ForecastError as exc:
+            return Response(
+                {'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(forecast)
 
 
 class CalibrationRecordViewSet(viewsets.ModelViewSet):
@@ -135,46 +265,108 @@ class CalibrationRecordViewSet(viewsets.ModelViewSet):
     
     queryset = CalibrationRecord.objects.all()
     serializer_class = CalibrationRecordSerializer
+    pagination_class = KeysetPagination
+    filter_backends = [
+        FieldFilterBackend, IndexedSearchFilter, IndexedOrderingFilter
+    ]
     permission_classes = [permissions.AllowAny]  # Temporarily allow all access
+    filter_fields = {
+        'equipment': ['exact', 'in'],
+        'calibration_date': ['gte', 'lte'],
+    }
+    ordering_fields = {
+        'calibration_date': ('calibration_date', 'id'),
+    }
 
+    @transaction.atomic
     def perform_create(self, serializer):
-        data = serializer.validated_data
-        # Convert calibration_interval_value to integer if it's a string
-        if isinstance(data.get('calibration_interval_value'), str):
-            data['calibration_interval_value'] = int(
-                data['calibration_interval_value']
-            )
-        
-        # Set initial calibration dates based on interval type and value
-        now = timezone.now()
-        interval_type = data.get('calibration_interval_type')
-        interval_value = data.get('calibration_interval_value', 1)
-        
-        if interval_type == 'hourly':
-            next_calibration = now + timezone.timedelta(hours=interval_value)
-        elif interval_type == 'daily':
-            next_calibration = now + timezone.timedelta(days=interval_value)
-        elif interval_type == 'weekly':
-            next_calibration = now + timezone.timedelta(weeks=interval_value)
-        elif interval_type == 'monthly':
-            # Add months (approximate)
-            next_calibration = now + timezone.timedelta(
-                days=30 * interval_value
-            )
-        else:  # yearly
-            # Add years (approximate)
-            next_calibration = now + timezone.timedelta(
-                days=365 * interval_value
-            )
-        
-        serializer.save(
+        record = serializer.save(
             created_by=(
                 self.request.user if self.request.user.is_authenticated 
                 else None
-            ),
-            last_calibration_date=now,
-            next_calibration_date=next_calibration
+            )
         )
+        # Move the equipment's schedule forward from this calibration
+        calibrated_at = timezone.make_aware(datetime.datetime.combine(
+            record.calibration_date, datetime.time.min
+        ))
+        record.equipment.record_calibration(calibrated_at)
+
+    @action(
+        detail=True,
+        methods=['get'],
+        renderer_classes=DOWNLOAD_RENDERERS,
+        permission_classes=[permissions.IsAuthenticated]
+    )
+    def certificate(self, request, pk=None):
+        """Download the record's certificate, with Range support."""
+        record = self.get_object()
+        stored = record_certificate(record)
+        if stored is None:
+            raise Http404('This record has no certificate.')
+        return serve_file(request, stored)
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path='certificates',
+        renderer_classes=DOWNLOAD_RENDERERS,
+        permission_classes=[permissions.IsAuthenticated]
+    )
+    def certificate_archive(self, request):
+        """Download the certificates of the filtered records as a zip.
+
+        Accepts the list filters, e.g. ``equipment`` and
+        ``calibration_date__gte``/``__lte`` for an audit period.
+        """
+        return _certificate_archive(
+            self.filter_queryset(self.get_queryset()), 'certificates.zip'
+        )
+
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='import',
+        parser_classes=[MultiPartParser]
+    )
+    def import_csv(self, request):
+        """Bulk import calibration records from an uploaded CSV file.
+
+        Form fields: ``file``, ``dry_run``, ``chunk_size`` and
+        ``start_chunk`` (to resume after ``last_committed_chunk`` of an
+        earlier, interrupted import).
+        """
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response(
+                {'detail': 'A CSV file is required in the "file" field.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            chunk_size = int(request.data.get('chunk_size', 1000))
+            start_chunk = int(request.data.get('start_chunk', 0))
+        except ValueError:
+            return Response(
+                {'detail': 'chunk_size and start_chunk must be integers.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if chunk_size < 1 or start_chunk < 0:
+            return Response(
+                {'detail': 'chunk_size must be positive and start_chunk '
+                           'must not be negative.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        dry_run = str(request.data.get('dry_run', '')).lower() in (
+            '1', 'true', 'yes'
+        )
+        importer = CalibrationImporter(
+            chunk_size=chunk_size,
+            dry_run=dry_run,
+            user=request.user if request.user.is_authenticated else None
+        )
+        stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        return Response(importer.run(stream, start_chunk))
 
 
 class MaintenanceRecordViewSet(viewsets.ModelViewSet):
@@ -182,7 +374,224 @@ class MaintenanceRecordViewSet(viewsets.ModelViewSet):
     
     queryset = MaintenanceRecord.objects.all()
     serializer_class = MaintenanceRecordSerializer
+    pagination_class = KeysetPagination
+    filter_backends = [
+        FieldFilterBackend, IndexedSearchFilter, IndexedOrderingFilter
+    ]
+    permission_classes = [permissions.AllowAny]  # Temporarily allow all access
+    filter_fields = {
+        'equipment': ['exact', 'in'],
+        'maintenance_type': ['exact', 'in'],
+        'maintenance_date': ['gte', 'lte'],
+        'cost': ['gte', 'lte'],
+    }
+    ordering_fields = {
+        'maintenance_date': ('maintenance_date', 'id'),
+    }
+
+    def perform_create(self, serializer):
+        serializer.save(created_by=self.request.user if self.request.user.is_authenticated else None) 
+
+
+class CertificateViewSet(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    """Read a stored certificate and its processing state."""
+
+    queryset = Certificate.objects.all()
+    serializer_class = CertificateSerializer
+    permission_classes = [permissions.AllowAny]  # Temporarily allow all access
+
+    @action(
+        detail=True,
+        methods=['get'],
+        renderer_classes=DOWNLOAD_RENDERERS,
+        permission_classes=[permissions.IsAuthenticated]
+    )
+    def download(self, request, pk=None):
+        """Download the certificate file, with Range support."""
+        certificate = self.get_object()
+        if not certificate.file:
+            raise Http404('The certificate file is not available.')
+        return serve_file(request, stored_certificate(certificate))
+
+    @action(
+        detail=True,
+        methods=['get'],
+        renderer_classes=DOWNLOAD_RENDERERS,
+        permission_classes=[permissions.IsAuthenticated]
+    )
+    def thumbnail(self, request, pk=None):
+        """Download the certificate's PNG thumbnail."""
+        certificate = self.get_object()
+        if not certificate.thumbnail:
+            raise Http404('The certificate has no thumbnail.')
+        stored = stored_certificate(certificate)._replace(
+            file=certificate.thumbnail,
+            filename=f'{certificate.sha256}.png',
+            content_type='image/png',
+            etag=f'"{certificate.sha256}-thumbnail"',
+            size=None
+        )
+        return serve_file(request, stored)
+
+
+class CertificateUploadViewSet(
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.DestroyModelMixin,
+    viewsets.GenericViewSet
+):
+    """Resumable chunked certificate uploads.
+
+    ``POST`` starts an upload with its ``filename``, ``size`` and optionally
+    ``sha256`` and ``calibration_record``. Each ``PATCH`` sends the next
+    chunk as the raw request body with an ``Upload-Offset`` header; a 409
+    carries the offset to resume from, which ``GET`` also reports. The
+    upload completes with the last chunk; if storing it fails the answer is
+    a 503, and an empty ``PATCH`` at the final offset retries. ``DELETE``
+    aborts it.
+    """
+
+    queryset = CertificateUpload.objects.select_related('certificate')
+    serializer_class = CertificateUploadSerializer
     permission_classes = [permissions.AllowAny]  # Temporarily allow all access
 
     def perform_create(self, serializer):
-        serializer.save(created_by=self.request.user if self.request.user.is_authenticated else None) 
\ No newline at end of file
+        upload = serializer.save(
+            created_by=(
+                self.request.user if self.request.user.is_authenticated
+                else None
+            )
+        )
+        try:
+            start_upload(upload)
+        except UploadError as exc:
+            raise ValidationError({'detail': str(exc)})
+
+    def partial_update(self, request, pk=None):
+        upload = self.get_object()
+        try:
+            offset = int(request.headers['Upload-Offset'])
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except (KeyError, ValueError):
+            return Response(
+                {'detail': 'An integer Upload-Offset header is required.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            # The body is streamed to disk, never parsed or held in memory
+            upload = append_chunk(upload, request.stream, offset, length)
+        except UploadError as exc:
+            upload.refresh_from_db()
+            response = Response({'detail': str(exc)}, status=exc.status)
+            response['Upload-Offset'] = upload.offset
+            return response
+        response = Response(self.get_serializer(upload).data)
+        response['Upload-Offset'] = upload.offset
+        return response
+
+    def perform_destroy(self, instance):
+        abort_upload(instance)
+
+
+def _certificate_archive(records, filename):
+    records = archive_records(records)
+    limit = settings.CERTIFICATE_ARCHIVE_MAX_FILES
+    if records.count() > limit:
+        return Response(
+            {'detail': (
+                f'More than {limit} certificates match; narrow the date '
+                'range.'
+            )},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return archive_response(records, filename)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])  # Temporarily allow all access
+def dashboard(request):
+    """Get aggregated equipment statistics for the dashboard."""
+    return Response(get_dashboard_data())
+
+
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])  # Temporarily allow all access
+def drift(request):
+    """Get measurement drift trends and out-of-tolerance predictions.
+
+    Query parameters: ``point`` or ``nominal`` (with ``unit``), and
+    optionally ``equipment``, ``category``, ``location``, ``start``,
+    ``end``, ``last`` and ``limit``.
+    """
+    try:
+        report = get_drift_report(request.query_params)
+    except AnalyticsError as exc:
+        return Response(
+            {'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST
+        )
+    return Response(report)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])  # Temporarily allow all access
+def sync(request):
+    """Get equipment and records changed since a sync token.
+
+    Query parameters: ``since``, the ``next`` token of the previous page
+    (omitted for a full sync), and ``limit``. An expired token gets
+    410 Gone and must be replaced by a full sync.
+    """
+    try:
+        changes = get_changes(
+            request.query_params, context={'request': request}
+        )
+    except SyncExpired as exc:
+        return Response({'detail': str(exc)}, status=status.HTTP_410_GONE)
+    except SyncError as exc:
+        return Response(
+            {'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST
+        )
+    return Response(changes)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])  # Temporarily allow all access
+def export(request):
+    """Stream equipment, calibration or maintenance data as CSV or NDJSON.
+
+    Query parameters: ``type`` (equipment, calibrations, maintenance),
+    ``output`` (csv, ndjson), ``gzip``, ``start``, ``end``, ``location`` and
+    ``category``.
+    """
+    params = request.query_params
+    export_type = params.get('type', 'equipment')
+    export_format = params.get('output', 'csv')
+    compress = params.get('gzip', '').lower() in ('1', 'true', 'yes')
+    if export_format not in EXPORT_FORMATS:
+        return Response(
+            {'detail': (
+                f'Unknown output "{export_format}"; expected one of '
+                f'{", ".join(EXPORT_FORMATS)}.'
+            )},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    try:
+        queryset, header = get_export_queryset(export_type, params)
+    except ExportError as exc:
+        return Response(
+            {'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST
+        )
+
+    filename = f'{export_type}.{export_format}'
+    content_type = EXPORT_FORMATS[export_format]
+    if compress:
+        filename += '.gz'
+        content_type = 'application/gzip'
+    # ASGI servers get an async body, read without holding a thread
+    stream = astream_export if is_asgi(request) else stream_export
+    response = StreamingHttpResponse(
+        stream(queryset, header, export_format, compress=compress),
+        content_type=content_type
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
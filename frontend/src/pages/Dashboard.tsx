@@ -1,26 +1,33 @@
 import React, { useEffect, useState } from 'react';
 import { Box, Typography, Grid, Paper, CircularProgress } from '@mui/material';
-import { equipmentApi } from '../services/api';
+import { dashboardApi, DashboardStats } from '../services/api';
 
 const Dashboard: React.FC = () => {
-  const [totalEquipment, setTotalEquipment] = useState<number>(0);
+  const [stats, setStats] = useState<DashboardStats | null>(null);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
-    const fetchEquipmentCount = async () => {
+    const fetchStats = async () => {
       try {
-        const response = await equipmentApi.getAll();
-        setTotalEquipment(response.data.count);
+        const response = await dashboardApi.get();
+        setStats(response.data);
       } catch (error) {
-        console.error('Failed to fetch equipment count:', error);
+        console.error('Failed to fetch dashboard stats:', error);
       } finally {
         setLoading(false);
       }
     };
 
-    fetchEquipmentCount();
+    fetchStats();
   }, []);
 
+  const renderValue = (value: number | undefined) =>
+    loading ? (
+      <CircularProgress size={24} />
+    ) : (
+      <Typography variant="h4">{value ?? 0}</Typography>
+    );
+
   return (
     <Box>
       <Typography variant="h4" gutterBottom>
@@ -30,29 +37,25 @@ const Dashboard: React.FC = () => {
         <Grid item xs={12} md={6} lg={3}>
           <Paper sx={{ p: 2 }}>
             <Typography variant="h6">Total Equipment</Typography>
-            {loading ? (
-              <CircularProgress size={24} />
-            ) : (
-              <Typography variant="h4">{totalEquipment}</Typography>
-            )}
+            {renderValue(stats?.total_equipment)}
           </Paper>
         </Grid>
         <Grid item xs={12} md={6} lg={3}>
           <Paper sx={{ p: 2 }}>
             <Typography variant="h6">Pending Calibrations</Typography>
-            <Typography variant="h4">0</Typography>
+            {renderValue(stats?.calibration.due_in_7_days)}
           </Paper>
         </Grid>
         <Grid item xs={12} md={6} lg={3}>
           <Paper sx={{ p: 2 }}>
             <Typography variant="h6">Pending Maintenance</Typography>
-            <Typography variant="h4">0</Typography>
+            {renderValue(stats?.by_status.maintenance)}
           </Paper>
         </Grid>
         <Grid item xs={12} md={6} lg={3}>
           <Paper sx={{ p: 2 }}>
             <Typography variant="h6">Overdue Items</Typography>
-            <Typography variant="h4">0</Typography>
+            {renderValue(stats?.calibration.overdue)}
           </Paper>
         </Grid>
       </Grid>
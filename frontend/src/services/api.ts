@@ -50,6 +50,14 @@ export interface Equipment {
   created_at: string;
   updated_at: string;
   created_by: number | null;
+  latest_calibration: number | null;
+  latest_calibration_date: string | null;
+  latest_certificate_number: string;
+  calibration_count: number;
+  latest_maintenance_date: string | null;
+  maintenance_count: number;
+  maintenance_cost_total: string;
+  maintenance_cost_year_to_date: string;
 }
 
 export interface Calibration {
@@ -79,12 +87,53 @@ export interface PaginatedResponse<T> {
   results: T[];
 }
 
+// Keyset window over one equipment's history. Pass `latest` back as
+// `since` to fetch only records added afterwards.
+export interface HistoryWindow<T> {
+  next: string | null;
+  latest: string | null;
+  results: T[];
+}
+
+export interface HistoryParams {
+  page_size?: number;
+  cursor?: string;
+  since?: string;
+}
+
+export interface DashboardStats {
+  generated_at: string;
+  total_equipment: number;
+  by_status: Record<string, number>;
+  by_category: Record<string, number>;
+  by_location: Record<string, number>;
+  calibration: {
+    overdue: number;
+    due_in_7_days: number;
+    due_in_30_days: number;
+    due_in_90_days: number;
+  };
+  maintenance_costs: {
+    total: string;
+    year_to_date: string;
+    by_type: Record<string, string>;
+  };
+}
+
+export const dashboardApi = {
+  get: () => api.get<DashboardStats>('/dashboard/'),
+};
+
 export const equipmentApi = {
   getAll: () => api.get<PaginatedResponse<Equipment>>('/equipment/'),
   getById: (id: number) => api.get<Equipment>(`/equipment/${id}/`),
   create: (data: Partial<Equipment>) => api.post<Equipment>('/equipment/', data),
   update: (id: number, data: Partial<Equipment>) => api.put<Equipment>(`/equipment/${id}/`, data),
   delete: (id: number) => api.delete(`/equipment/${id}/`),
+  getCalibrations: (id: number, params?: HistoryParams) =>
+    api.get<HistoryWindow<Calibration>>(`/equipment/${id}/calibrations/`, { params }),
+  getMaintenance: (id: number, params?: HistoryParams) =>
+    api.get<HistoryWindow<Maintenance>>(`/equipment/${id}/maintenance/`, { params }),
 };
 
 export const calibrationApi = {